@@ -6,14 +6,41 @@ from homeassistant.const import Platform
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+from .const import DOMAIN
+from .registry import get_registry
+from .eas_audio import prime_tones
+from .file_manager import async_get_file_manager, DATA_FILE_MANAGER
+from .alerts_fetcher import DATA_ALERTS_FETCHER
+from .poll_scheduler import DATA_POLL_SCHEDULER
+from .ingest import async_unload_ingest_sources
+
 PLATFORMS: list[str] = [Platform.SENSOR, Platform.TTS]
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up entities."""
+    # Build the shared SAME/FIPS lookup tables once before the platforms need them
+    await get_registry()
+    # Precompute the constant attention tone and End of Message segments
+    await hass.async_add_executor_job(prime_tones)
+    # Start tracking generated audio files and clear out any left from earlier runs
+    await async_get_file_manager(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded:
+        coordinator = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if coordinator:
+            coordinator.async_stop()
+        await async_unload_ingest_sources(hass, entry.entry_id)
+        # Stop the shared file purge once the last entry is gone
+        if not hass.data.get(DOMAIN) and DATA_FILE_MANAGER in hass.data:
+            hass.data.pop(DATA_FILE_MANAGER).async_stop()
+        if not hass.data.get(DOMAIN):
+            if DATA_POLL_SCHEDULER in hass.data:
+                hass.data.pop(DATA_POLL_SCHEDULER).async_stop()
+            hass.data.pop(DATA_ALERTS_FETCHER, None)
+    return unloaded
@@ -0,0 +1,161 @@
+"""Compact, immutable record for a single weather alert."""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from .timeparse import parse_datetime
+
+# Placeholder the state attributes have always used for missing values
+MISSING = "null"
+
+# Fields with a small, fixed vocabulary; interning lets every record share one string
+_ENUM_FIELDS = ("severity", "urgency", "certainty", "status", "messageType")
+_DATETIME_FIELDS = ("sent", "effective", "onset", "expires", "ends", "endsExpires")
+_PARAMETER_FIELDS = ("NWSheadline", "hailSize", "windGust", "waterspoutDetection")
+_LIST_FIELDS = _PARAMETER_FIELDS + ("sameCodes",)
+
+
+def _intern(value):
+    """Intern enum-like strings, mapping missing values to None."""
+    if value is None or value == MISSING:
+        return None
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _optional(value):
+    """Map the legacy "null" placeholder to None."""
+    return None if value == MISSING else value
+
+
+def _parameter(value):
+    """Freeze a CAP parameter list into a tuple."""
+    value = _optional(value)
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _headline_title(headline: Optional[str]) -> Optional[str]:
+    """Strip the issuing office from an NWS headline."""
+    return headline.split(" by ")[0] if headline else None
+
+
+@dataclass(frozen=True, slots=True)
+class Alert:
+    """One active alert as read from the weather.gov feed.
+
+    Missing values are None, timestamps are parsed datetimes and the
+    enum-like fields are interned. ``get`` keeps dict-style reads working
+    for code that also handles plain alert dicts, and ``as_dict`` produces
+    the legacy attribute layout for Home Assistant state.
+    """
+    id: Optional[str]
+    event: Optional[str]
+    area: Optional[str]
+    title: Optional[str]
+    spoken_title: Optional[str]
+    description: Optional[str]
+    instruction: Optional[str]
+    response: Optional[str]
+    category: Optional[str]
+    sender: Optional[str]
+    senderName: Optional[str]
+    zoneid: Optional[str]
+    severity: Optional[str]
+    urgency: Optional[str]
+    certainty: Optional[str]
+    status: Optional[str]
+    messageType: Optional[str]
+    sent: Optional[datetime]
+    effective: Optional[datetime]
+    onset: Optional[datetime]
+    expires: Optional[datetime]
+    ends: Optional[datetime]
+    endsExpires: Optional[datetime]
+    NWSheadline: Optional[Tuple[str, ...]]
+    hailSize: Optional[Tuple[str, ...]]
+    windGust: Optional[Tuple[str, ...]]
+    waterspoutDetection: Optional[Tuple[str, ...]]
+    sameCodes: Optional[Tuple[str, ...]]
+
+    @classmethod
+    def from_properties(cls, properties: Dict[str, Any], zoneid: str) -> Alert:
+        """Build a record from the ``properties`` of a weather.gov GeoJSON feature."""
+        parameters = properties.get("parameters") or {}
+        geocode = properties.get("geocode") or {}
+        ends = parse_datetime(properties.get("ends"))
+        expires = parse_datetime(properties.get("expires"))
+        title = _headline_title(properties.get("headline"))
+        return cls(
+            id=properties.get("id"),
+            event=properties.get("event"),
+            area=properties.get("areaDesc"),
+            title=title,
+            spoken_title=title,
+            description=properties.get("description"),
+            instruction=properties.get("instruction"),
+            response=_intern(properties.get("response")),
+            category=_intern(properties.get("category")),
+            sender=properties.get("sender"),
+            senderName=properties.get("senderName"),
+            zoneid=zoneid,
+            severity=_intern(properties.get("severity")),
+            urgency=_intern(properties.get("urgency")),
+            certainty=_intern(properties.get("certainty")),
+            status=_intern(properties.get("status")),
+            messageType=_intern(properties.get("messageType")),
+            sent=parse_datetime(properties.get("sent")),
+            effective=parse_datetime(properties.get("effective")),
+            onset=parse_datetime(properties.get("onset")),
+            expires=expires,
+            ends=ends,
+            endsExpires=ends or expires,
+            sameCodes=_parameter(geocode.get("SAME")),
+            **{name: _parameter(parameters.get(name)) for name in _PARAMETER_FIELDS},
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Alert:
+        """Build a record from the legacy attribute layout produced by ``as_dict``."""
+        values = {}
+        for name in _FIELD_NAMES:
+            value = data.get(name)
+            if name in _DATETIME_FIELDS:
+                values[name] = parse_datetime(value)
+            elif name in _ENUM_FIELDS:
+                values[name] = _intern(value)
+            elif name in _LIST_FIELDS:
+                values[name] = _parameter(value)
+            else:
+                values[name] = _optional(value)
+        if values["endsExpires"] is None:
+            values["endsExpires"] = values["ends"] or values["expires"]
+        return cls(**values)
+
+    def get(self, key: str, default=None):
+        """Dict-style read; missing or unknown fields return the default."""
+        if key not in _FIELD_SET:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the legacy attribute dict with "null" placeholders and ISO timestamps."""
+        data = {}
+        for name in _FIELD_NAMES:
+            value = getattr(self, name)
+            if name == "spoken_title" and value is None:
+                continue
+            if value is None:
+                value = MISSING
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, tuple):
+                value = list(value)
+            data[name] = value
+        return data
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(Alert))
+_FIELD_SET = frozenset(_FIELD_NAMES)
@@ -0,0 +1,100 @@
+"""Diff successive alert lists into added, updated and removed alerts."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .alert import Alert
+from .const import ALERT_REMOVAL_GRACE
+
+
+def alert_key(alert: Optional[Alert]) -> Optional[tuple]:
+    """Identity of one revision of an alert: its id and sent time."""
+    if alert is None:
+        return None
+    return alert.get("id"), alert.get("sent")
+
+
+@dataclass(frozen=True)
+class AlertChanges:
+    """What changed between two polls."""
+    added: Tuple[Alert, ...] = ()
+    updated: Tuple[Alert, ...] = ()
+    removed: Tuple[Alert, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class AlertDiffer:
+    """Remember the last alert list and report only what changed.
+
+    Alerts are matched by id. A matching id with a different sent time is
+    an update; alerts without an id cannot be tracked and are ignored.
+    """
+
+    def __init__(self):
+        self._known: Dict[str, Alert] = {}
+
+    def diff(self, alerts: Iterable[Alert]) -> AlertChanges:
+        """Compare a new alert list against the previous one and remember it."""
+        known = self._known
+        current: Dict[str, Alert] = {}
+        added = []
+        updated = []
+
+        for alert in alerts:
+            alert_id = alert.get("id")
+            if not alert_id or alert_id in current:
+                continue
+            current[alert_id] = alert
+            previous = known.get(alert_id)
+            if previous is None:
+                added.append(alert)
+            elif previous.get("sent") != alert.get("sent"):
+                updated.append(alert)
+
+        removed = tuple(alert for alert_id, alert in known.items() if alert_id not in current)
+        self._known = current
+        return AlertChanges(tuple(added), tuple(updated), removed)
+
+
+class RemovalCircuitBreaker:
+    """Hold back alerts that vanish from the feed before they have expired.
+
+    A flapping upstream can briefly return an empty or partial alert list.
+    An alert that disappears is kept for ``grace`` seconds and is only
+    dropped if it is still missing after that, or once it has expired.
+    """
+
+    def __init__(self, grace: float = ALERT_REMOVAL_GRACE):
+        self.grace = grace
+        self._missing_since: Dict[str, float] = {}
+
+    def apply(self, alerts: List[Alert], previous: Iterable[Alert], now: datetime) -> Tuple[List[Alert], bool]:
+        """Return the alerts with any held-back ones added, and whether any were held."""
+        present = {alert.get("id") for alert in alerts}
+        for alert_id in list(self._missing_since):
+            if alert_id in present:
+                del self._missing_since[alert_id]
+
+        held = []
+        monotonic = time.monotonic()
+        for alert in previous:
+            alert_id = alert.get("id")
+            if not alert_id or alert_id in present:
+                continue
+            expires = alert.get("endsExpires")
+            missing_since = self._missing_since.setdefault(alert_id, monotonic)
+            expired = expires is not None and expires.tzinfo is not None and expires <= now
+            if expired or monotonic - missing_since >= self.grace:
+                del self._missing_since[alert_id]
+                continue
+            held.append(alert)
+
+        if not held:
+            return alerts, False
+        combined = sorted(list(alerts) + held, key=lambda alert: alert.get("id") or "", reverse=True)
+        return combined, True
@@ -0,0 +1,219 @@
+"""Shared weather.gov alerts fetcher for every configured zone."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import async_timeout
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DOMAIN, WEATHER_API_URL, WEATHER_API_TIMEOUT, ALERTS_FETCH_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ALERTS_FETCHER = f"{DOMAIN}_alerts_fetcher"
+
+HEADERS = {
+    "accept": "application/json",
+    "user-agent": f"HomeAssistant/{__version__}",
+}
+
+
+def feed_zone_ids(feedid: str) -> FrozenSet[str]:
+    """Split a "XXZnnn[,XXCnnn]" feed id into its UGC ids."""
+    return frozenset(part for part in feedid.split(",") if part)
+
+
+def _feature_zone_ids(properties: dict) -> List[str]:
+    """Return the UGC ids a feature applies to, from affectedZones or its UGC geocodes."""
+    zones = [url.rstrip("/").rsplit("/", 1)[-1] for url in properties.get("affectedZones") or ()]
+    zones.extend((properties.get("geocode") or {}).get("UGC") or ())
+    return zones
+
+
+class WeatherAlertsFetcher:
+    """Fetch alerts for all registered feeds in one request and fan them out by zone.
+
+    Each weather sensor registers its feed id. A poll requests every
+    registered zone at once with ``zone=A,B,C`` over the shared Home Assistant
+    session. The poll scheduler refreshes it on its own cadence, and
+    on-demand reads within ``ALERTS_FETCH_WINDOW`` reuse that response. The
+    feed is requested conditionally, and the generation counter only moves
+    when weather.gov returns new content.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.session = async_get_clientsession(hass)
+        self._feeds: Dict[object, str] = {}
+        self._lock = asyncio.Lock()
+        self._zones: Tuple[str, ...] = ()
+        self._fetched_at: Optional[float] = None
+        self.status: Optional[int] = None
+        self.error: Optional[Exception] = None
+        self.retry_after: Optional[int] = None
+        self._generation = 0
+        self._by_zone: Dict[str, List[dict]] = {}
+        self._polled: List[dict] = []
+        self._pushed: Dict[str, List[dict]] = {}
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+
+    def register(self, owner: object, feedid: str) -> None:
+        """Include a feed in every shared request."""
+        self._feeds[owner] = feedid
+
+    def unregister(self, owner: object) -> None:
+        """Stop requesting a feed."""
+        self._feeds.pop(owner, None)
+
+    @property
+    def owners(self) -> List[object]:
+        """Return everything that registered a feed."""
+        return list(self._feeds)
+
+    async def async_refresh(self) -> None:
+        """Request every registered zone now, regardless of the reuse window."""
+        async with self._lock:
+            await self._async_refresh(frozenset())
+
+    async def async_fetch(self, feedid: str) -> Tuple[Optional[int], int, List[dict]]:
+        """Return (HTTP status, generation, features) for one feed.
+
+        Raises the error of the shared request if it failed.
+        """
+        ids = feed_zone_ids(feedid)
+        async with self._lock:
+            fresh = self._fetched_at is not None and time.monotonic() - self._fetched_at < ALERTS_FETCH_WINDOW
+            if not fresh or not ids.issubset(self._zones):
+                await self._async_refresh(ids)
+            if self.error is not None:
+                raise self.error
+            return self.status, self._generation, self._features_for(ids)
+
+    async def _async_refresh(self, ids: FrozenSet[str]) -> None:
+        """Request every registered zone in one call."""
+        zones = set(ids)
+        for feedid in self._feeds.values():
+            zones.update(feed_zone_ids(feedid))
+        zones = tuple(sorted(zones))
+        if not zones:
+            return
+
+        headers = dict(HEADERS)
+        if zones == self._zones:
+            # Validators only apply to the same zone list
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        url = WEATHER_API_URL.format(",".join(zones))
+        _LOGGER.debug("Fetching weather alerts for %d zones from URL: %s", len(zones), url)
+        self._fetched_at = time.monotonic()
+        self.error = None
+        self.retry_after = None
+        try:
+            async with async_timeout.timeout(WEATHER_API_TIMEOUT):
+                response = await self.session.get(url, headers=headers)
+                self.status = response.status
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    self.retry_after = int(retry_after)
+                if response.status == 304:
+                    _LOGGER.debug("Weather alerts not modified")
+                    self.status = 200
+                    return
+                if response.status != 200:
+                    return
+                data = await response.json()
+        except Exception as e:
+            self.error = e
+            return
+
+        self._polled = [feature for feature in data.get("features") or () if feature.get("properties") is not None]
+        self._index()
+        self._zones = zones
+        self._generation += 1
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        _LOGGER.debug("Fetched %d weather alerts for %d zones", len(self._polled), len(zones))
+
+    def current(self, feedid: str) -> Tuple[int, int, List[dict]]:
+        """Return (200, generation, features) for one feed from what is already known, without a request."""
+        return 200, self._generation, self._features_for(feed_zone_ids(feedid))
+
+    async def async_push(self, source: str, features: List[dict]) -> None:
+        """Replace the alerts delivered by a push source and update every sensor right away."""
+        async with self._lock:
+            self._pushed[source] = [feature for feature in features if feature.get("properties") is not None]
+            self._index()
+            self._generation += 1
+        _LOGGER.debug("Received %d pushed alerts from %s", len(features), source)
+        await self.async_update_owners(refresh=False)
+
+    async def async_update_owners(self, refresh: bool = True) -> None:
+        """Update every registered weather sensor concurrently.
+
+        Each update runs the entry's alert callback, so a slow entry must not
+        hold up alert detection for the others.
+        """
+        await asyncio.gather(*(self._async_update_owner(sensor, refresh) for sensor in self.owners))
+
+    @staticmethod
+    async def _async_update_owner(sensor, refresh: bool) -> None:
+        try:
+            await sensor.async_update(refresh=refresh)
+            if sensor.entity_id:
+                sensor.async_write_ha_state()
+        except Exception as e:
+            _LOGGER.error("[%s] Error updating weather alerts: %s", sensor.feedid, e)
+
+    def remove_source(self, source: str) -> None:
+        """Forget the alerts of a push source that was stopped."""
+        if self._pushed.pop(source, None):
+            self._index()
+            self._generation += 1
+
+    def _index(self) -> None:
+        """Index polled and pushed features by zone; polled copies win for the same alert id."""
+        features = list(self._polled)
+        seen = {feature["properties"].get("id") for feature in features}
+        for pushed in self._pushed.values():
+            for feature in pushed:
+                alert_id = feature["properties"].get("id")
+                if alert_id not in seen:
+                    seen.add(alert_id)
+                    features.append(feature)
+
+        by_zone: Dict[str, List[dict]] = {}
+        for feature in features:
+            for zone in set(_feature_zone_ids(feature["properties"])):
+                by_zone.setdefault(zone, []).append(feature)
+        self._by_zone = by_zone
+
+    def _features_for(self, ids: FrozenSet[str]) -> List[dict]:
+        """Return the features affecting any of the ids, without duplicates."""
+        if len(ids) == 1:
+            return list(self._by_zone.get(next(iter(ids)), ()))
+        seen = set()
+        features = []
+        for zone in sorted(ids):
+            for feature in self._by_zone.get(zone, ()):
+                if id(feature) not in seen:
+                    seen.add(id(feature))
+                    features.append(feature)
+        return features
+
+
+def get_alerts_fetcher(hass: HomeAssistant) -> WeatherAlertsFetcher:
+    """Return the fetcher shared by all entries."""
+    fetcher = hass.data.get(DATA_ALERTS_FETCHER)
+    if fetcher is None:
+        fetcher = WeatherAlertsFetcher(hass)
+        hass.data[DATA_ALERTS_FETCHER] = fetcher
+    return fetcher
@@ -0,0 +1,141 @@
+"""Linear-time assembly of EAS audio segments."""
+from __future__ import annotations
+
+import io
+import wave
+from typing import BinaryIO, Iterable, List, Optional
+
+import pydub
+
+from .const import OUTPUT_FORMATS, LOSSLESS_FORMATS
+
+
+class AudioAssembler:
+    """Collect audio segments and join them with one copy instead of repeated concatenation.
+
+    Every segment is normalized once to a common sample format. As with
+    pydub's ``+`` operator, that format is the highest frame rate, channel
+    count and sample width among the segments. The joined audio is written
+    either into one preallocated buffer or straight into a WAV stream.
+    """
+
+    def __init__(self, segments: Optional[Iterable[pydub.AudioSegment]] = None):
+        self._segments: List[pydub.AudioSegment] = []
+        self._normalized = True
+        if segments:
+            for segment in segments:
+                self.add(segment)
+
+    def add(self, segment: pydub.AudioSegment) -> AudioAssembler:
+        """Append a segment; conversion is deferred until the output is built."""
+        self._segments.append(segment)
+        self._normalized = False
+        return self
+
+    def extend(self, segments: Iterable[pydub.AudioSegment]) -> AudioAssembler:
+        """Append several segments in playback order."""
+        for segment in segments:
+            self.add(segment)
+        return self
+
+    def __len__(self) -> int:
+        """Return the assembled length in milliseconds, like AudioSegment."""
+        return round(self.duration * 1000)
+
+    @property
+    def frame_rate(self) -> int:
+        return max((segment.frame_rate for segment in self._segments), default=1)
+
+    @property
+    def channels(self) -> int:
+        return max((segment.channels for segment in self._segments), default=1)
+
+    @property
+    def sample_width(self) -> int:
+        return max((segment.sample_width for segment in self._segments), default=2)
+
+    @property
+    def frame_count(self) -> int:
+        return sum(len(segment.raw_data) for segment in self._normalized_segments()) // self._frame_width()
+
+    @property
+    def duration(self) -> float:
+        """Return the assembled length in seconds."""
+        if not self._segments:
+            return 0.0
+        return self.frame_count / self.frame_rate
+
+    def to_segment(self) -> pydub.AudioSegment:
+        """Return the joined audio as one AudioSegment backed by a single buffer."""
+        segments = self._normalized_segments()
+        buffer = bytearray(sum(len(segment.raw_data) for segment in segments))
+        view = memoryview(buffer)
+        offset = 0
+        for segment in segments:
+            data = segment.raw_data
+            view[offset:offset + len(data)] = data
+            offset += len(data)
+
+        return pydub.AudioSegment(
+            data=bytes(buffer),
+            sample_width=self.sample_width,
+            frame_rate=self.frame_rate,
+            channels=self.channels,
+        )
+
+    def write_wav(self, stream: BinaryIO) -> None:
+        """Stream the joined audio into a WAV file without building an intermediate buffer."""
+        segments = self._normalized_segments()
+        with wave.open(stream, "wb") as wav:
+            wav.setnchannels(self.channels)
+            wav.setsampwidth(self.sample_width)
+            wav.setframerate(self.frame_rate)
+            wav.setnframes(self.frame_count)
+            for segment in segments:
+                wav.writeframesraw(segment.raw_data)
+
+    def to_wav_bytes(self) -> bytes:
+        """Return the joined audio encoded as a WAV file."""
+        stream = io.BytesIO()
+        self.write_wav(stream)
+        return stream.getvalue()
+
+    def encode(self, output_format: str = "wav", bitrate: Optional[str] = None) -> bytes:
+        """Return the joined audio encoded in one of the supported output formats.
+
+        WAV is written directly; compressed formats go through ffmpeg. The
+        bitrate is ignored for lossless formats.
+        """
+        if output_format == "wav":
+            return self.to_wav_bytes()
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format '{output_format}'")
+
+        _, codec = OUTPUT_FORMATS[output_format]
+        stream = io.BytesIO()
+        self.to_segment().export(
+            stream,
+            format=output_format,
+            codec=codec,
+            bitrate=None if output_format in LOSSLESS_FORMATS else bitrate,
+        )
+        return stream.getvalue()
+
+    def _frame_width(self) -> int:
+        return self.channels * self.sample_width
+
+    def _normalized_segments(self) -> List[pydub.AudioSegment]:
+        if not self._normalized:
+            frame_rate, channels, sample_width = self.frame_rate, self.channels, self.sample_width
+            normalized = []
+            for segment in self._segments:
+                if segment.frame_rate != frame_rate:
+                    segment = segment.set_frame_rate(frame_rate)
+                if segment.channels != channels:
+                    segment = segment.set_channels(channels)
+                if segment.sample_width != sample_width:
+                    segment = segment.set_sample_width(sample_width)
+                normalized.append(segment)
+            self._segments = normalized
+            self._normalized = True
+        return self._segments
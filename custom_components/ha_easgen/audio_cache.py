@@ -0,0 +1,133 @@
+"""Bounded caches for rendered EAS audio."""
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+import pydub
+
+from .const import HEADER_CACHE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shared instance so entries rendering the same header reuse each other's audio
+_HEADER_CACHE: Optional[HeaderAudioCache] = None
+
+# Cache key: header engine and full ZCZC header, since engines render the same header differently
+HeaderKey = Tuple[str, str]
+
+
+class HeaderAudioCache:
+    """LRU cache of rendered header audio keyed by header engine and full ZCZC header.
+
+    Entries carry the purge time of their alert and are dropped once it passes.
+    """
+
+    def __init__(self, max_bytes: int = HEADER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[HeaderKey, Tuple[pydub.AudioSegment, Optional[datetime]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, engine: str, full_header: str) -> Optional[pydub.AudioSegment]:
+        """Return cached header audio, or None on a miss or once the header has purged."""
+        key = (engine, full_header)
+        entry = self._entries.get(key)
+        if entry is not None:
+            audio, expires = entry
+            if expires is None or expires > datetime.now(timezone.utc):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return audio
+            self._remove(key)
+            self.evictions += 1
+        self.misses += 1
+        return None
+
+    def put(self, engine: str, full_header: str, audio: pydub.AudioSegment, expires: Optional[datetime] = None) -> None:
+        """Store header audio until ``expires``, evicting purged and least recently used entries to stay under the cap.
+
+        ``expires`` must be timezone aware; a naive time is treated as unknown.
+        """
+        audio_size = len(audio.raw_data)
+        if audio_size > self.max_bytes:
+            _LOGGER.debug("Header audio for %s exceeds the cache cap, not caching", full_header)
+            return
+
+        key = (engine, full_header)
+        if key in self._entries:
+            self._remove(key)
+
+        self.purge_expired()
+        self._trim(self.max_bytes - audio_size)
+
+        if expires is not None and expires.tzinfo is None:
+            expires = None
+        self._entries[key] = (audio, expires)
+        self.size += audio_size
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte cap, evicting least recently used entries if the cache is now over it."""
+        self.max_bytes = max_bytes
+        self._trim(max_bytes)
+
+    def _trim(self, max_bytes: int) -> None:
+        while self._entries and self.size > max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def purge_expired(self) -> int:
+        """Drop every entry whose header purge time has passed."""
+        now = datetime.now(timezone.utc)
+        expired = [
+            key for key, (_, expires) in self._entries.items()
+            if expires is not None and expires <= now
+        ]
+        for key in expired:
+            self._remove(key)
+        self.evictions += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Empty the cache without resetting the counters."""
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current usage."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: HeaderKey) -> None:
+        audio, _ = self._entries.pop(key)
+        self.size -= len(audio.raw_data)
+
+
+def get_header_cache(max_bytes: Optional[int] = None) -> HeaderAudioCache:
+    """Return the shared header audio cache, creating it on first use.
+
+    Passing ``max_bytes`` sets the cap of the shared cache; the last
+    configured entry wins.
+    """
+    global _HEADER_CACHE
+
+    if _HEADER_CACHE is None:
+        _HEADER_CACHE = HeaderAudioCache(max_bytes or HEADER_CACHE_MAX_BYTES)
+    elif max_bytes and max_bytes != _HEADER_CACHE.max_bytes:
+        _HEADER_CACHE.resize(max_bytes)
+
+    return _HEADER_CACHE
@@ -0,0 +1,146 @@
+"""Parse CAP (Common Alerting Protocol) XML into weather.gov style features."""
+from __future__ import annotations
+
+import logging
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Matches the alert element with or without a namespace prefix
+_ALERT_START = re.compile(r'<(?:[\w.-]+:)?alert[\s>]')
+_ALERT_END = re.compile(r'</(?:[\w.-]+:)?alert\s*>')
+
+PREFERRED_LANGUAGE = "en-US"
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _children(element: ET.Element, name: str) -> List[ET.Element]:
+    return [child for child in element if _local(child.tag) == name]
+
+
+def _text(element: ET.Element, name: str) -> Optional[str]:
+    for child in element:
+        if _local(child.tag) == name:
+            return (child.text or "").strip() or None
+    return None
+
+
+def _pairs(element: ET.Element, name: str) -> Dict[str, List[str]]:
+    """Collect valueName/value children (parameter, geocode) into lists by name."""
+    values: Dict[str, List[str]] = {}
+    for child in _children(element, name):
+        key = _text(child, "valueName")
+        value = _text(child, "value")
+        if key and value is not None:
+            values.setdefault(key, []).append(value)
+    return values
+
+
+def _polygon(text: str) -> Optional[List[List[float]]]:
+    """Convert a CAP "lat,lon lat,lon ..." polygon into a GeoJSON ring of [lon, lat]."""
+    ring = []
+    for point in text.split():
+        try:
+            lat, lon = point.split(",")
+            ring.append([float(lon), float(lat)])
+        except ValueError:
+            return None
+    return ring if len(ring) >= 4 else None
+
+
+def split_cap_documents(buffer: str) -> Tuple[List[str], str]:
+    """Split complete CAP alert documents off the front of a stream buffer.
+
+    Returns the complete documents and the unconsumed remainder.
+    """
+    documents = []
+    while True:
+        end = _ALERT_END.search(buffer)
+        if end is None:
+            return documents, buffer
+        start = _ALERT_START.search(buffer, 0, end.start())
+        if start is not None:
+            documents.append(buffer[start.start():end.end()])
+        buffer = buffer[end.end():]
+
+
+def cap_alert_to_feature(alert: ET.Element) -> Optional[dict]:
+    """Map one CAP alert element onto the GeoJSON feature layout of api.weather.gov."""
+    infos = _children(alert, "info")
+    if not infos:
+        return None
+    info = next((i for i in infos if _text(i, "language") == PREFERRED_LANGUAGE), infos[0])
+
+    area_descs = []
+    geocode: Dict[str, List[str]] = {}
+    polygons = []
+    for area in _children(info, "area"):
+        area_desc = _text(area, "areaDesc")
+        if area_desc:
+            area_descs.append(area_desc)
+        for key, values in _pairs(area, "geocode").items():
+            geocode.setdefault(key, []).extend(values)
+        for polygon in _children(area, "polygon"):
+            ring = _polygon(polygon.text or "")
+            if ring:
+                polygons.append([ring])
+
+    geometry = None
+    if len(polygons) == 1:
+        geometry = {"type": "Polygon", "coordinates": polygons[0]}
+    elif polygons:
+        geometry = {"type": "MultiPolygon", "coordinates": polygons}
+
+    references = _text(alert, "references") or ""
+    properties = {
+        "id": _text(alert, "identifier"),
+        "sender": _text(alert, "sender"),
+        "sent": _text(alert, "sent"),
+        "status": _text(alert, "status"),
+        "messageType": _text(alert, "msgType"),
+        "references": [ref.split(",")[1] for ref in references.split() if ref.count(",") == 2],
+        "category": _text(info, "category"),
+        "event": _text(info, "event"),
+        "response": _text(info, "responseType"),
+        "urgency": _text(info, "urgency"),
+        "severity": _text(info, "severity"),
+        "certainty": _text(info, "certainty"),
+        "effective": _text(info, "effective"),
+        "onset": _text(info, "onset"),
+        "expires": _text(info, "expires"),
+        "ends": None,
+        "senderName": _text(info, "senderName"),
+        "headline": _text(info, "headline"),
+        "description": _text(info, "description"),
+        "instruction": _text(info, "instruction"),
+        "areaDesc": "; ".join(area_descs) or None,
+        "geocode": geocode,
+        "affectedZones": [],
+        "parameters": _pairs(info, "parameter"),
+    }
+    if not properties["id"]:
+        return None
+    return {"type": "Feature", "geometry": geometry, "properties": properties}
+
+
+def parse_cap(text: str) -> List[dict]:
+    """Parse a CAP document (or any XML wrapping CAP alerts) into features."""
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError as e:
+        _LOGGER.warning("Could not parse CAP document: %s", e)
+        return []
+
+    features = []
+    for element in root.iter():
+        if _local(element.tag) == "alert":
+            feature = cap_alert_to_feature(element)
+            if feature is not None:
+                features.append(feature)
+    return features
@@ -12,7 +12,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_registry import async_get
 
-from .const import DEFAULT_NAME, DOMAIN, CALL_SIGN, UNIQUE_ID, ORG, ORGS, STATE, ZONE, COUNTY, TTS_ENGINE, VOICE, LANGUAGE, AVAIL_LANGUAGES, MEDIA_PLAYERS, DISABLE_TTS, INCLUDE_DESCRIPTION, TTS_WARNINGS, TTS_WATCHES, TTS_STATEMENTS
+from .const import DEFAULT_NAME, DOMAIN, CALL_SIGN, UNIQUE_ID, ORG, ORGS, STATE, ZONE, COUNTY, TTS_ENGINE, VOICE, LANGUAGE, AVAIL_LANGUAGES, MEDIA_PLAYERS, DISABLE_TTS, INCLUDE_DESCRIPTION, TTS_WARNINGS, TTS_WATCHES, TTS_STATEMENTS, RENDER_CONCURRENCY, DEFAULT_RENDER_CONCURRENCY, OUTPUT_FORMAT, OUTPUT_FORMATS, DEFAULT_OUTPUT_FORMAT, OUTPUT_BITRATE, OUTPUT_BITRATES, DEFAULT_OUTPUT_BITRATE, HEADER_ENGINE, HEADER_ENGINES, DEFAULT_HEADER_ENGINE, HEADER_CACHE_SIZE, DEFAULT_HEADER_CACHE_SIZE, INGEST_DIRECTORY, INGEST_STREAM_URL, HOME_FILTER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -118,7 +118,48 @@ class EASGenConfigFlow(ConfigFlow, domain=DOMAIN):
                 vol.Optional(INCLUDE_DESCRIPTION, default=False): bool,
                 vol.Optional(TTS_WARNINGS, default=True): bool,
                 vol.Optional(TTS_WATCHES, default=True): bool,
-                vol.Optional(TTS_STATEMENTS, default=False): bool
+                vol.Optional(TTS_STATEMENTS, default=False): bool,
+                vol.Optional(RENDER_CONCURRENCY, default=DEFAULT_RENDER_CONCURRENCY): selector({
+                    "number": {
+                        "min": 1,
+                        "max": 10,
+                        "step": 1,
+                        "mode": "box"
+                    }
+                }),
+                vol.Optional(OUTPUT_FORMAT, default=DEFAULT_OUTPUT_FORMAT): selector({
+                    "select": {
+                        "options": list(OUTPUT_FORMATS),
+                        "mode": "dropdown",
+                        "custom_value": False
+                    }
+                }),
+                vol.Optional(OUTPUT_BITRATE, default=DEFAULT_OUTPUT_BITRATE): selector({
+                    "select": {
+                        "options": OUTPUT_BITRATES,
+                        "mode": "dropdown",
+                        "custom_value": False
+                    }
+                }),
+                vol.Optional(HEADER_ENGINE, default=DEFAULT_HEADER_ENGINE): selector({
+                    "select": {
+                        "options": HEADER_ENGINES,
+                        "mode": "dropdown",
+                        "custom_value": False
+                    }
+                }),
+                vol.Optional(HEADER_CACHE_SIZE, default=DEFAULT_HEADER_CACHE_SIZE): selector({
+                    "number": {
+                        "min": 1,
+                        "max": 256,
+                        "step": 1,
+                        "unit_of_measurement": "MiB",
+                        "mode": "box"
+                    }
+                }),
+                vol.Optional(INGEST_DIRECTORY, default=""): str,
+                vol.Optional(INGEST_STREAM_URL, default=""): str,
+                vol.Optional(HOME_FILTER, default=False): bool
             })
             return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
         
@@ -195,6 +236,47 @@ class EASGenConfigFlow(ConfigFlow, domain=DOMAIN):
                 vol.Optional(INCLUDE_DESCRIPTION, default=user_input.get(INCLUDE_DESCRIPTION, False)): bool,
                 vol.Optional(TTS_WARNINGS, default=user_input.get(TTS_WARNINGS, True)): bool,
                 vol.Optional(TTS_WATCHES, default=user_input.get(TTS_WATCHES, True)): bool,
-                vol.Optional(TTS_STATEMENTS, default=user_input.get(TTS_STATEMENTS, False)): bool
+                vol.Optional(TTS_STATEMENTS, default=user_input.get(TTS_STATEMENTS, False)): bool,
+                vol.Optional(RENDER_CONCURRENCY, default=user_input.get(RENDER_CONCURRENCY, DEFAULT_RENDER_CONCURRENCY)): selector({
+                    "number": {
+                        "min": 1,
+                        "max": 10,
+                        "step": 1,
+                        "mode": "box"
+                    }
+                }),
+                vol.Optional(OUTPUT_FORMAT, default=user_input.get(OUTPUT_FORMAT, DEFAULT_OUTPUT_FORMAT)): selector({
+                    "select": {
+                        "options": list(OUTPUT_FORMATS),
+                        "mode": "dropdown",
+                        "custom_value": False
+                    }
+                }),
+                vol.Optional(OUTPUT_BITRATE, default=user_input.get(OUTPUT_BITRATE, DEFAULT_OUTPUT_BITRATE)): selector({
+                    "select": {
+                        "options": OUTPUT_BITRATES,
+                        "mode": "dropdown",
+                        "custom_value": False
+                    }
+                }),
+                vol.Optional(HEADER_ENGINE, default=user_input.get(HEADER_ENGINE, DEFAULT_HEADER_ENGINE)): selector({
+                    "select": {
+                        "options": HEADER_ENGINES,
+                        "mode": "dropdown",
+                        "custom_value": False
+                    }
+                }),
+                vol.Optional(HEADER_CACHE_SIZE, default=user_input.get(HEADER_CACHE_SIZE, DEFAULT_HEADER_CACHE_SIZE)): selector({
+                    "number": {
+                        "min": 1,
+                        "max": 256,
+                        "step": 1,
+                        "unit_of_measurement": "MiB",
+                        "mode": "box"
+                    }
+                }),
+                vol.Optional(INGEST_DIRECTORY, default=user_input.get(INGEST_DIRECTORY, "")): str,
+                vol.Optional(INGEST_STREAM_URL, default=user_input.get(INGEST_STREAM_URL, "")): str,
+                vol.Optional(HOME_FILTER, default=user_input.get(HOME_FILTER, False)): bool
             })
             return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
@@ -23,6 +23,29 @@ INCLUDE_DESCRIPTION = "include_description"
 TTS_WARNINGS = "tts_warnings"
 TTS_WATCHES = "tts_watches"
 TTS_STATEMENTS = "tts_statements"
+RENDER_CONCURRENCY = "render_concurrency"
+DEFAULT_RENDER_CONCURRENCY = 3
+OUTPUT_FORMAT = "output_format"
+OUTPUT_BITRATE = "output_bitrate"
+
+# Output Audio Formats (file extension, ffmpeg codec; WAV is written without ffmpeg)
+OUTPUT_FORMATS = {
+    "wav": ("wav", None),
+    "mp3": ("mp3", "libmp3lame"),
+    "opus": ("opus", "libopus"),
+    "flac": ("flac", "flac"),
+}
+LOSSLESS_FORMATS = ["wav", "flac"]
+OUTPUT_BITRATES = ["32k", "48k", "64k", "96k", "128k", "192k"]
+DEFAULT_OUTPUT_FORMAT = "wav"
+DEFAULT_OUTPUT_BITRATE = "64k"
+HEADER_ENGINE = "header_engine"
+
+# SAME Header Encoders
+HEADER_ENGINE_EASGEN = "easgen"
+HEADER_ENGINE_NUMPY = "numpy"
+HEADER_ENGINES = [HEADER_ENGINE_EASGEN, HEADER_ENGINE_NUMPY]
+DEFAULT_HEADER_ENGINE = HEADER_ENGINE_EASGEN
 
 # EAS Organizations
 ORGS = [
@@ -36,6 +59,32 @@ ORGS = [
 WEATHER_API_URL = "https://api.weather.gov/alerts/active?zone={}"
 WEATHER_ID_CHECK_URL = "https://alerts.weather.gov/cap/wwaatmget.php?x={}&y=0"
 ID_CHECK_ERRORS = ["? invalid county", "? invalid zone"]
+WEATHER_API_TIMEOUT = 10  # seconds
+WEATHER_ID_CHECK_TIMEOUT = 20  # seconds
+ZONE_CACHE_TTL = 7  # days before a cached zone/county validation is rechecked
+ZONE_CACHE_SAVE_DELAY = 10  # seconds
+# On-demand reads within this window reuse the last shared fetch
+ALERTS_FETCH_WINDOW = 10  # seconds, below the fastest poll interval
+
+# Push Ingestion (CAP XML from a watched directory or a local HTTP stream)
+INGEST_DIRECTORY = "ingest_directory"
+INGEST_STREAM_URL = "ingest_stream_url"
+CAP_DIRECTORY_SCAN_INTERVAL = 2  # seconds
+CAP_EXPIRY_CHECK_INTERVAL = 60  # seconds
+CAP_STREAM_READ_TIMEOUT = 300  # seconds without data before reconnecting
+CAP_STREAM_MAX_BACKOFF = 300  # seconds
+CAP_STREAM_MAX_BUFFER = 1024 * 1024  # characters without a complete alert before reconnecting
+
+# Drop polygon alerts that miss the Home Assistant home location
+HOME_FILTER = "home_filter"
+
+# Alert Polling Schedule (seconds)
+POLL_INTERVAL_URGENT = 15  # Severe/Extreme or Immediate alerts active
+POLL_INTERVAL_ACTIVE = 30  # other alerts active
+POLL_INTERVAL_IDLE = 120  # no active alerts
+POLL_BACKOFF_MAX = 600  # ceiling for exponential backoff on 429/5xx and network errors
+POLL_JITTER = 0.1  # +/- fraction applied to every interval
+POLL_START_DELAY = 5  # maximum random delay before an initial or requested poll
 
 # TTS Language Support
 AVAIL_LANGUAGES = [
@@ -51,9 +100,36 @@ MAX_PURGE_DIFFERENCE = 5940
 HOUR_IN_MINUTES = 60
 MINUTE_IN_SECONDS = 60
 
+# EAS Audio Format (raw PCM produced by the tone generator)
+EAS_SAMPLE_RATE = 24000
+EAS_SAMPLE_WIDTH = 2
+EAS_CHANNELS = 1
+HEADER_LEAD_SILENCE = 500  # milliseconds around the header bursts, as EASGen pads them
+
+# Rendered Audio Caches
+HEADER_CACHE_SIZE = "header_cache_size"
+DEFAULT_HEADER_CACHE_SIZE = 32  # MiB, shared by every entry
+HEADER_CACHE_MAX_BYTES = DEFAULT_HEADER_CACHE_SIZE * 1024 * 1024
+RENDER_CACHE_SIZE = 32
+
+# TTS Phrase Cache (stored under <config>/.storage)
+TTS_CACHE_DIR = "ha_easgen_tts_cache"
+TTS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+TTS_CACHE_SAVE_DELAY = 10  # seconds
+
+# Generated Audio Files (served from <config>/www)
+AUDIO_FILES_MAX_BYTES = 256 * 1024 * 1024
+AUDIO_FILES_DEFAULT_RETENTION = 6  # hours, when the header carries no usable purge time
+AUDIO_FILES_PURGE_INTERVAL = 15  # minutes
+AUDIO_FILES_SAVE_DELAY = 10  # seconds
+
 # Alert Management Constants
 MAX_ALERTS = 5
+ALERT_SNAPSHOT_SAVE_DELAY = 10  # seconds
+# An unexpired alert must stay missing from the feed this long before it is dropped
+ALERT_REMOVAL_GRACE = 180  # seconds
 SEVERITY_LEVELS = ["Minor", "Moderate", "Severe", "Extreme"]
+URGENCY_LEVELS = ["Immediate", "Expected", "Future", "Past", "Unknown"]
 ALERT_TRACK_FILE = "alert_tracking.json"
 
 # Alert Entity Names
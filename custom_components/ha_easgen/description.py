@@ -0,0 +1,104 @@
+"""Split NWS alert descriptions into their bulleted sections."""
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+DESCRIPTION_CACHE_SIZE = 512
+
+# "* WHAT...", "* WHERE...", "* ADDITIONAL DETAILS..." anywhere in the text
+_SECTION_PATTERN = re.compile(r'\* ([A-Z][A-Z ]*?)\.\.\.', re.IGNORECASE)
+# Any "* " bullet that opens a line, whether or not it names a section
+_BOUNDARY_PATTERN = re.compile(r'^[ \t]*(\* [A-Z])', re.IGNORECASE | re.MULTILINE)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_BULLET_PATTERN = re.compile(r'^[\*\-\•]\s*')
+
+_SECTION_FIELDS = {
+    "WHAT": "what",
+    "WHERE": "where",
+    "WHEN": "when",
+    "IMPACTS": "impacts",
+    "ADDITIONAL DETAILS": "additional_details",
+}
+
+
+@dataclass(frozen=True)
+class AlertDescription:
+    """The sections of an alert description, with whitespace collapsed."""
+    what: str = ""
+    where: str = ""
+    when: str = ""
+    impacts: str = ""
+    additional_details: str = ""
+
+
+EMPTY_DESCRIPTION = AlertDescription()
+
+
+def _clean(text: str) -> str:
+    """Collapse whitespace and drop a leading bullet."""
+    return _BULLET_PATTERN.sub('', _WHITESPACE_PATTERN.sub(' ', text.strip()))
+
+
+def parse_description(description: Optional[str]) -> AlertDescription:
+    """Split a description into its sections in a single scan.
+
+    A "* NAME..." marker starts a section wherever it appears, and the
+    section runs to the next "* " bullet that begins a line or to the end of
+    the text. This is how NWS descriptions were always read, including ones
+    that run a marker into the middle of a line or add plain bullets.
+    Unknown sections are ignored; the first occurrence of a known section
+    wins.
+    """
+    if not description:
+        return EMPTY_DESCRIPTION
+
+    # Only bullets that open a line close the section before them
+    boundaries = [match.start(1) for match in _BOUNDARY_PATTERN.finditer(description)]
+    boundaries.append(len(description))
+    sections = {}
+    for match in _SECTION_PATTERN.finditer(description):
+        field = _SECTION_FIELDS.get(match.group(1).upper())
+        if field is None or field in sections:
+            continue
+        end = next(boundary for boundary in boundaries if boundary > match.start())
+        sections[field] = _clean(description[match.end():end])
+
+    return AlertDescription(**sections) if sections else EMPTY_DESCRIPTION
+
+
+class AlertDescriptionCache:
+    """Memoize parsed descriptions per alert id and sent time."""
+
+    def __init__(self, max_entries: int = DESCRIPTION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, AlertDescription] = OrderedDict()
+
+    def get(self, alert) -> AlertDescription:
+        """Return the parsed description of an alert record or alert dict."""
+        alert_id = alert.get('id')
+        if not alert_id:
+            return parse_description(alert.get('description'))
+
+        key = (alert_id, alert.get('sent'))
+        parsed = self._entries.get(key)
+        if parsed is not None:
+            self._entries.move_to_end(key)
+            return parsed
+
+        parsed = parse_description(alert.get('description'))
+        self._entries[key] = parsed
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return parsed
+
+
+# Shared by the header compiler and the alert sensors
+_DESCRIPTIONS = AlertDescriptionCache()
+
+
+def get_alert_description(alert) -> AlertDescription:
+    """Return the memoized description sections for an alert."""
+    return _DESCRIPTIONS.get(alert)
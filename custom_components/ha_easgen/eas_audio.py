@@ -0,0 +1,157 @@
+"""In-memory EAS tone synthesis."""
+from __future__ import annotations
+
+import array
+import logging
+import threading
+from typing import Callable, Dict, Tuple
+
+import pydub
+from EASGen import EASGen
+
+from .const import (
+    EAS_SAMPLE_RATE, EAS_SAMPLE_WIDTH, EAS_CHANNELS,
+    HEADER_LEAD_SILENCE, HEADER_ENGINE_EASGEN, HEADER_ENGINE_NUMPY,
+)
+
+try:
+    import numpy as np
+    from .same_encoder import get_encoder
+except ImportError:  # NumPy is optional, EASGen remains the default encoder
+    np = None
+    get_encoder = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Constant tone segments keyed by (name, sample rate, sample width, channels)
+_TONE_CACHE: Dict[Tuple[str, int, int, int], pydub.AudioSegment] = {}
+_TONE_LOCK = threading.Lock()
+
+
+def to_segment(audio, sample_rate: int = EAS_SAMPLE_RATE) -> pydub.AudioSegment:
+    """Wrap synthesized EAS samples in an AudioSegment without a disk round-trip."""
+    if isinstance(audio, pydub.AudioSegment):
+        return audio
+
+    # Raw 16-bit PCM, either as a byte buffer or a sequence of integer samples
+    if not isinstance(audio, (bytes, bytearray, memoryview)):
+        audio = array.array("h", audio).tobytes()
+
+    return pydub.AudioSegment(
+        data=bytes(audio),
+        sample_width=EAS_SAMPLE_WIDTH,
+        frame_rate=sample_rate,
+        channels=EAS_CHANNELS,
+    )
+
+
+def _conform(segment: pydub.AudioSegment, sample_rate: int, sample_width: int, channels: int) -> pydub.AudioSegment:
+    """Convert a segment to the requested sample format if it differs."""
+    if segment.frame_rate != sample_rate:
+        segment = segment.set_frame_rate(sample_rate)
+    if segment.sample_width != sample_width:
+        segment = segment.set_sample_width(sample_width)
+    if segment.channels != channels:
+        segment = segment.set_channels(channels)
+    return segment
+
+
+def _cached_tone(
+    name: str,
+    factory: Callable[[], pydub.AudioSegment],
+    sample_rate: int,
+    sample_width: int,
+    channels: int,
+) -> pydub.AudioSegment:
+    """Return a constant tone segment, synthesizing it once per sample format."""
+    key = (name, sample_rate, sample_width, channels)
+    tone = _TONE_CACHE.get(key)
+    if tone is None:
+        with _TONE_LOCK:
+            tone = _TONE_CACHE.get(key)
+            if tone is None:
+                _LOGGER.debug("Synthesizing %s tone for %s", name, key[1:])
+                tone = _conform(factory(), sample_rate, sample_width, channels)
+                _TONE_CACHE[key] = tone
+    return tone
+
+
+def _synthesize_attention_tone() -> pydub.AudioSegment:
+    """Build EASGen's attention tone followed by its one second gap, exactly as genEAS does."""
+    # pydub's default silence rate is the 11025 Hz EASGen pads with, so the resampled gap matches too
+    return EASGen.genATTN(sampleRate=EAS_SAMPLE_RATE) + pydub.AudioSegment.silent(duration=1000)
+
+
+def _synthesize_end_of_message() -> pydub.AudioSegment:
+    """Build the NNNN End of Message bursts."""
+    return to_segment(EASGen.genEAS(header="", attentionTone=False, endOfMessage=True))
+
+
+def get_attention_tone(
+    sample_rate: int = EAS_SAMPLE_RATE,
+    sample_width: int = EAS_SAMPLE_WIDTH,
+    channels: int = EAS_CHANNELS,
+) -> pydub.AudioSegment:
+    """Return the cached attention tone for the given sample format."""
+    return _cached_tone("attention", _synthesize_attention_tone, sample_rate, sample_width, channels)
+
+
+def get_end_of_message(
+    sample_rate: int = EAS_SAMPLE_RATE,
+    sample_width: int = EAS_SAMPLE_WIDTH,
+    channels: int = EAS_CHANNELS,
+) -> pydub.AudioSegment:
+    """Return the cached End of Message bursts for the given sample format."""
+    return _cached_tone("end_of_message", _synthesize_end_of_message, sample_rate, sample_width, channels)
+
+
+def prime_tones(
+    sample_rate: int = EAS_SAMPLE_RATE,
+    sample_width: int = EAS_SAMPLE_WIDTH,
+    channels: int = EAS_CHANNELS,
+) -> None:
+    """Precompute the constant tone segments so alert renders only synthesize headers."""
+    get_attention_tone(sample_rate, sample_width, channels)
+    get_end_of_message(sample_rate, sample_width, channels)
+
+
+def _encode_header_numpy(full_header: str, sample_rate: int = EAS_SAMPLE_RATE) -> Tuple[pydub.AudioSegment, int]:
+    """Encode the header bursts with the NumPy encoder, padded the same way EASGen pads them.
+
+    Returns the audio and the length of the trailing pad in samples.
+    """
+    encoder = get_encoder(sample_rate)
+    padding = sample_rate * HEADER_LEAD_SILENCE // 1000
+    samples = np.zeros(padding * 2 + encoder.encoded_length(full_header), dtype=np.int16)
+    encoder.encode_into(samples, full_header, offset=padding)
+    return to_segment(samples.tobytes(), sample_rate), padding
+
+
+def _encode_header_easgen(full_header: str) -> Tuple[pydub.AudioSegment, int]:
+    """Encode the header bursts with EASGen; returns the audio and its trailing pad in samples."""
+    header = to_segment(EASGen.genEAS(header=full_header, attentionTone=False, endOfMessage=False))
+    # EASGen's pad is 11025 Hz silence resampled on concatenation, so it is not a round sample count
+    padding = int(pydub.AudioSegment.silent(duration=HEADER_LEAD_SILENCE).set_frame_rate(header.frame_rate).frame_count())
+    return header, padding
+
+
+def generate_header(full_header: str, attention_tone: bool = True, engine: str = HEADER_ENGINE_EASGEN) -> pydub.AudioSegment:
+    """Synthesize the SAME header bursts, optionally followed by the cached attention tone."""
+    _LOGGER.debug("Synthesizing EAS header audio for %s with %s", full_header, engine)
+    if engine == HEADER_ENGINE_NUMPY and get_encoder is not None:
+        header, padding = _encode_header_numpy(full_header)
+    else:
+        if engine == HEADER_ENGINE_NUMPY:
+            _LOGGER.warning("NumPy is not available, falling back to EASGen for header synthesis")
+        header, padding = _encode_header_easgen(full_header)
+    if attention_tone:
+        # The tone follows the last burst's gap directly; the trailing pad stays at the end, as in genEAS
+        tone = get_attention_tone(header.frame_rate, header.sample_width, header.channels)
+        end = int(header.frame_count())
+        header = header.get_sample_slice(0, end - padding) + tone + header.get_sample_slice(end - padding, end)
+    return header
+
+
+def generate_footer() -> pydub.AudioSegment:
+    """Return the End of Message bursts from the tone cache."""
+    return get_end_of_message()
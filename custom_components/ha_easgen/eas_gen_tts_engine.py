@@ -1,16 +1,48 @@
 """EAS Header and Footer Module"""
 import logging
-from EASGen import EASGen
+import os
 import pydub
-from .const import AVAIL_LANGUAGES, MAX_PURGE_DIFFERENCE, HOUR_IN_MINUTES, MINUTE_IN_SECONDS
-from datetime import timedelta
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
+from .const import (
+    AVAIL_LANGUAGES, RENDER_CACHE_SIZE,
+    OUTPUT_FORMAT, OUTPUT_BITRATE, OUTPUT_FORMATS, OUTPUT_BITRATES, DEFAULT_OUTPUT_FORMAT, DEFAULT_OUTPUT_BITRATE,
+    HEADER_ENGINE, DEFAULT_HEADER_ENGINE, HEADER_CACHE_SIZE, DEFAULT_HEADER_CACHE_SIZE,
+)
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
-from dateutil import parser
+from .registry import get_registry
+from .eas_audio import generate_header, generate_footer
+from .audio_cache import get_header_cache
+from .file_manager import async_get_file_manager
+from .header_compiler import HeaderCompiler, calculate_purge_time, extract_what_section
+from .tts_cache import async_get_tts_cache
+from .assembler import AudioAssembler
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Complete EAS audio rendered for one alert."""
+    alert_id: str
+    url: str
+    path: str
+    size: int
+    duration: float
+    content_hash: str
+
+
+class TTSGenerationError(Exception):
+    """Raised inside the render task group when the TTS stage produces no audio."""
+
+
+def _write_file(path, data):
+    with open(path, "wb") as file:
+        file.write(data)
+
+
 class EASGenTTSEngine:
-    def __init__(self, hass, weather_sensor, tts_engine: str, org: str, call_sign: str, voice: str, language: str, config_entry=None):
+    def __init__(self, hass, weather_sensor, tts_engine: str, org: str, call_sign: str, voice: str, language: str, config_entry=None, registry=None):
         self.hass = hass
         self._weather_sensor = weather_sensor
         self._tts_engine = tts_engine
@@ -20,6 +52,29 @@ class EASGenTTSEngine:
         self._language = language
         self._languages = AVAIL_LANGUAGES
         self._config_entry = config_entry
+        self._registry = registry
+        self._compiler = None
+        data = config_entry.data if config_entry else {}
+        self._output_format = data.get(OUTPUT_FORMAT, DEFAULT_OUTPUT_FORMAT)
+        if self._output_format not in OUTPUT_FORMATS:
+            _LOGGER.warning("Unsupported output format '%s', using %s", self._output_format, DEFAULT_OUTPUT_FORMAT)
+            self._output_format = DEFAULT_OUTPUT_FORMAT
+        self._output_bitrate = data.get(OUTPUT_BITRATE, DEFAULT_OUTPUT_BITRATE)
+        if self._output_bitrate not in OUTPUT_BITRATES:
+            _LOGGER.warning("Unsupported output bitrate '%s', using %s", self._output_bitrate, DEFAULT_OUTPUT_BITRATE)
+            self._output_bitrate = DEFAULT_OUTPUT_BITRATE
+        self._header_engine = data.get(HEADER_ENGINE, DEFAULT_HEADER_ENGINE)
+        self._header_cache = get_header_cache(
+            int(data.get(HEADER_CACHE_SIZE, DEFAULT_HEADER_CACHE_SIZE)) * 1024 * 1024
+        )
+        self._render_cache = OrderedDict()
+        self._pending_renders = {}
+
+    async def _get_registry(self):
+        """Return the shared SAME/FIPS code registry."""
+        if self._registry is None:
+            self._registry = await get_registry()
+        return self._registry
 
     async def get_tts(self, text: str, header_path, footer_path):
         """Generate TTS audio directly using Home Assistant TTS functions (like chime_tts does internally)"""
@@ -28,8 +83,23 @@ class EASGenTTSEngine:
             import io
             from homeassistant.components import tts
             
-            # Step 1: Generate media source ID (same as chime_tts)
             timeout = 30  # seconds
+            cache = await async_get_tts_cache(self.hass)
+            audio_bytes = await cache.async_get(self._tts_engine, self._language, self._voice, text)
+            
+            if audio_bytes is not None:
+                _LOGGER.debug("Using cached TTS audio")
+                try:
+                    tts_audio = await asyncio.to_thread(pydub.AudioSegment.from_file, io.BytesIO(audio_bytes))
+                except Exception as e:
+                    _LOGGER.warning("Cached TTS audio could not be decoded, regenerating: %s", e)
+                    tts_audio = None
+                if tts_audio and len(tts_audio) > 0:
+                    return (tts_audio, None)
+                # Corrupt or empty entry; drop it and ask the TTS engine again
+                await cache.async_remove(self._tts_engine, self._language, self._voice, text)
+            
+            # Step 1: Generate media source ID (same as chime_tts)
             media_source_id = await asyncio.wait_for(
                 asyncio.to_thread(
                     tts.media_source.generate_media_source_id,
@@ -57,13 +127,16 @@ class EASGenTTSEngine:
                 _LOGGER.error("Error: Unable to get audio data from media_source_id")
                 return None, None
             
+            extension, audio_bytes = audio_data
+            
             # Step 3: Convert to pydub AudioSegment (same as chime_tts)
-            audio_bytes = audio_data[1]
             file = io.BytesIO(audio_bytes)
-            tts_audio = pydub.AudioSegment.from_file(file)
+            tts_audio = await asyncio.to_thread(pydub.AudioSegment.from_file, file)
             
             if tts_audio and len(tts_audio) > 0:
                 _LOGGER.debug("TTS audio generated successfully")
+                # Only cache speech that decoded cleanly
+                await cache.async_put(self._tts_engine, self._language, self._voice, text, audio_bytes, extension)
                 return (tts_audio, None)
             else:
                 _LOGGER.error("Could not extract TTS audio from file")
@@ -76,264 +149,155 @@ class EASGenTTSEngine:
             _LOGGER.error(f"TTS generation failed: {e}")
             return None, None
         
+    async def _get_compiler(self):
+        """Return the header compiler bound to this entry's settings."""
+        if self._compiler is None:
+            include_description = bool(self._config_entry and self._config_entry.data.get('include_description', False))
+            self._compiler = HeaderCompiler(await self._get_registry(), self._org, self._call_sign, include_description)
+        return self._compiler
+
     async def get_single_notification(self, alert):
         """Process a single specific alert instead of all alerts."""
-        from .eventcodes import get_same_data, get_fips_data
-        valid_severities = {'Unknown', 'Minor', 'Moderate', 'Severe', 'Extreme'}
-        results = []
-
-        # Load data asynchronously
-        SAME = await get_same_data()
-        FIPS = await get_fips_data()
-
-        _LOGGER.info("Processing single alert: %s", alert.get('event', 'Unknown'))
-
-        if alert.get('severity') not in valid_severities:
-            _LOGGER.warning("Skipping alert with invalid severity: %s", alert.get('severity'))
-            return results
-        elif alert.get('severity') == 'Unknown':
-            _LOGGER.warning("Skipping alert with unknown severity")
-            return results
-
-        CardinalLocation='0'
-        
-        _LOGGER.debug("Gathering the Event Code from SAME data")
-        EventCode = ""
-        event = alert.get('event')
-        for item in SAME:
-           if item["Event Description"] == event:
-              EventCode = item["Event Code"]
-              break
-
-        if not EventCode:
-            _LOGGER.error(f"Event code not found for event: {event}")
-            return results
-
-        _LOGGER.debug("Gathering the Zone Data")
-        Zone = alert.get('zoneid').split(",")[0]
-        if len(Zone) >= 3:
-            ZoneState = Zone[:2]
-            ZoneID = str(int(Zone[2:].split("Z")[1]))
-        else:
-            _LOGGER.warning(f"Skipping Zone with less than 3 characters: {Zone}")
-            return results
-       
-        _LOGGER.debug("Gathering the County Data")
-        county_parts = alert.get('zoneid').split(",")
-        if len(county_parts) > 1:
-            County = county_parts[1]
-            if len(County) >= 3:
-                CountyState = County[:2]
-                CountyCode = str(int(County[2:].split("C")[1]))
-            else:
-                _LOGGER.warning(f"Skipping County with less than 3 characters: {County}")
-                return results
-        else:
-            # No county in zone ID, use zone state and a default county code
-            CountyState = ZoneState
-            CountyCode = "000"
-
-        _LOGGER.debug("Gathering the FIPs Data")
-        StateCode = "00"  # Default
-        for item in FIPS:
-           if item["State"] == ZoneState:
-              StateCode = item["State Code"]
-              break
-          
-        _LOGGER.debug("Gathering the Alert Spoken Title")
-        spoken_title = alert.get('spoken_title')
-        if spoken_title is None:
-            title = alert.get('title')
-            if title is None:
-                spoken_title = "No Title for this Alert!"
-                _LOGGER.warning(f"EAS ALERT!!: No Title!")
-            else:
-                spoken_title = title
-                _LOGGER.warning(f"EAS ALERT!!: " + spoken_title)
-        else:
-            spoken_title = alert.get('spoken_title')
-            _LOGGER.warning(f"EAS ALERT!!: " + spoken_title)
-
-        # Add description if enabled in configuration
-        if self._config_entry and self._config_entry.data.get('include_description', False):
-            description = alert.get('description', '')
-            if description:
-                what_section = self._extract_what_section(description)
-                if what_section:
-                    spoken_title += f". {what_section}"
-                    _LOGGER.debug("Added WHAT section to spoken title")
-
-        _LOGGER.debug("Parsing the Alert Dates")
-        BeginTime = parser.parse(alert.get('onset'))
-        EndTime = parser.parse(alert.get('endsExpires'))
-
-        diff = EndTime - BeginTime
-        PurgeTimeDifference = int(diff / timedelta(minutes=1))
-        PurgeTime = self.calculate_purge_time(PurgeTimeDifference)
-
-        _LOGGER.debug("Generating the EAS Protocol Header String")
-        IssueTime = BeginTime.strftime('%j') + BeginTime.strftime('%H') + BeginTime.strftime('%M')
-        MinHeader = "ZCZC-" + self._org + "-" + EventCode + "-" + CardinalLocation + StateCode.zfill(2) + CountyCode.zfill(3) + "+" + PurgeTime.zfill(4) + "-" + IssueTime 
-        FullHeader = MinHeader + "-" + self._call_sign + "-"
-
-        _LOGGER.warning(f"EAS ALERT!!: " + FullHeader)
-        
-        _LOGGER.debug("Appending Data to Alerts to be Spoken List")
-        results.append((MinHeader, spoken_title, FullHeader))
-        return results
+        compiler = await self._get_compiler()
+        return compiler.compile([alert])
 
     async def get_notifications(self):
-        from .eventcodes import get_same_data, get_fips_data
-        valid_severities = {'Unknown', 'Minor', 'Moderate', 'Severe', 'Extreme'}
-        alert_number = 0
-        results = []
-
-        # Load data asynchronously
-        SAME = await get_same_data()
-        FIPS = await get_fips_data()
+        """Compile header records for every alert on the weather sensor."""
+        compiler = await self._get_compiler()
 
         # Update the weather sensor to get latest alerts
         await self._weather_sensor.async_update()
         
         # Get alerts from the internal weather sensor
-        attributes = self._weather_sensor.extra_state_attributes
-        if "alerts" in attributes:
-            for alert in attributes['alerts']:
-                alert_number += 1
-                _LOGGER.info("Alert #" + str(alert_number))
-
-                if alert.get('severity') not in valid_severities:
-                    continue
-                elif alert.get('severity') == 'Unknown':
-                    continue
-                else:
-                    CardinalLocation='0'
-                    
-                    _LOGGER.debug("Gathering the Event Code from SAME data")
-                    EventCode = ""
-                    event = alert.get('event')
-                    for item in SAME:
-                       if item["Event Description"] == event:
-                          EventCode = item["Event Code"]
-                          break
-
-                    if not EventCode:
-                        _LOGGER.error(f"Event code not found for event: {event}")
-                        continue
-
-                    _LOGGER.debug("Gathering the Zone Data")
-                    Zone = alert.get('zoneid').split(",")[0]
-                    if len(Zone) >= 3:
-                        ZoneState = Zone[:2]
-                        ZoneID = str(int(Zone[2:].split("Z")[1]))
-                    else:
-                        _LOGGER.warning(f"Skipping Zone with less than 3 characters: {Zone}")
-                        continue
-                   
-                    _LOGGER.debug("Gathering the County Data")
-                    county_parts = alert.get('zoneid').split(",")
-                    if len(county_parts) > 1:
-                        County = county_parts[1]
-                        if len(County) >= 3:
-                            CountyState = County[:2]
-                            CountyCode = str(int(County[2:].split("C")[1]))
-                        else:
-                            _LOGGER.warning(f"Skipping County with less than 3 characters: {County}")
-                            continue
-                    else:
-                        # No county in zone ID, use zone state and a default county code
-                        CountyState = ZoneState
-                        CountyCode = "000"
-
-                    _LOGGER.debug("Gathering the FIPs Data")
-                    StateCode = "00"  # Default
-                    for item in FIPS:
-                       if item["State"] == ZoneState:
-                          StateCode = item["State Code"]
-                          break
-                      
-                    _LOGGER.debug("Gathering the Alert Spoken Title")
-                    spoken_title = alert.get('spoken_title')
-                    if spoken_title is None:
-                        title = alert.get('title')
-                        if title is None:
-                            spoken_title = "No Title for this Alert!"
-                            _LOGGER.warning(f"EAS ALERT!!: No Title!")
-                        else:
-                            spoken_title = title
-                            _LOGGER.warning(f"EAS ALERT!!: " + spoken_title)
-                    else:
-                        spoken_title = alert.get('spoken_title')
-                        _LOGGER.warning(f"EAS ALERT!!: " + spoken_title)
-
-                    # Add description if enabled in configuration
-                    if self._config_entry and self._config_entry.data.get('include_description', False):
-                        description = alert.get('description', '')
-                        if description:
-                            what_section = self._extract_what_section(description)
-                            if what_section:
-                                spoken_title += f". {what_section}"
-                                _LOGGER.debug("Added WHAT section to spoken title")
-
-                    _LOGGER.debug("Parsing the Alert Dates")
-                    BeginTime = parser.parse(alert.get('onset'))
-                    EndTime = parser.parse(alert.get('endsExpires'))
-
-                    diff = EndTime - BeginTime
-                    PurgeTimeDifference = int(diff / timedelta(minutes=1))
-                    PurgeTime = self.calculate_purge_time(PurgeTimeDifference)
-
-                    _LOGGER.debug("Generating the EAS Protocol Header String")
-                    IssueTime = BeginTime.strftime('%j') + BeginTime.strftime('%H') + BeginTime.strftime('%M')
-                    MinHeader = "ZCZC-" + self._org + "-" + EventCode + "-" + CardinalLocation + StateCode.zfill(2) + CountyCode.zfill(3) + "+" + PurgeTime.zfill(4) + "-" + IssueTime 
-                    FullHeader = MinHeader + "-" + self._call_sign + "-"
-
-                    _LOGGER.warning(f"EAS ALERT!!: " + FullHeader)
-                    
-                    _LOGGER.debug("Appending Data to Alerts to be Spoken List")
-                    results.append((MinHeader, spoken_title, FullHeader))
-        else:
+        alerts = self._weather_sensor.alerts
+        if not alerts:
             _LOGGER.info("No weather alerts found")
-        return results
+            return []
+        return compiler.compile(alerts)
 
     def calculate_purge_time(self, purge_diff):
-        if purge_diff > MAX_PURGE_DIFFERENCE:
-            return "9930"
-        elif purge_diff >= HOUR_IN_MINUTES:
-            hours, minutes = divmod(purge_diff, HOUR_IN_MINUTES)
-            if purge_diff >= MAX_PURGE_DIFFERENCE:
-                minutes = divmod(minutes, MINUTE_IN_SECONDS)[0] * MINUTE_IN_SECONDS
-            else:
-                minutes = divmod(minutes, MINUTE_IN_SECONDS / 2)[0] * (MINUTE_IN_SECONDS / 2)
-            return f"{int(hours):02d}{int(minutes):02d}"
-        else:
-            quarters = divmod(purge_diff, MINUTE_IN_SECONDS / 15)[0] * (MINUTE_IN_SECONDS / 15)
-            return f"00{int(quarters):02d}"
+        return calculate_purge_time(purge_diff)
 
-    async def get_header_audio(self, MinHeader, FullHeader):
+    async def get_header_audio(self, MinHeader, FullHeader, expires=None):
         import asyncio
-        AlertHeader = EASGen.genEAS(header=FullHeader, attentionTone=True, endOfMessage=False)
-        header_path = "/config/www/" + MinHeader + "-Header.wav"
+        header = self._header_cache.get(self._header_engine, FullHeader)
+        if header is not None:
+            _LOGGER.debug("Using cached EAS Header Audio for %s", MinHeader)
+            return (header, None)
+        
         _LOGGER.debug("Generating EAS Header Audio")
         
-        # Run blocking operations in thread pool to avoid blocking the event loop
-        await asyncio.to_thread(EASGen.export_wav, header_path, AlertHeader)
-        header = await asyncio.to_thread(pydub.AudioSegment.from_wav, header_path)
-        return (header, header_path)
+        # Synthesis is CPU bound, so run it in the thread pool; the audio stays in memory
+        header = await asyncio.to_thread(generate_header, FullHeader, True, self._header_engine)
+        self._header_cache.put(self._header_engine, FullHeader, header, expires)
+        return (header, None)
         
     async def get_footer_audio(self, MinHeader):
         import asyncio
-        AlertEndofMessage = EASGen.genEAS(header="", attentionTone=False, endOfMessage=True)
-        footer_path = "/config/www/" + MinHeader + "-EndofMessage.wav"
         _LOGGER.debug("Generating EAS Footer Audio")
         
-        # Run blocking operations in thread pool to avoid blocking the event loop
-        await asyncio.to_thread(EASGen.export_wav, footer_path, AlertEndofMessage)
-        footer = await asyncio.to_thread(pydub.AudioSegment.from_wav, footer_path)
-        return (footer, footer_path)
+        # The End of Message bursts are identical for every alert and come from the tone cache
+        footer = await asyncio.to_thread(generate_footer)
+        return (footer, None)
+
+    async def get_alert_audio(self, MinHeader, title, FullHeader, expires=None):
+        """Generate the header, TTS and footer concurrently and return them in playback order.
+
+        If any stage fails the others are cancelled. Exceptions propagate to the
+        caller; a TTS failure is logged and returns None.
+        """
+        import asyncio
+
+        async def speech():
+            generated_speech = await self.get_tts(title, None, None)
+            if generated_speech is None or generated_speech == (None, None):
+                raise TTSGenerationError(title)
+            return generated_speech[0]
+
+        tts_failed = False
+        try:
+            async with asyncio.TaskGroup() as group:
+                header_task = group.create_task(self.get_header_audio(MinHeader, FullHeader, expires))
+                speech_task = group.create_task(speech())
+                footer_task = group.create_task(self.get_footer_audio(MinHeader))
+        except* TTSGenerationError:
+            tts_failed = True
+
+        if tts_failed:
+            _LOGGER.error("TTS generation failed for alert: %s", title)
+            return None
+
+        return header_task.result()[0], speech_task.result(), footer_task.result()[0]
+
+    def _render_key(self, alert):
+        """Key a render by alert id and every setting that changes the output audio."""
+        include_description = bool(self._config_entry and self._config_entry.data.get('include_description', False))
+        return (
+            alert.get('id'),
+            self._tts_engine,
+            self._org,
+            self._call_sign,
+            self._voice,
+            self._language,
+            include_description,
+            self._output_format,
+            self._output_bitrate,
+        )
+
+    def export_renders(self, alert_ids=None):
+        """Return cached renders as JSON-serializable records, optionally for some alerts only."""
+        return [
+            {"key": list(key), **asdict(result)}
+            for key, result in self._render_cache.items()
+            if alert_ids is None or result.alert_id in alert_ids
+        ]
+
+    def restore_renders(self, renders):
+        """Seed the render cache from records produced by export_renders."""
+        names = [field.name for field in fields(RenderResult)]
+        for item in renders or ():
+            try:
+                self._render_cache[tuple(item["key"])] = RenderResult(**{name: item[name] for name in names})
+            except (KeyError, TypeError):
+                continue
+        while len(self._render_cache) > RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+
+    async def render(self, alert):
+        """Render the complete EAS audio for an alert once and return its RenderResult."""
+        import asyncio
+
+        key = self._render_key(alert)
+        result = self._render_cache.get(key)
+        if result is not None:
+            files = await async_get_file_manager(self.hass)
+            if files.is_tracked(os.path.basename(result.path)):
+                self._render_cache.move_to_end(key)
+                _LOGGER.debug("Using cached render for alert %s", alert.get('id'))
+                return result
+            # The file manager removed the audio file, render it again
+            del self._render_cache[key]
+
+        # Concurrent callers for the same alert share one render
+        pending = self._pending_renders.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._render(alert))
+            self._pending_renders[key] = pending
+            pending.add_done_callback(lambda _: self._pending_renders.pop(key, None))
+
+        result = await asyncio.shield(pending)
+        if result is not None:
+            self._render_cache[key] = result
+            self._render_cache.move_to_end(key)
+            while len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        return result
+
+    async def _render(self, alert):
+        """Run the header, TTS and footer pipeline and write the Complete audio file."""
+        import asyncio
+        import hashlib
 
-    async def get_audio_url(self, alert):
-        """Generate complete EAS audio and return accessible URL for media player."""
         try:
             # Generate notification data for this specific alert
             notification_data = await self.get_single_notification(alert)
@@ -343,128 +307,90 @@ class EASGenTTSEngine:
                 return None
             
             # Process the first (and should be only) notification
-            MinHeader, title, FullHeader = notification_data[0]
+            record = notification_data[0]
+            MinHeader, FullHeader = record.min_header, record.full_header
             
-            # Generate Header and Footer WAV files
-            header_wav = await self.get_header_audio(MinHeader, FullHeader)
-            header, header_path = header_wav
-            footer_wav = await self.get_footer_audio(MinHeader)
-            footer, footer_path = footer_wav
+            # Generate Header, TTS and Footer audio concurrently
+            parts = await self.get_alert_audio(MinHeader, record.spoken_title, FullHeader, record.expires)
             
-            # Generate TTS for the alert
-            generated_speech = await self.get_tts(title, header_path, footer_path)
-            
-            if generated_speech is None or generated_speech == (None, None):
-                _LOGGER.error("TTS generation failed for alert: %s", title)
+            if parts is None:
                 return None
             
-            tts_message, tts_message_path = generated_speech
+            header, tts_message, footer = parts
             
             # Combine the header, TTS message, and footer
-            complete_audio = header + tts_message + footer
+            complete_audio = AudioAssembler([header, tts_message, footer])
+            duration = complete_audio.duration
             
-            # Cache the duration for the queue system
-            self._last_audio_duration = len(complete_audio) / 1000.0  # Convert to seconds
+            # Encode off the event loop; WAV needs no ffmpeg, so it is the fallback
+            output_format = self._output_format
+            try:
+                data = await asyncio.to_thread(complete_audio.encode, output_format, self._output_bitrate)
+            except Exception as e:
+                if output_format == "wav":
+                    raise
+                _LOGGER.warning("Could not encode alert audio as %s, falling back to WAV: %s", output_format, e)
+                output_format = "wav"
+                data = await asyncio.to_thread(complete_audio.encode, output_format)
             
             # Save combined audio to accessible location (www folder for unauthenticated access)
-            import os
-            import asyncio
-            filename = f"{MinHeader}-Complete.wav"
-            file_path = f"/config/www/{filename}"
-            
-            # Ensure directory exists
+            extension, _ = OUTPUT_FORMATS[output_format]
+            filename = f"{record.file_stem}-Complete.{extension}"
+            files = await async_get_file_manager(self.hass)
+            file_path = os.path.join(files.directory, filename)
             await asyncio.to_thread(os.makedirs, os.path.dirname(file_path), exist_ok=True)
-            
-            # Export the complete audio (run in thread to avoid blocking)
-            await asyncio.to_thread(complete_audio.export, file_path, format="wav")
-            
-            # Return the accessible URL for Home Assistant media player
-            # Use /local/ endpoint which doesn't require authentication
-            from homeassistant.helpers.network import get_url
-            
-            try:
-                # Get the Home Assistant base URL
-                base_url = get_url(self.hass)
-                media_url = f"{base_url}/local/{filename}"
-                _LOGGER.debug("Generated audio URL: %s", media_url)
-                return media_url
-            except Exception as e:
-                _LOGGER.error("Failed to generate full URL: %s", e)
-                # Fallback to relative path
-                media_url = f"/local/{filename}"
-                _LOGGER.debug("Using fallback URL: %s", media_url)
-                return media_url
+            await asyncio.to_thread(_write_file, file_path, data)
+            
+            # Hand the file to the lifecycle manager so it is deleted once the alert purges
+            await files.async_track(file_path, len(data), record.expires)
+            
+            result = RenderResult(
+                alert_id=alert.get('id'),
+                url=self._media_url(filename),
+                path=file_path,
+                size=len(data),
+                duration=duration,
+                content_hash=hashlib.sha256(data).hexdigest(),
+            )
+            _LOGGER.debug("Rendered alert %s: %s (%d bytes, %ss)", result.alert_id, result.url, result.size, result.duration)
+            return result
             
         except Exception as e:
-            _LOGGER.error("Failed to generate audio URL for alert: %s", e)
+            _LOGGER.error("Failed to render audio for alert: %s", e)
             return None
 
-    async def get_audio_duration(self, alert):
-        """Get the duration of the complete EAS audio for the given alert."""
+    def _media_url(self, filename):
+        """Return the /local/ URL a media player can fetch without authentication."""
+        from homeassistant.helpers.network import get_url
+        
         try:
-            # Check if we have cached duration from the last get_audio_url call
-            if hasattr(self, '_last_audio_duration'):
-                duration = self._last_audio_duration
-                _LOGGER.debug("Using cached audio duration: %ss", duration)
-                return duration
-            
-            # If not cached, generate the audio components to calculate duration
-            notification_data = await self.get_single_notification(alert)
-            
-            if not notification_data:
-                _LOGGER.error("No notification data generated for alert")
-                return 30.0  # Default fallback duration
-            
-            # Process the first (and should be only) notification
-            MinHeader, title, FullHeader = notification_data[0]
-            
-            # Generate Header and Footer WAV files
-            header_wav = await self.get_header_audio(MinHeader, FullHeader)
-            header, header_path = header_wav
-            footer_wav = await self.get_footer_audio(MinHeader)
-            footer, footer_path = footer_wav
-            
-            # Generate TTS for the alert
-            generated_speech = await self.get_tts(title, header_path, footer_path)
-            
-            if generated_speech is None or generated_speech == (None, None):
-                _LOGGER.error("TTS generation failed for alert: %s", title)
-                return 30.0  # Default fallback duration
-            
-            tts_message, tts_message_path = generated_speech
-            
-            # Combine the header, TTS message, and footer
-            complete_audio = header + tts_message + footer
-            
-            # Calculate duration in seconds
-            duration = len(complete_audio) / 1000.0
-            
-            # Cache for future use
-            self._last_audio_duration = duration
-            
-            _LOGGER.debug("Calculated audio duration: %ss", duration)
-            return duration
-            
+            # Get the Home Assistant base URL
+            base_url = get_url(self.hass)
+            media_url = f"{base_url}/local/{filename}"
+            _LOGGER.debug("Generated audio URL: %s", media_url)
+            return media_url
         except Exception as e:
-            _LOGGER.error("Failed to calculate audio duration for alert: %s", e)
+            _LOGGER.error("Failed to generate full URL: %s", e)
+            # Fallback to relative path
+            media_url = f"/local/{filename}"
+            _LOGGER.debug("Using fallback URL: %s", media_url)
+            return media_url
+
+    async def get_audio_url(self, alert):
+        """Generate complete EAS audio and return accessible URL for media player."""
+        result = await self.render(alert)
+        return result.url if result else None
+
+    async def get_audio_duration(self, alert):
+        """Get the duration of the complete EAS audio for the given alert."""
+        result = await self.render(alert)
+        if result is None:
             return 30.0  # Default fallback duration
+        return result.duration
 
     def _extract_what_section(self, description: str) -> str:
         """Extract the WHAT section from weather alert description."""
-        import re
-        
-        # Look for the WHAT section
-        what_match = re.search(r'\* WHAT\.\.\.(.+?)(?=\n\s*\* [A-Z]|\Z)', description, re.DOTALL | re.IGNORECASE)
-        
-        if what_match:
-            what_text = what_match.group(1).strip()
-            # Clean up the text - remove extra whitespace and line breaks
-            what_text = re.sub(r'\s+', ' ', what_text)
-            # Remove any remaining asterisks or bullets
-            what_text = re.sub(r'^[\*\-\•]\s*', '', what_text)
-            return what_text
-        
-        return ""
+        return extract_what_section(description)
 
     @staticmethod
     def get_supported_langs() -> list:
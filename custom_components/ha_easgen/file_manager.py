@@ -0,0 +1,160 @@
+"""Lifecycle management for the audio files written to /config/www."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN, AUDIO_FILES_MAX_BYTES, AUDIO_FILES_DEFAULT_RETENTION,
+    AUDIO_FILES_PURGE_INTERVAL, AUDIO_FILES_SAVE_DELAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_FILE_MANAGER = f"{DOMAIN}_file_manager"
+DATA_FILE_MANAGER_LOCK = f"{DATA_FILE_MANAGER}_lock"
+
+# Every file this integration has ever written, including the Header and
+# EndofMessage files older versions left behind
+GENERATED_FILE_PATTERN = re.compile(r"^ZCZC-.+-(Header|EndofMessage|Complete)\.\w+$")
+
+
+class AudioFileManager:
+    """Track generated audio files and delete them on expiry, over quota, or when orphaned."""
+
+    def __init__(self, hass: HomeAssistant, directory: Optional[str] = None, max_bytes: int = AUDIO_FILES_MAX_BYTES):
+        self.hass = hass
+        self.directory = directory or hass.config.path("www")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._store = Store(hass, 1, f"{DOMAIN}_audio_files")
+        self._unsub_purge: Optional[Callable[[], None]] = None
+
+    async def async_start(self) -> None:
+        """Load the file index, remove orphans and schedule periodic purging."""
+        data = await self._store.async_load() or {}
+        self._files = data.get("files", {})
+        await self.async_cleanup_orphans()
+        await self.async_purge_expired()
+        self._unsub_purge = async_track_time_interval(
+            self.hass, self._async_scheduled_purge, timedelta(minutes=AUDIO_FILES_PURGE_INTERVAL)
+        )
+
+    def async_stop(self) -> None:
+        """Stop the periodic purge."""
+        if self._unsub_purge:
+            self._unsub_purge()
+            self._unsub_purge = None
+
+    def is_tracked(self, filename: str) -> bool:
+        """Return True while a generated file is still on disk."""
+        return filename in self._files
+
+    async def async_track(self, path: str, size: int, expires: Optional[datetime] = None) -> None:
+        """Record a newly written file and enforce the size quota, oldest files first."""
+        filename = os.path.basename(path)
+        now = dt_util.utcnow()
+        if expires is None:
+            expires = now + timedelta(hours=AUDIO_FILES_DEFAULT_RETENTION)
+
+        previous = self._files.pop(filename, None)
+        if previous:
+            self.size -= previous.get("size", 0)
+        self._files[filename] = {
+            "size": size,
+            "created": now.isoformat(),
+            "expires": dt_util.as_utc(expires).isoformat(),
+        }
+        self.size += size
+
+        evicted: List[str] = []
+        for name in sorted(self._files, key=lambda name: self._files[name]["created"]):
+            if self.size <= self.max_bytes:
+                break
+            if name == filename:
+                continue
+            self.size -= self._files.pop(name).get("size", 0)
+            evicted.append(name)
+
+        if evicted:
+            _LOGGER.debug("Audio file quota exceeded, removing %d oldest files", len(evicted))
+            await self.hass.async_add_executor_job(self._remove_files, evicted)
+        self._schedule_save()
+
+    async def async_purge_expired(self) -> int:
+        """Delete every tracked file whose alert has purged or expired."""
+        now = dt_util.utcnow()
+        expired = [
+            name for name, entry in self._files.items()
+            if (dt_util.parse_datetime(entry.get("expires", "")) or now) <= now
+        ]
+        for name in expired:
+            self.size -= self._files.pop(name).get("size", 0)
+        if expired:
+            _LOGGER.debug("Removing %d expired audio files", len(expired))
+            await self.hass.async_add_executor_job(self._remove_files, expired)
+            self._schedule_save()
+        return len(expired)
+
+    async def async_cleanup_orphans(self) -> int:
+        """Delete generated files nobody tracks and forget tracked files that are gone."""
+        on_disk = await self.hass.async_add_executor_job(self._list_generated)
+        orphans = [name for name in on_disk if name not in self._files]
+        missing = [name for name in self._files if name not in on_disk]
+
+        for name in missing:
+            del self._files[name]
+        self.size = sum(entry.get("size", 0) for entry in self._files.values())
+
+        if orphans:
+            _LOGGER.info("Removing %d orphaned EAS audio files from %s", len(orphans), self.directory)
+            await self.hass.async_add_executor_job(self._remove_files, orphans)
+        if orphans or missing:
+            self._schedule_save()
+        return len(orphans)
+
+    async def _async_scheduled_purge(self, now=None) -> None:
+        await self.async_purge_expired()
+
+    def _list_generated(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [name for name in names if GENERATED_FILE_PATTERN.match(name)]
+
+    def _remove_files(self, filenames: List[str]) -> None:
+        for name in filenames:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                _LOGGER.warning("Could not remove audio file %s: %s", name, e)
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: {"files": dict(self._files)}, AUDIO_FILES_SAVE_DELAY)
+
+
+async def async_get_file_manager(hass: HomeAssistant) -> AudioFileManager:
+    """Return the file manager shared by all entries, starting it on first use."""
+    manager = hass.data.get(DATA_FILE_MANAGER)
+    if manager is not None:
+        return manager
+    async with hass.data.setdefault(DATA_FILE_MANAGER_LOCK, asyncio.Lock()):
+        manager = hass.data.get(DATA_FILE_MANAGER)
+        if manager is None:
+            manager = AudioFileManager(hass)
+            await manager.async_start()
+            hass.data[DATA_FILE_MANAGER] = manager
+    return manager
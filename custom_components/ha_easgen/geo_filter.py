@@ -0,0 +1,103 @@
+"""Filter alerts by whether their storm-based polygon covers the home location."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+Ring = Sequence[Sequence[float]]
+
+
+@dataclass(frozen=True, slots=True)
+class AlertArea:
+    """Polygons of one alert with their combined bounding box, in GeoJSON [lon, lat] order."""
+    polygons: Tuple[Tuple[Ring, ...], ...]
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+    @classmethod
+    def from_geometry(cls, geometry: Optional[dict]) -> Optional[AlertArea]:
+        """Build an area from a GeoJSON Polygon or MultiPolygon; None for anything else."""
+        if not geometry:
+            return None
+        kind = geometry.get("type")
+        coordinates = geometry.get("coordinates") or ()
+        if kind == "Polygon":
+            polygons = (coordinates,)
+        elif kind == "MultiPolygon":
+            polygons = coordinates
+        else:
+            return None
+
+        polygons = tuple(tuple(ring for ring in polygon if len(ring) >= 4) for polygon in polygons)
+        polygons = tuple(polygon for polygon in polygons if polygon)
+        if not polygons:
+            return None
+        lons = [point[0] for polygon in polygons for point in polygon[0]]
+        lats = [point[1] for polygon in polygons for point in polygon[0]]
+        return cls(polygons, min(lons), min(lats), max(lons), max(lats))
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """Return True if the point lies inside any polygon, outside its holes."""
+        if not (self.min_lon <= lon <= self.max_lon and self.min_lat <= lat <= self.max_lat):
+            return False
+        for polygon in self.polygons:
+            if _in_ring(polygon[0], lon, lat) and not any(_in_ring(hole, lon, lat) for hole in polygon[1:]):
+                return True
+        return False
+
+
+def _in_ring(ring: Ring, x: float, y: float) -> bool:
+    """Ray casting point-in-polygon test for one closed ring."""
+    inside = False
+    x1, y1 = ring[-1][0], ring[-1][1]
+    for point in ring:
+        x2, y2 = point[0], point[1]
+        if (y1 > y) != (y2 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+class HomeLocationFilter:
+    """Drop alerts whose polygon misses the home location.
+
+    Alerts without a polygon (zone and county based products) always pass.
+    Results are cached per alert id and sent time, and entries for alerts
+    that left the feed are forgotten on the next call.
+    """
+
+    def __init__(self, latitude: float, longitude: float):
+        self.latitude = latitude
+        self.longitude = longitude
+        self._results: Dict[Tuple[str, Optional[str]], bool] = {}
+
+    def filter(self, features: Iterable[dict]) -> List[dict]:
+        """Return the features that apply to the home location."""
+        results = {}
+        kept = []
+        for feature in features:
+            properties = feature["properties"]
+            key = (properties.get("id"), properties.get("sent"))
+            applies = self._results.get(key)
+            if applies is None:
+                applies = self._applies(feature)
+                if not applies:
+                    _LOGGER.debug("Alert %s does not cover the home location", key[0])
+            results[key] = applies
+            if applies:
+                kept.append(feature)
+        self._results = results
+        return kept
+
+    def _applies(self, feature: dict) -> bool:
+        try:
+            area = AlertArea.from_geometry(feature.get("geometry"))
+        except (TypeError, ValueError, IndexError) as e:
+            _LOGGER.warning("Ignoring malformed geometry of alert %s: %s", feature["properties"].get("id"), e)
+            return True
+        return area is None or area.contains(self.longitude, self.latitude)
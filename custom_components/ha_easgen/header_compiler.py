@@ -0,0 +1,211 @@
+"""Compile weather alerts into EAS protocol header records."""
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from .const import MAX_PURGE_DIFFERENCE, HOUR_IN_MINUTES, MINUTE_IN_SECONDS
+from .description import get_alert_description, parse_description
+from .timeparse import AlertTimeCache
+
+_LOGGER = logging.getLogger(__name__)
+
+VALID_SEVERITIES = {'Minor', 'Moderate', 'Severe', 'Extreme'}
+CARDINAL_LOCATION = "0"
+DEFAULT_COUNTY_CODE = "000"
+NO_TITLE = "No Title for this Alert!"
+MAX_LOCATION_CODES = 31  # SAME allows up to 31 PSSCCC codes per header
+MAX_FILE_STEM_LENGTH = 100
+
+
+@dataclass(frozen=True)
+class HeaderRecord:
+    """EAS header data compiled for one alert."""
+    alert_id: Optional[str]
+    event: str
+    event_code: str
+    location: str
+    locations: Tuple[str, ...]
+    begin_time: datetime
+    end_time: datetime
+    purge_time: str
+    min_header: str
+    full_header: str
+    spoken_title: str
+    file_stem: str
+
+    @property
+    def expires(self) -> Optional[datetime]:
+        """When the header's purge time runs out, or None for alerts without a UTC offset.
+
+        Computed from the alert's own onset rather than the JJJHHMM field,
+        which is written in the alert's offset and does not record it.
+        """
+        if self.begin_time.tzinfo is None:
+            return None
+        issued = self.begin_time.replace(second=0, microsecond=0)
+        return issued + timedelta(hours=int(self.purge_time[:2]), minutes=int(self.purge_time[2:]))
+
+
+def calculate_purge_time(purge_diff: int) -> str:
+    """Round an alert duration in minutes to a SAME purge time (HHMM)."""
+    if purge_diff > MAX_PURGE_DIFFERENCE:
+        return "9930"
+    elif purge_diff >= HOUR_IN_MINUTES:
+        hours, minutes = divmod(purge_diff, HOUR_IN_MINUTES)
+        if purge_diff >= MAX_PURGE_DIFFERENCE:
+            minutes = divmod(minutes, MINUTE_IN_SECONDS)[0] * MINUTE_IN_SECONDS
+        else:
+            minutes = divmod(minutes, MINUTE_IN_SECONDS / 2)[0] * (MINUTE_IN_SECONDS / 2)
+        return f"{int(hours):02d}{int(minutes):02d}"
+    else:
+        quarters = divmod(purge_diff, MINUTE_IN_SECONDS / 15)[0] * (MINUTE_IN_SECONDS / 15)
+        return f"00{int(quarters):02d}"
+
+
+def extract_what_section(description: str) -> str:
+    """Extract the WHAT section from weather alert description."""
+    return parse_description(description).what
+
+
+class HeaderCompiler:
+    """Turn alert records (or plain alert dicts) into HeaderRecords in a single pass.
+
+    The registry, ORG, call sign and description setting are bound once, so
+    the per-alert loop only does dictionary lookups, date parsing and string
+    formatting.
+    """
+
+    def __init__(self, registry, org: str, call_sign: str, include_description: bool = False):
+        self.registry = registry
+        self.org = org
+        self.call_sign = call_sign
+        self.include_description = include_description
+        self._times = AlertTimeCache()
+
+    def compile(self, alerts: Iterable) -> List[HeaderRecord]:
+        """Compile every announceable alert; alerts that cannot be encoded are skipped."""
+        records = []
+        skipped = 0
+
+        # Hoist the lookups out of the loop
+        get_event_code = self.registry.get_event_code
+        get_state_code = self.registry.get_state_code
+        header_prefix = "ZCZC-" + self.org + "-"
+        header_suffix = "-" + self.call_sign + "-"
+        include_description = self.include_description
+        alert_times = self._times.get
+
+        for alert in alerts:
+            if alert.get('severity') not in VALID_SEVERITIES:
+                skipped += 1
+                continue
+
+            event = alert.get('event')
+            event_code = get_event_code(event)
+            if not event_code:
+                _LOGGER.debug("Event code not found for event: %s", event)
+                skipped += 1
+                continue
+
+            try:
+                locations = self._locations(alert, get_state_code)
+            except (ValueError, IndexError) as e:
+                _LOGGER.debug("Skipping alert %s that cannot be encoded: %s", alert.get('id'), e)
+                skipped += 1
+                continue
+
+            begin_time, end_time = alert_times(alert)
+            try:
+                duration = int((end_time - begin_time) / timedelta(minutes=1))
+            except TypeError:
+                # Missing ("null") or mixed naive/aware timestamps
+                _LOGGER.debug("Skipping alert %s without usable onset/expiry times", alert.get('id'))
+                skipped += 1
+                continue
+
+            purge_time = calculate_purge_time(duration)
+            issue_time = begin_time.strftime('%j%H%M')
+            location = "-".join(locations)
+            header_times = "+" + purge_time.zfill(4) + "-" + issue_time
+            min_header = header_prefix + event_code + "-" + location + header_times
+
+            spoken_title = alert.get('spoken_title') or alert.get('title') or NO_TITLE
+            if include_description:
+                what_section = get_alert_description(alert).what
+                if what_section:
+                    spoken_title += f". {what_section}"
+
+            records.append(HeaderRecord(
+                alert_id=alert.get('id'),
+                event=event,
+                event_code=event_code,
+                location=location,
+                locations=locations,
+                begin_time=begin_time,
+                end_time=end_time,
+                purge_time=purge_time,
+                min_header=min_header,
+                full_header=min_header + header_suffix,
+                spoken_title=spoken_title,
+                file_stem=self._file_stem(min_header, header_prefix + event_code, locations, header_times),
+            ))
+
+        if skipped:
+            _LOGGER.debug("Compiled %d EAS headers, skipped %d alerts", len(records), skipped)
+        return records
+
+    @classmethod
+    def _locations(cls, alert, get_state_code) -> Tuple[str, ...]:
+        """Return the PSSCCC codes for an alert, capped at the SAME limit.
+
+        Every county in the alert's SAME geocodes is carried, in feed order, so
+        a multi-county warning is encoded and played once. The configured
+        county always goes first so the cap can never drop it, and is added
+        if the feed left it out. Without geocodes the header falls back to
+        the configured location alone.
+        """
+        configured = cls._location(alert.get('zoneid') or "", get_state_code)
+        codes = list(dict.fromkeys(
+            code for code in alert.get('sameCodes') or ()
+            if len(code) == 6 and code.isdigit()
+        ))
+        if not codes:
+            return (configured,)
+        if configured[3:] != DEFAULT_COUNTY_CODE:
+            if configured in codes:
+                codes.remove(configured)
+            codes.insert(0, configured)
+        return tuple(codes[:MAX_LOCATION_CODES])
+
+    @staticmethod
+    def _file_stem(min_header: str, prefix: str, locations: Tuple[str, ...], header_times: str) -> str:
+        """Return a file name stem for the header, hashing long location lists."""
+        if len(min_header) <= MAX_FILE_STEM_LENGTH:
+            return min_header
+        digest = hashlib.sha1("-".join(locations).encode()).hexdigest()[:12]
+        return f"{prefix}-{locations[0]}-{len(locations)}LOC{digest}{header_times}"
+
+    @staticmethod
+    def _location(zoneid: str, get_state_code) -> str:
+        """Build the PSSCCC location code from a "XXZnnn[,XXCnnn]" feed id."""
+        parts = zoneid.split(",")
+        zone = parts[0]
+        if len(zone) < 3:
+            raise ValueError(f"zone '{zone}' has less than 3 characters")
+        zone_state = zone[:2]
+        int(zone[2:].split("Z")[1])  # Reject malformed zone ids
+
+        if len(parts) > 1:
+            county = parts[1]
+            if len(county) < 3:
+                raise ValueError(f"county '{county}' has less than 3 characters")
+            county_code = str(int(county[2:].split("C")[1]))
+        else:
+            # No county in zone ID, use a default county code
+            county_code = DEFAULT_COUNTY_CODE
+
+        return CARDINAL_LOCATION + get_state_code(zone_state).zfill(2) + county_code.zfill(3)
@@ -0,0 +1,261 @@
+"""Push ingestion of CAP alerts from a watched directory or a local HTTP stream.
+
+Both sources hand their active alerts to the shared WeatherAlertsFetcher,
+which merges them with the polled feed and updates every weather sensor
+immediately, so they reach the same alert callback as polled alerts.
+Alerts are routed to entries by their UGC geocodes, so the CAP messages
+must carry them (NWWS and weather.gov CAP do).
+"""
+from __future__ import annotations
+
+import asyncio
+import codecs
+import logging
+import os
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .alerts_fetcher import get_alerts_fetcher
+from .cap import parse_cap, split_cap_documents
+from .const import (
+    DOMAIN, INGEST_DIRECTORY, INGEST_STREAM_URL, CAP_DIRECTORY_SCAN_INTERVAL,
+    CAP_EXPIRY_CHECK_INTERVAL, CAP_STREAM_READ_TIMEOUT, CAP_STREAM_MAX_BACKOFF, CAP_STREAM_MAX_BUFFER,
+)
+from .timeparse import parse_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_INGEST_SOURCES = f"{DOMAIN}_ingest_sources"
+
+
+class CAPAlertSource:
+    """Base class for push sources: tracks active alerts and publishes changes."""
+
+    def __init__(self, hass: HomeAssistant, name: str):
+        self.hass = hass
+        self.name = name
+        self._fetcher = get_alerts_fetcher(hass)
+        self._alerts: Dict[str, dict] = {}
+        self._published: Optional[Tuple[str, ...]] = None
+        self._unsub_expiry: Optional[Callable[[], None]] = None
+
+    async def async_start(self) -> None:
+        self._unsub_expiry = async_track_time_interval(
+            self.hass, self._async_check_expiry, timedelta(seconds=CAP_EXPIRY_CHECK_INTERVAL)
+        )
+
+    async def async_stop(self) -> None:
+        if self._unsub_expiry:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        self._fetcher.remove_source(self.name)
+
+    def _apply(self, features: List[dict]) -> None:
+        """Add alerts, removing any that a Cancel message references."""
+        for feature in features:
+            properties = feature["properties"]
+            for reference in properties.get("references") or ():
+                self._alerts.pop(reference, None)
+            if properties.get("messageType") != "Cancel":
+                self._alerts[properties["id"]] = feature
+
+    def _active(self) -> List[dict]:
+        """Return the alerts that have not expired yet."""
+        now = dt_util.utcnow()
+        active = []
+        for feature in self._alerts.values():
+            expires = parse_datetime(feature["properties"].get("expires"))
+            if expires is not None and expires.tzinfo is not None and expires <= now:
+                continue
+            active.append(feature)
+        return active
+
+    async def _async_publish(self) -> None:
+        """Push the active alerts if the set changed since the last push."""
+        active = self._active()
+        published = tuple(sorted(
+            f"{feature['properties']['id']}|{feature['properties'].get('sent')}" for feature in active
+        ))
+        if published == self._published:
+            return
+        self._published = published
+        await self._fetcher.async_push(self.name, active)
+
+    async def _async_check_expiry(self, _now=None) -> None:
+        await self._async_publish()
+
+
+class DirectoryAlertSource(CAPAlertSource):
+    """Watch a directory for CAP XML files, e.g. written by an NWWS client or SDR decoder.
+
+    Each file may hold one or more alerts. An alert stays active until it
+    expires, is cancelled, or its file is deleted.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str):
+        super().__init__(hass, f"directory:{directory}")
+        self.directory = directory
+        self._files: Dict[str, Tuple[float, List[dict]]] = {}
+        self._unsub_scan: Optional[Callable[[], None]] = None
+
+    async def async_start(self) -> None:
+        await super().async_start()
+        await self._async_scan()
+        self._unsub_scan = async_track_time_interval(
+            self.hass, self._async_scan, timedelta(seconds=CAP_DIRECTORY_SCAN_INTERVAL)
+        )
+
+    async def async_stop(self) -> None:
+        if self._unsub_scan:
+            self._unsub_scan()
+            self._unsub_scan = None
+        await super().async_stop()
+
+    async def _async_scan(self, _now=None) -> None:
+        changed = await self.hass.async_add_executor_job(self._scan)
+        if changed:
+            # Rebuild from every file in name order so cancellations apply in sequence
+            self._alerts = {}
+            for path in sorted(self._files):
+                self._apply(self._files[path][1])
+        await self._async_publish()
+
+    def _scan(self) -> bool:
+        """Parse new or modified files and drop deleted ones; return True if anything changed."""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.lower().endswith(".xml")]
+        except OSError as e:
+            _LOGGER.warning("Could not read CAP directory %s: %s", self.directory, e)
+            return False
+
+        changed = False
+        seen = set()
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            seen.add(path)
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == mtime:
+                continue
+            try:
+                with open(path, encoding="utf-8", errors="replace") as file:
+                    features = parse_cap(file.read())
+            except OSError as e:
+                _LOGGER.warning("Could not read CAP file %s: %s", path, e)
+                continue
+            _LOGGER.debug("Read %d CAP alerts from %s", len(features), path)
+            self._files[path] = (mtime, features)
+            changed = True
+
+        for path in set(self._files) - seen:
+            del self._files[path]
+            changed = True
+        return changed
+
+
+class StreamAlertSource(CAPAlertSource):
+    """Consume a long-lived HTTP response carrying concatenated CAP documents.
+
+    The connection is reopened with exponential backoff when it drops, or
+    when the stream sends more than CAP_STREAM_MAX_BUFFER characters without
+    completing an alert.
+    """
+
+    def __init__(self, hass: HomeAssistant, url: str):
+        super().__init__(hass, f"stream:{url}")
+        self.url = url
+        self._task: Optional[asyncio.Task] = None
+
+    async def async_start(self) -> None:
+        await super().async_start()
+        self._task = self.hass.async_create_background_task(self._async_run(), f"{DOMAIN} {self.name}")
+
+    async def async_stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await super().async_stop()
+
+    async def _async_run(self) -> None:
+        session = self._fetcher.session
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=CAP_STREAM_READ_TIMEOUT)
+        backoff = 1
+        while True:
+            try:
+                async with session.get(self.url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    _LOGGER.debug("Connected to CAP stream %s", self.url)
+                    backoff = 1
+                    # Chunks may split a multi-byte character, so decode across them
+                    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    buffer = ""
+                    async for chunk in response.content.iter_any():
+                        buffer += decoder.decode(chunk)
+                        documents, buffer = split_cap_documents(buffer)
+                        for document in documents:
+                            self._apply(parse_cap(document))
+                        if documents:
+                            await self._async_publish()
+                        if len(buffer) > CAP_STREAM_MAX_BUFFER:
+                            _LOGGER.warning(
+                                "CAP stream %s sent %d characters without a complete alert, reconnecting",
+                                self.url, len(buffer),
+                            )
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.warning("CAP stream %s disconnected: %s", self.url, e)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, CAP_STREAM_MAX_BACKOFF)
+
+
+def _in_config_dir(hass: HomeAssistant, path: str) -> bool:
+    config_dir = os.path.abspath(hass.config.config_dir)
+    return os.path.commonpath((config_dir, path)) == config_dir
+
+
+async def async_setup_ingest_sources(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Start the push sources configured for an entry, sharing sources between entries."""
+    sources: Dict[str, Tuple[CAPAlertSource, Set[str]]] = hass.data.setdefault(DATA_INGEST_SOURCES, {})
+    wanted: List[CAPAlertSource] = []
+
+    directory = (entry.data.get(INGEST_DIRECTORY) or "").strip()
+    if directory:
+        directory = os.path.abspath(hass.config.path(directory))
+        # Paths under the config directory are ours; anything else must be allowlisted
+        if _in_config_dir(hass, directory) or hass.config.is_allowed_path(directory):
+            wanted.append(DirectoryAlertSource(hass, directory))
+        else:
+            _LOGGER.error("CAP directory %s is not in allowlist_external_dirs", directory)
+
+    url = (entry.data.get(INGEST_STREAM_URL) or "").strip()
+    if url:
+        wanted.append(StreamAlertSource(hass, url))
+
+    for source in wanted:
+        if source.name in sources:
+            sources[source.name][1].add(entry.entry_id)
+            continue
+        sources[source.name] = (source, {entry.entry_id})
+        _LOGGER.info("Starting CAP ingestion from %s", source.name)
+        await source.async_start()
+
+
+async def async_unload_ingest_sources(hass: HomeAssistant, entry_id: str) -> None:
+    """Stop the push sources no other entry uses."""
+    sources: Dict[str, Tuple[CAPAlertSource, Set[str]]] = hass.data.get(DATA_INGEST_SOURCES, {})
+    for name, (source, entry_ids) in list(sources.items()):
+        entry_ids.discard(entry_id)
+        if not entry_ids:
+            del sources[name]
+            await source.async_stop()
@@ -0,0 +1,113 @@
+"""Adaptive polling of the shared weather alerts feed."""
+from __future__ import annotations
+
+import logging
+import random
+from typing import Callable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN, POLL_INTERVAL_URGENT, POLL_INTERVAL_ACTIVE, POLL_INTERVAL_IDLE,
+    POLL_BACKOFF_MAX, POLL_JITTER, POLL_START_DELAY,
+)
+from .alerts_fetcher import WeatherAlertsFetcher, get_alerts_fetcher
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+
+URGENT_SEVERITIES = {"Severe", "Extreme"}
+URGENT_URGENCIES = {"Immediate"}
+
+
+def _is_urgent(alert) -> bool:
+    return alert.get("severity") in URGENT_SEVERITIES or alert.get("urgency") in URGENT_URGENCIES
+
+
+class AlertPollScheduler:
+    """Poll the shared feed quickly while dangerous alerts are active and slowly when idle.
+
+    One cycle refreshes the fetcher once and then updates every registered
+    weather sensor from that response. Rate limiting (429), server errors
+    and network failures double the delay up to ``POLL_BACKOFF_MAX``, and a
+    Retry-After header is honoured. Every delay is jittered so that polls do
+    not line up with other clients.
+    """
+
+    def __init__(self, hass: HomeAssistant, fetcher: WeatherAlertsFetcher):
+        self.hass = hass
+        self.fetcher = fetcher
+        self.failures = 0
+        self._polling = False
+        self._stopped = False
+        self._unsub: Optional[Callable[[], None]] = None
+
+    def async_start(self) -> None:
+        """Schedule the first poll."""
+        self.async_request_poll()
+
+    def async_stop(self) -> None:
+        """Cancel the pending poll and keep an in-flight poll from rescheduling."""
+        self._stopped = True
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+
+    def async_request_poll(self) -> None:
+        """Poll soon, e.g. after a new entry registered its feed."""
+        if not self._polling and not self._stopped:
+            self._schedule(random.uniform(0, POLL_START_DELAY))
+
+    def _schedule(self, delay: float) -> None:
+        if self._unsub:
+            self._unsub()
+        self._unsub = async_call_later(self.hass, delay, self._async_poll)
+
+    async def _async_poll(self, _now=None) -> None:
+        """Refresh the shared feed and push it to every weather sensor."""
+        self._unsub = None
+        self._polling = True
+        try:
+            await self.fetcher.async_refresh()
+            await self.fetcher.async_update_owners()
+        except Exception as e:
+            _LOGGER.error("Error polling weather alerts: %s", e)
+        finally:
+            self._polling = False
+        if self._stopped:
+            # Stopped while this poll was in flight; do not re-arm
+            return
+        delay = self.next_interval()
+        _LOGGER.debug("Next weather alerts poll in %.0f seconds", delay)
+        self._schedule(delay)
+
+    def next_interval(self) -> float:
+        """Return the jittered delay before the next poll."""
+        fetcher = self.fetcher
+        if fetcher.error is not None or fetcher.status == 429 or (fetcher.status or 0) >= 500:
+            self.failures += 1
+            interval = min(POLL_BACKOFF_MAX, POLL_INTERVAL_ACTIVE * 2 ** self.failures)
+            if fetcher.retry_after:
+                interval = min(POLL_BACKOFF_MAX, max(interval, fetcher.retry_after))
+        else:
+            self.failures = 0
+            alerts = [alert for sensor in fetcher.owners for alert in sensor.alerts]
+            if any(_is_urgent(alert) for alert in alerts):
+                interval = POLL_INTERVAL_URGENT
+            elif alerts:
+                interval = POLL_INTERVAL_ACTIVE
+            else:
+                interval = POLL_INTERVAL_IDLE
+        return interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+
+def get_poll_scheduler(hass: HomeAssistant) -> AlertPollScheduler:
+    """Return the scheduler shared by all entries, starting it on first use."""
+    scheduler = hass.data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = AlertPollScheduler(hass, get_alerts_fetcher(hass))
+        hass.data[DATA_POLL_SCHEDULER] = scheduler
+        scheduler.async_start()
+    return scheduler
@@ -0,0 +1,62 @@
+"""Indexed lookups over the SAME and FIPS code tables."""
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Any, Optional
+
+from .eventcodes import get_same_data, get_fips_data
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shared registry instance, built once from the cached code tables
+_REGISTRY: Optional[EASCodeRegistry] = None
+
+
+class EASCodeRegistry:
+    """Dictionary-backed view of the SAME event and FIPS state tables."""
+
+    def __init__(self, same_data: List[Dict[str, Any]], fips_data: List[Dict[str, Any]]):
+        self.event_codes: Dict[str, str] = {}
+        self.event_levels: Dict[str, str] = {}
+        self.state_codes: Dict[str, str] = {}
+
+        # First entry wins, matching the order of the old linear scans
+        for item in same_data:
+            description = item.get("Event Description")
+            code = item.get("Event Code")
+            if description and code:
+                self.event_codes.setdefault(description, code)
+            if code:
+                self.event_levels.setdefault(code, item.get("Event Level", ""))
+
+        for item in fips_data:
+            state = item.get("State")
+            if state:
+                self.state_codes.setdefault(state, item.get("State Code", ""))
+
+    def get_event_code(self, event: Optional[str]) -> str:
+        """Return the SAME event code for an NWS event name, or an empty string."""
+        return self.event_codes.get(event, "")
+
+    def get_event_level(self, event_code: Optional[str]) -> str:
+        """Return the event level (WRN, WCH, ADV, TEST) for a SAME event code."""
+        return self.event_levels.get(event_code, "")
+
+    def get_state_code(self, state: Optional[str], default: str = "00") -> str:
+        """Return the FIPS state code for a two-letter state abbreviation."""
+        return self.state_codes.get(state, default)
+
+
+async def get_registry() -> EASCodeRegistry:
+    """Return the shared code registry, building it on first use."""
+    global _REGISTRY
+
+    if _REGISTRY is None:
+        _REGISTRY = EASCodeRegistry(await get_same_data(), await get_fips_data())
+        _LOGGER.debug(
+            "Built EAS code registry: %d events, %d states",
+            len(_REGISTRY.event_codes),
+            len(_REGISTRY.state_codes),
+        )
+
+    return _REGISTRY
@@ -0,0 +1,126 @@
+"""Vectorized NumPy encoder for SAME (Specific Area Message Encoding) headers.
+
+SAME data is sent as AFSK at 520 5/6 baud. A one bit (mark) is four
+cycles of 2083 1/3 Hz and a zero bit (space) is three cycles of 1562.5 Hz.
+Every byte goes out least significant bit first. Each burst is sixteen
+0xAB preamble bytes followed by the ASCII header, and each burst is sent
+three times with one second of silence after it.
+
+The bit waveforms and preamble are computed once per sample rate. A
+header is then built by gathering rows from the bit table and
+concatenating them with the cached preamble. The attention tone and End
+of Message come from the shared tone cache in eas_audio. Apart from the
+plain constants in const.py the module only depends on NumPy, so it can
+also be benchmarked outside Home Assistant.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .const import EAS_SAMPLE_RATE
+
+SAME_BAUD = 3125 / 6
+MARK_FREQUENCY = SAME_BAUD * 4
+SPACE_FREQUENCY = SAME_BAUD * 3
+PREAMBLE_BYTE = 0xAB
+PREAMBLE_LENGTH = 16
+BURST_COUNT = 3
+BURST_GAP = 1.0  # seconds of silence after each burst
+MAX_HEADER_LENGTH = 268  # ZCZC header with the full 31 location codes
+
+DEFAULT_AMPLITUDE = 10 ** (-3 / 20)  # -3 dBFS, the level EASGen uses for mark and space
+
+_ENCODERS: Dict[int, SAMEEncoder] = {}
+
+
+def frame_bytes(header: str) -> bytes:
+    """Return the byte framing of one burst: the preamble followed by the ASCII header."""
+    return bytes([PREAMBLE_BYTE]) * PREAMBLE_LENGTH + header.encode("ascii")
+
+
+def frame_bits(header: str) -> np.ndarray:
+    """Return the transmitted bit sequence of one burst, least significant bit first."""
+    return np.unpackbits(np.frombuffer(frame_bytes(header), dtype=np.uint8), bitorder="little")
+
+
+class SAMEEncoder:
+    """Encode SAME headers into 16-bit PCM at a fixed sample rate."""
+
+    def __init__(self, sample_rate: int = EAS_SAMPLE_RATE, amplitude: float = DEFAULT_AMPLITUDE):
+        self.sample_rate = sample_rate
+        self.amplitude = amplitude
+        self.samples_per_bit = sample_rate / SAME_BAUD
+
+        # Bits rarely span a whole number of samples, so each bit boundary is
+        # rounded from the ideal timeline. Precompute those boundaries for the
+        # longest possible burst.
+        max_bits = (PREAMBLE_LENGTH + MAX_HEADER_LENGTH) * 8
+        edges = np.rint(np.arange(max_bits + 1) * self.samples_per_bit).astype(np.int64)
+        self._bit_starts = edges[:-1]
+        self._bit_lengths = np.diff(edges)
+
+        # Row 0 is the space waveform and row 1 the mark waveform. Both hold a
+        # whole number of cycles per bit, so every bit starts at phase zero.
+        width = int(self._bit_lengths.max())
+        n = np.arange(width)
+        scale = self.amplitude * 32767
+        self._bit_table = np.rint(np.stack((
+            scale * np.sin(2 * np.pi * SPACE_FREQUENCY * n / sample_rate),
+            scale * np.sin(2 * np.pi * MARK_FREQUENCY * n / sample_rate),
+        ))).astype(np.int16)
+
+        self.preamble = self._modulate(frame_bits(""), 0)
+        self.gap = np.zeros(int(round(BURST_GAP * sample_rate)), dtype=np.int16)
+
+    def _modulate(self, bits: np.ndarray, first_bit: int) -> np.ndarray:
+        """Gather the waveform for a run of bits starting at an absolute bit position."""
+        lengths = self._bit_lengths[first_bit:first_bit + len(bits)]
+        starts = self._bit_starts[first_bit:first_bit + len(bits)]
+        offset = starts[0] if len(starts) else 0
+        rows = np.repeat(bits, lengths)
+        cols = np.arange(int(lengths.sum())) - np.repeat(starts - offset, lengths)
+        return self._bit_table[rows, cols]
+
+    def burst(self, header: str) -> np.ndarray:
+        """Return a single burst: the cached preamble followed by the modulated header."""
+        data = header.encode("ascii")
+        if len(data) > MAX_HEADER_LENGTH:
+            raise ValueError(f"SAME header longer than {MAX_HEADER_LENGTH} characters")
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+        return np.concatenate((self.preamble, self._modulate(bits, PREAMBLE_LENGTH * 8)))
+
+    def encoded_length(self, header: str) -> int:
+        """Return the number of samples encode() produces for a header."""
+        burst_length = int(self._bit_lengths[:(PREAMBLE_LENGTH + len(header)) * 8].sum())
+        return BURST_COUNT * (burst_length + len(self.gap))
+
+    def encode_into(self, out: np.ndarray, header: str, offset: int = 0) -> int:
+        """Write the three bursts, each followed by its gap, into a caller-supplied int16 buffer.
+
+        Returns the number of samples written.
+        """
+        burst = self.burst(header)
+        position = offset
+        for _ in range(BURST_COUNT):
+            out[position:position + len(burst)] = burst
+            position += len(burst)
+            out[position:position + len(self.gap)] = 0
+            position += len(self.gap)
+        return position - offset
+
+    def encode(self, header: str) -> np.ndarray:
+        """Return the three bursts as a new int16 array."""
+        out = np.empty(self.encoded_length(header), dtype=np.int16)
+        self.encode_into(out, header)
+        return out
+
+
+def get_encoder(sample_rate: int = EAS_SAMPLE_RATE) -> SAMEEncoder:
+    """Return the shared encoder for a sample rate, building its tables on first use."""
+    encoder: Optional[SAMEEncoder] = _ENCODERS.get(sample_rate)
+    if encoder is None:
+        encoder = SAMEEncoder(sample_rate)
+        _ENCODERS[sample_rate] = encoder
+    return encoder
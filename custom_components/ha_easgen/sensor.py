@@ -2,8 +2,6 @@
 Enhanced sensor platform for EAS Generator with individual alert sensors and automatic EAS.
 """
 import logging
-import json
-import os
 import asyncio
 from datetime import datetime, timezone
 from homeassistant.config_entries import ConfigEntry
@@ -11,18 +9,39 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 from .const import (
     STATE, ZONE, COUNTY, DOMAIN, MAX_ALERTS, ALERT_TRACK_FILE, 
     ALERT_SENSOR_PREFIX, ALERTS_SUMMARY_SENSOR, ALERT_ICONS,
-    SEVERITY_LEVELS, TTS_ENGINE, CALL_SIGN, MEDIA_PLAYERS,
-    DISABLE_TTS, INCLUDE_DESCRIPTION, TTS_WARNINGS, TTS_WATCHES, TTS_STATEMENTS
+    SEVERITY_LEVELS, URGENCY_LEVELS, TTS_ENGINE, CALL_SIGN, MEDIA_PLAYERS,
+    DISABLE_TTS, INCLUDE_DESCRIPTION, TTS_WARNINGS, TTS_WATCHES, TTS_STATEMENTS,
+    RENDER_CONCURRENCY, DEFAULT_RENDER_CONCURRENCY, ALERT_SNAPSHOT_SAVE_DELAY,
+    ALERT_REMOVAL_GRACE
 )
 from .weather_alerts import EASGenWeatherAlertsSensor
+from .registry import get_registry
+from .alert import Alert
+from .alert_diff import AlertDiffer, RemovalCircuitBreaker, alert_key
+from .description import get_alert_description
+from .ingest import async_setup_ingest_sources
+from .audio_cache import get_header_cache
+from .tts_cache import DATA_TTS_CACHE
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _alert_priority(alert):
+    """Sort key placing the most severe, most urgent alerts first."""
+    severity = alert.get("severity")
+    urgency = alert.get("urgency")
+    return (
+        -SEVERITY_LEVELS.index(severity) if severity in SEVERITY_LEVELS else 1,
+        URGENCY_LEVELS.index(urgency) if urgency in URGENCY_LEVELS else len(URGENCY_LEVELS),
+    )
+
+
 class EASAnnouncementQueue:
     """Queue manager for EAS announcements to prevent overlapping."""
     
@@ -145,6 +164,9 @@ async def async_setup_entry(
     # Create alert management coordinator
     alert_coordinator = EASAlertCoordinator(hass, config_entry, weather_sensor)
     
+    # Show the last known alerts right away, before the first poll completes
+    await alert_coordinator.async_restore_snapshot()
+    
     # Store coordinator in hass data for TTS platform access
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
@@ -164,6 +186,9 @@ async def async_setup_entry(
     
     # Start the alert coordinator
     await alert_coordinator.async_start()
+    
+    # Start any configured push sources (CAP directory or local stream)
+    await async_setup_ingest_sources(hass, config_entry)
 
 
 class EASAlertCoordinator:
@@ -178,15 +203,67 @@ class EASAlertCoordinator:
         self.alert_sensors = {}
         self.summary_sensor = None
         self.tts_engine = None  # Will be set by TTS entity when it's created
+        self.registry = None  # Shared SAME/FIPS lookups, loaded in async_start
+        self._differ = AlertDiffer()
+        self._breaker = RemovalCircuitBreaker()
+        self._unsub_recheck = None
+        self.restored_renders = []  # Render metadata from the snapshot, handed to the TTS engine
+        # Shared by every render batch so overlapping polls stay within the configured limit
+        self._render_limit = max(1, int(config_entry.data.get(RENDER_CONCURRENCY, DEFAULT_RENDER_CONCURRENCY)))
+        self._render_semaphore = asyncio.Semaphore(self._render_limit)
+        self._render_tasks = set()
         
         # Alert tracking storage
         self.store = Store(hass, 1, f"{DOMAIN}_{config_entry.entry_id}_alert_tracking")
+        self.snapshot_store = Store(hass, 1, f"{DOMAIN}_{config_entry.entry_id}_alert_snapshot")
         
         # Initialize announcement queue
         self.announcement_queue = EASAnnouncementQueue(hass)
         
+    async def async_restore_snapshot(self):
+        """Restore the last known good alerts and their render metadata."""
+        data = await self.snapshot_store.async_load()
+        if not data:
+            return
+        
+        now = dt_util.utcnow()
+        alerts = []
+        for item in data.get("alerts", []):
+            try:
+                alert = Alert.from_dict(item)
+            except (AttributeError, TypeError) as e:
+                _LOGGER.debug("Skipping unreadable alert in snapshot: %s", e)
+                continue
+            expires = alert.endsExpires
+            if expires is not None and expires.tzinfo is not None and expires <= now:
+                continue
+            alerts.append(alert)
+        
+        self.current_alerts = alerts[:MAX_ALERTS]
+        self._differ.diff(self.current_alerts)
+        self.weather_sensor.restore_alerts(alerts)
+        self.restored_renders = data.get("renders", [])
+        _LOGGER.debug("Restored %d alerts from snapshot", len(self.current_alerts))
+        
+    def _schedule_snapshot_save(self):
+        """Persist the current alerts and their renders after a short delay."""
+        self.snapshot_store.async_delay_save(self._snapshot_data, ALERT_SNAPSHOT_SAVE_DELAY)
+        
+    def _snapshot_data(self):
+        alert_ids = {alert.get("id") for alert in self.current_alerts}
+        if self.tts_engine:
+            renders = self.tts_engine.export_renders(alert_ids)
+        else:
+            renders = [item for item in self.restored_renders if item.get("alert_id") in alert_ids]
+        return {
+            "alerts": [alert.as_dict() for alert in self.current_alerts],
+            "renders": renders,
+        }
+        
     async def async_start(self):
         """Start the alert coordinator."""
+        self.registry = await get_registry()
+        
         # Load previously announced alerts
         data = await self.store.async_load()
         if data:
@@ -198,26 +275,22 @@ class EASAlertCoordinator:
         # Monitor weather sensor for changes by checking periodically
         self._setup_monitoring()
         
+    def async_stop(self):
+        """Cancel a pending re-evaluation of held-back alerts and any running renders."""
+        if self._unsub_recheck:
+            self._unsub_recheck()
+            self._unsub_recheck = None
+        for task in list(self._render_tasks):
+            task.cancel()
+        
     def _setup_monitoring(self):
         """Set up monitoring of weather alerts."""
-        # Create a method to check alerts that will be called by the weather sensor
+        # The poll scheduler updates the weather sensor, which calls back with its alerts
         self.weather_sensor.set_alert_callback(self._process_alerts)
         
-        # Initial check
-        self.hass.async_create_task(self._initial_alert_check())
-        
-    async def _initial_alert_check(self):
-        """Perform initial check of alerts."""
-        await asyncio.sleep(5)  # Give weather sensor time to initialize
-        try:
-            # Only proceed if weather sensor is properly initialized
-            if hasattr(self.weather_sensor, 'hass') and self.weather_sensor.hass:
-                await self.weather_sensor.async_update()
-                if hasattr(self.weather_sensor, '_attr_extra_state_attributes'):
-                    alerts = self.weather_sensor._attr_extra_state_attributes.get("alerts", [])
-                    await self._process_alerts(alerts)
-        except Exception as e:
-            _LOGGER.error("Error in initial alert check: %s", e)
+        # Catch up on a poll that finished before the callback was set
+        if self.weather_sensor.alerts:
+            self.hass.async_create_task(self._process_alerts(self.weather_sensor.alerts))
         
     async def _handle_weather_alert_change(self, event):
         """Handle changes in weather alerts."""
@@ -227,59 +300,94 @@ class EASAlertCoordinator:
         if not new_state or not new_state.attributes:
             return
             
-        new_alerts = new_state.attributes.get("alerts", [])
+        new_alerts = [Alert.from_dict(alert) for alert in new_state.attributes.get("alerts", [])]
         
         # Process new alerts
         await self._process_alerts(new_alerts)
         
     async def _process_alerts(self, alerts):
         """Process new alerts and trigger EAS if needed."""
-        new_alert_ids = []
+        # Keep unexpired alerts that just vanished until their removal is confirmed
+        alerts, held = self._breaker.apply(list(alerts), self.current_alerts, dt_util.utcnow())
+        if held:
+            self._schedule_recheck()
+        alerts = alerts[:MAX_ALERTS]  # Limit to MAX_ALERTS
+        changes = self._differ.diff(alerts)
+        if not changes:
+            _LOGGER.debug("No alert changes")
+            return
         
-        # Update current alerts
-        self.current_alerts = alerts[:MAX_ALERTS]  # Limit to MAX_ALERTS
+        _LOGGER.debug(
+            "Alert changes: %d added, %d updated, %d removed",
+            len(changes.added), len(changes.updated), len(changes.removed),
+        )
         
-        # Check for new alerts that haven't been announced
-        for alert in self.current_alerts:
-            alert_id = alert.get("id", "")
-            if alert_id and alert_id not in self.announced_alerts:
-                new_alert_ids.append(alert_id)
+        # Update current alerts
+        previous_alerts = self.current_alerts
+        self.current_alerts = alerts
+        
+        # Only added alerts can be new; an updated alert was announced when it first appeared
+        new_alerts = []
+        for alert in changes.added:
+            alert_id = alert.get("id")
+            if alert_id not in self.announced_alerts:
+                new_alerts.append(alert)
                 self.announced_alerts.add(alert_id)
                 
         # Save announced alerts
-        await self.store.async_save({"announced_alerts": list(self.announced_alerts)})
+        if new_alerts:
+            await self.store.async_save({"announced_alerts": list(self.announced_alerts)})
         
-        # Update all sensor entities
-        await self._update_sensors()
+        # Update the sensor entities whose alert changed
+        await self._update_sensors(previous_alerts)
+        self._schedule_snapshot_save()
         
         # Trigger EAS for new alerts
-        if new_alert_ids:
-            await self._trigger_eas_for_new_alerts(new_alert_ids)
+        if new_alerts:
+            await self._trigger_eas_for_new_alerts(new_alerts)
             
-    async def _update_sensors(self):
-        """Update all alert sensor entities."""
+    def _schedule_recheck(self):
+        """Re-evaluate held-back alerts once the removal grace period has passed."""
+        if self._unsub_recheck:
+            self._unsub_recheck()
+        
+        async def _recheck(_now):
+            self._unsub_recheck = None
+            await self._process_alerts(self.weather_sensor.alerts)
+        
+        self._unsub_recheck = async_call_later(self.hass, ALERT_REMOVAL_GRACE, _recheck)
+        
+    async def _update_sensors(self, previous_alerts=None):
+        """Update the summary sensor and the alert sensors whose slot changed."""
         # Update summary sensor
         if self.summary_sensor:
             self.summary_sensor.async_write_ha_state()
             
         # Update individual alert sensors
-        for sensor in self.alert_sensors.values():
+        for alert_number, sensor in self.alert_sensors.items():
+            if previous_alerts is not None:
+                index = alert_number - 1
+                old = previous_alerts[index] if index < len(previous_alerts) else None
+                new = self.current_alerts[index] if index < len(self.current_alerts) else None
+                if alert_key(old) == alert_key(new):
+                    continue
             sensor.async_write_ha_state()
             
-    async def _trigger_eas_for_new_alerts(self, alert_ids):
+    async def _trigger_eas_for_new_alerts(self, alerts):
         """Trigger EAS announcements and UI notifications for new alerts."""
-        _LOGGER.info("Triggering EAS for new alerts: %s", alert_ids)
+        _LOGGER.info("Triggering EAS for new alerts: %s", [alert.get("id") for alert in alerts])
         
-        for alert_id in alert_ids:
-            alert = next((a for a in self.current_alerts if a.get("id") == alert_id), None)
-            if not alert:
-                continue
-                
-            # Create UI notification
+        # Notifications are cheap, post them all before any audio is rendered
+        for alert in alerts:
             await self._create_ui_notification(alert)
-            
-            # Trigger EAS announcement
-            await self._trigger_eas_announcement(alert)
+        
+        # Render every announcement from this poll as one batch in the background,
+        # so the poll cycle finishes without waiting for TTS
+        task = self.hass.async_create_background_task(
+            self._trigger_eas_announcements(alerts), f"{DOMAIN} render {self.config_entry.entry_id}"
+        )
+        self._render_tasks.add(task)
+        task.add_done_callback(self._render_tasks.discard)
             
     async def _create_ui_notification(self, alert):
         """Create a persistent notification for the alert."""
@@ -316,35 +424,28 @@ class EASAlertCoordinator:
         """Determine event type based on SAME cache lookup."""
         # First try to get the NWS event code from the alert data
         event_code = None
-        if "eventCode" in alert and "NationalWeatherService" in alert["eventCode"]:
-            event_codes = alert["eventCode"]["NationalWeatherService"]
+        event_code_map = alert.get("eventCode") or {}
+        if "NationalWeatherService" in event_code_map:
+            event_codes = event_code_map["NationalWeatherService"]
             if isinstance(event_codes, list) and len(event_codes) > 0:
                 event_code = event_codes[0]
         
-        # If we have an event code, look it up in the SAME cache
-        if event_code:
-            try:
-                # Load SAME cache
-                same_cache_path = os.path.join(os.path.dirname(__file__), "cache", "SAME_cache.json")
-                with open(same_cache_path, 'r') as f:
-                    same_cache = json.load(f)
-                
-                # Find the event in the cache
-                for item in same_cache:
-                    if item.get("Event Code") == event_code:
-                        event_level = item.get("Event Level", "")
-                        # Map event level to our categories
-                        if event_level == "WRN":
-                            return "warning"
-                        elif event_level == "WCH":
-                            return "watch"
-                        elif event_level == "ADV":
-                            return "statement"
-                        elif event_level == "TEST":
-                            return "statement"  # Skip test messages by default
-                        break
-            except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                _LOGGER.warning("Error loading SAME cache: %s", e)
+        # Otherwise map the event name to its SAME code
+        if not event_code and self.registry:
+            event_code = self.registry.get_event_code(alert.get("event"))
+
+        # If we have an event code, look up its level in the SAME registry
+        if event_code and self.registry:
+            event_level = self.registry.get_event_level(event_code)
+            # Map event level to our categories
+            if event_level == "WRN":
+                return "warning"
+            elif event_level == "WCH":
+                return "watch"
+            elif event_level == "ADV":
+                return "statement"
+            elif event_level == "TEST":
+                return "statement"  # Skip test messages by default
         
         # Fallback: try to determine by event name
         event = alert.get("event", "")
@@ -359,13 +460,8 @@ class EASAlertCoordinator:
         # Default to warning for unknown types
         return "warning"
         
-    async def _trigger_eas_announcement(self, alert):
-        """Trigger EAS announcement using queue system for proper sequencing."""
-        # Check if TTS is disabled
-        if self.config_entry.data.get(DISABLE_TTS, False):
-            _LOGGER.info("TTS is disabled, skipping EAS announcement")
-            return
-            
+    async def _announcement_enabled(self, alert):
+        """Check whether TTS is enabled for this alert's event type."""
         # Determine event type and check if TTS is enabled for this type
         event_type = await self._get_event_type(alert)
         event_name = alert.get("event", "Unknown")
@@ -381,6 +477,13 @@ class EASAlertCoordinator:
             
         if not tts_enabled:
             _LOGGER.info("TTS is disabled for event type '%s' (event: %s), skipping EAS announcement", event_type, event_name)
+        return tts_enabled
+        
+    async def _trigger_eas_announcements(self, alerts):
+        """Render announcements concurrently and queue them most severe first."""
+        # Check if TTS is disabled
+        if self.config_entry.data.get(DISABLE_TTS, False):
+            _LOGGER.info("TTS is disabled, skipping EAS announcement")
             return
             
         media_players = self.config_entry.data.get(MEDIA_PLAYERS, [])
@@ -389,35 +492,55 @@ class EASAlertCoordinator:
             _LOGGER.warning("No media players configured for EAS announcements")
             return
         
+        if not self.tts_engine:
+            _LOGGER.error("TTS engine not available for alerts: %s", [a.get("event", "Unknown") for a in alerts])
+            return
+        
+        # Sorted before the tasks start so the most severe alerts get the first render slots
+        candidates = [alert for alert in sorted(alerts, key=_alert_priority) if await self._announcement_enabled(alert)]
+        if not candidates:
+            return
+        
+        limit = self._render_limit
+        semaphore = self._render_semaphore
+        
+        async def render(alert):
+            async with semaphore:
+                return await self.tts_engine.render(alert)
+        
+        tasks = [asyncio.create_task(render(alert)) for alert in candidates]
+        _LOGGER.debug("Rendering %d EAS announcements with concurrency %d", len(tasks), limit)
+        
         try:
-            # Use the TTS engine directly from the coordinator
-            if self.tts_engine:
-                # Generate the audio URL and get duration using the TTS engine
-                audio_url = await self.tts_engine.get_audio_url(alert)
-                
-                if audio_url:
-                    # Get the audio duration from the TTS engine
-                    audio_duration = await self.tts_engine.get_audio_duration(alert)
-                    
-                    _LOGGER.debug("Adding EAS announcement to queue for %s (duration: %ss)", event_name, audio_duration)
-                    
-                    # Add to queue for sequential processing
-                    await self.announcement_queue.add_announcement(
-                        alert=alert,
-                        audio_url=audio_url,
-                        media_players=media_players,
-                        audio_duration=audio_duration
-                    )
+            # Queue in severity order; each alert is queued as soon as it and every more severe alert are ready
+            for alert, task in zip(candidates, tasks):
+                event_name = alert.get("event", "Unknown")
+                try:
+                    # Render the alert once; the result carries both the URL and the duration
+                    render_result = await task
                     
-                    _LOGGER.info("EAS announcement queued for %s (%s) on media players: %s", 
-                                event_name, event_type, media_players)
-                else:
-                    _LOGGER.error("Failed to generate audio URL for alert: %s", event_name)
-            else:
-                _LOGGER.error("TTS engine not available for alert: %s", event_name)
-                
-        except Exception as e:
-            _LOGGER.error("Failed to queue EAS announcement for %s: %s", event_name, e)
+                    if render_result:
+                        _LOGGER.debug("Adding EAS announcement to queue for %s (duration: %ss)", event_name, render_result.duration)
+                        
+                        # Add to queue for sequential processing
+                        await self.announcement_queue.add_announcement(
+                            alert=alert,
+                            audio_url=render_result.url,
+                            media_players=media_players,
+                            audio_duration=render_result.duration
+                        )
+                        
+                        _LOGGER.info("EAS announcement queued for %s on media players: %s", event_name, media_players)
+                    else:
+                        _LOGGER.error("Failed to generate audio URL for alert: %s", event_name)
+                        
+                except Exception as e:
+                    _LOGGER.error("Failed to queue EAS announcement for %s: %s", event_name, e)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Record the new renders so a restart does not render these alerts again
+            self._schedule_snapshot_save()
         
     def register_summary_sensor(self, sensor):
         """Register the summary sensor."""
@@ -479,7 +602,7 @@ class EASAlertsSummarySensor(SensorEntity):
         """Return additional state attributes."""
         severity_counts = self.coordinator.get_severity_counts()
         
-        return {
+        attributes = {
             "total_alerts": self.coordinator.get_alert_count(),
             "severe_count": severity_counts.get("severe", 0),
             "extreme_count": severity_counts.get("extreme", 0),
@@ -487,7 +610,13 @@ class EASAlertsSummarySensor(SensorEntity):
             "minor_count": severity_counts.get("minor", 0),
             "alerts_active": "Yes" if self.coordinator.get_alert_count() > 0 else "No",
             "integration": "ha_easgen_enhanced",
+            # Shared render caches, to check the configured sizes are effective
+            "header_cache": get_header_cache().stats(),
         }
+        tts_cache = self.hass.data.get(DATA_TTS_CACHE) if self.hass else None
+        if tts_cache is not None:
+            attributes["tts_cache"] = tts_cache.stats()
+        return attributes
         
     @property
     def device_info(self):
@@ -544,9 +673,9 @@ class EASIndividualAlertSensor(SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return alert details as attributes."""
-        alert = self.coordinator.get_alert(self.alert_number)
+        record = self.coordinator.get_alert(self.alert_number)
         
-        if not alert:
+        if not record:
             return {
                 "alert_id": None,
                 "alert_event": None,
@@ -560,11 +689,20 @@ class EASIndividualAlertSensor(SensorEntity):
                 "alert_effective": None,
                 "alert_expires": None,
                 "alert_title": None,
+                "alert_what": None,
+                "alert_where": None,
+                "alert_when": None,
+                "alert_impacts": None,
+                "alert_additional_details": None,
                 "spoken_title": None,
                 "display_title": None,
                 "display_message": None,
             }
             
+        # State attributes keep the legacy dict layout
+        alert = record.as_dict()
+        sections = get_alert_description(record)
+        
         # Generate spoken title
         spoken_title = f"Attention! Weather alert for {alert.get('area', 'your area')}. {alert.get('title', alert.get('event', 'Weather alert'))}."
         
@@ -600,6 +738,11 @@ class EASIndividualAlertSensor(SensorEntity):
             "alert_effective": alert.get("effective"),
             "alert_expires": alert.get("expires"),
             "alert_title": alert.get("title"),
+            "alert_what": sections.what or None,
+            "alert_where": sections.where or None,
+            "alert_when": sections.when or None,
+            "alert_impacts": sections.impacts or None,
+            "alert_additional_details": sections.additional_details or None,
             "spoken_title": spoken_title,
             "display_title": alert.get("title", alert.get("event")),
             "display_message": display_message,
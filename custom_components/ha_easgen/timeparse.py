@@ -0,0 +1,68 @@
+"""Fast timestamp parsing for NWS alert fields."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+from dateutil import parser
+
+# Placeholders the weather sensor writes for missing values
+MISSING_VALUES = {"", "null", "None"}
+
+ALERT_TIME_CACHE_SIZE = 512
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """Parse an alert timestamp, trying strict ISO-8601 before falling back to dateutil.
+
+    Returns None for missing values, including the literal "null" placeholder.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if value in MISSING_VALUES:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+class AlertTimeCache:
+    """Memoize parsed onset/end times per alert id."""
+
+    def __init__(self, max_entries: int = ALERT_TIME_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[Tuple, Tuple[Optional[datetime], Optional[datetime]]]] = OrderedDict()
+
+    def get(self, alert: dict) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Return (begin, end) for an alert.
+
+        Begin is the onset, falling back to effective and then sent. End is
+        endsExpires, falling back to expires. Either may be None.
+        """
+        raw = (
+            alert.get('onset'), alert.get('effective'), alert.get('sent'),
+            alert.get('endsExpires'), alert.get('expires'),
+        )
+        alert_id = alert.get('id')
+        cached = self._entries.get(alert_id) if alert_id else None
+        if cached is not None and cached[0] == raw:
+            self._entries.move_to_end(alert_id)
+            return cached[1]
+
+        onset, effective, sent, ends_expires, expires = raw
+        begin = parse_datetime(onset) or parse_datetime(effective) or parse_datetime(sent)
+        end = parse_datetime(ends_expires) or parse_datetime(expires)
+
+        if alert_id:
+            self._entries[alert_id] = (raw, (begin, end))
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return begin, end
@@ -3,7 +3,6 @@ Setting up TTS entity.
 """
 import logging
 import asyncio
-import pydub
 from homeassistant.components.tts import TextToSpeechEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,6 +12,8 @@ from .const import DOMAIN, CALL_SIGN, UNIQUE_ID, ORG, STATE, ZONE, COUNTY, TTS_E
 from .version import __version__ as VERSION
 from .eas_gen_tts_engine import EASGenTTSEngine
 from .weather_alerts import EASGenWeatherAlertsSensor
+from .assembler import AudioAssembler
+from .alert import Alert
 from urllib.parse import quote
 
 from homeassistant.exceptions import MaxLengthExceeded
@@ -50,7 +51,8 @@ async def async_setup_entry(
         config_entry.data[CALL_SIGN],
         config_entry.data[VOICE],
         config_entry.data[LANGUAGE],
-        config_entry
+        config_entry,
+        coordinator.registry
     )
     
     # Register the TTS entity with coordinator access
@@ -59,6 +61,8 @@ async def async_setup_entry(
     # Store engine reference in coordinator for easier access
     if coordinator:
         coordinator.tts_engine = engine
+        # Reuse the renders recorded in the last snapshot
+        engine.restore_renders(coordinator.restored_renders)
     
     async_add_entities([tts_entity])
     _LOGGER.info("EAS TTS entity created successfully: %s", tts_entity.entity_id)
@@ -122,9 +126,9 @@ class EASGenTTSEntity(TextToSpeechEntity):
             # Parse the specific alert data from the message
             import json
             try:
-                alert_data = json.loads(message)
+                alert_data = Alert.from_dict(json.loads(message))
                 _LOGGER.debug("Processing specific alert: %s", alert_data.get("event", "Unknown"))
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, AttributeError):
                 _LOGGER.error("Invalid alert data received: %s", message)
                 return None, None
             
@@ -135,39 +139,30 @@ class EASGenTTSEntity(TextToSpeechEntity):
                 _LOGGER.error("No notification data generated for alert")
                 return None, None
             
-            # Initialize an empty AudioSegment to combine all the alerts
-            combined_speech = pydub.AudioSegment.silent(duration=0)
+            # Collect every alert's audio and join it in a single pass at the end
+            combined_speech = AudioAssembler()
             
-            for MinHeader, title, FullHeader in notification_data:
+            for record in notification_data:
+                MinHeader, title, FullHeader = record.min_header, record.spoken_title, record.full_header
                 if len(title) > 4096:
                     raise MaxLengthExceeded
                 
                 _LOGGER.debug("Generating WAV Files")
                 
-                # Generate Header and Footer WAV files (now async)
-                header_wav = await self._engine.get_header_audio(MinHeader, FullHeader)
-                header, header_path = header_wav
-                footer_wav = await self._engine.get_footer_audio(MinHeader)
-                footer, footer_path = footer_wav
-                
-                # Generate TTS for the current alert (now async)
-                generated_speech = await self._engine.get_tts(title, header_path, footer_path)
+                # Generate Header, TTS and Footer audio concurrently
+                parts = await self._engine.get_alert_audio(MinHeader, title, FullHeader, record.expires)
                 
                 # Check if TTS generation was successful
-                if generated_speech is None or generated_speech == (None, None):
-                    _LOGGER.error("TTS generation failed for alert: %s", title)
+                if parts is None:
                     continue
                 
-                tts_message, tts_message_path = generated_speech
+                header, tts_message, footer = parts
 
-                # Combine the header, TTS message, and footer for the current alert
-                speech = header + tts_message + footer
-                
-                # Append the current alert's speech to the combined speech
-                combined_speech += speech
+                # Append the header, TTS message, and footer for the current alert
+                combined_speech.extend((header, tts_message, footer))
             
             # Return the combined speech as a single WAV file
-            return b"wav", combined_speech.export(format="wav").read()
+            return b"wav", await asyncio.to_thread(combined_speech.to_wav_bytes)
     
         except MaxLengthExceeded:
             _LOGGER.error("Maximum length of the message exceeded")
@@ -0,0 +1,174 @@
+"""Persistent cache of spoken TTS phrases."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES, TTS_CACHE_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TTS_CACHE = f"{DOMAIN}_tts_cache"
+DATA_TTS_CACHE_LOCK = f"{DATA_TTS_CACHE}_lock"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different renderings share a cache entry."""
+    return " ".join(text.split())
+
+
+def make_key(engine: str, language: str, voice: str, text: str) -> str:
+    """Return the cache key for a phrase spoken by a given engine, language and voice."""
+    raw = "\x1f".join((engine or "", language or "", voice or "", normalize_text(text)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSPhraseCache:
+    """Disk-backed LRU of TTS audio keyed by engine, language, voice and text."""
+
+    def __init__(self, hass: HomeAssistant, max_bytes: int = TTS_CACHE_MAX_BYTES):
+        self.hass = hass
+        self.max_bytes = max_bytes
+        self.directory = hass.config.path(".storage", TTS_CACHE_DIR)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._store = Store(hass, 1, f"{DOMAIN}_tts_cache")
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the cache index and drop entries whose audio file is gone."""
+        data = await self._store.async_load() or {}
+        entries = sorted(data.get("entries", {}).items(), key=lambda item: item[1].get("used", 0))
+
+        await self.hass.async_add_executor_job(os.makedirs, self.directory, 0o755, True)
+        existing = set(await self.hass.async_add_executor_job(os.listdir, self.directory))
+
+        for key, entry in entries:
+            if entry.get("file") in existing:
+                self._entries[key] = entry
+                self.size += entry.get("size", 0)
+
+        _LOGGER.debug("Loaded TTS phrase cache: %d entries, %d bytes", len(self._entries), self.size)
+
+    async def async_get(self, engine: str, language: str, voice: str, text: str) -> Optional[bytes]:
+        """Return cached audio bytes for a phrase, or None on a miss."""
+        key = make_key(engine, language, voice, text)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            data = await self.hass.async_add_executor_job(_read_file, self._path(entry["file"]))
+        except OSError as e:
+            _LOGGER.debug("Cached TTS audio unreadable, dropping entry: %s", e)
+            async with self._lock:
+                self._drop(key)
+            self.misses += 1
+            return None
+
+        entry["used"] = time.time()
+        self._entries.move_to_end(key)
+        self._schedule_save()
+        self.hits += 1
+        return data
+
+    async def async_put(self, engine: str, language: str, voice: str, text: str, data: bytes, extension: str = "mp3") -> None:
+        """Store audio bytes for a phrase, evicting least recently used entries over the quota."""
+        if len(data) > self.max_bytes:
+            return
+
+        key = make_key(engine, language, voice, text)
+        entry = {"file": f"{key}.{extension or 'bin'}", "size": len(data), "used": time.time()}
+
+        async with self._lock:
+            await self.hass.async_add_executor_job(_write_file, self._path(entry["file"]), data)
+            if key in self._entries:
+                self._drop(key, remove_file=False)
+            self._entries[key] = entry
+            self.size += entry["size"]
+
+            evicted = []
+            while self.size > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                evicted.append(self._drop(oldest, remove_file=False)["file"])
+                self.evictions += 1
+            if evicted:
+                await self.hass.async_add_executor_job(self._remove_files, evicted)
+
+        self._schedule_save()
+
+    async def async_remove(self, engine: str, language: str, voice: str, text: str) -> None:
+        """Drop a phrase whose cached audio turned out to be unusable."""
+        key = make_key(engine, language, voice, text)
+        async with self._lock:
+            if key in self._entries:
+                self._drop(key)
+        self._schedule_save()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current usage."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def _drop(self, key: str, remove_file: bool = True) -> Dict[str, Any]:
+        entry = self._entries.pop(key)
+        self.size -= entry.get("size", 0)
+        if remove_file:
+            self.hass.async_add_executor_job(self._remove_files, [entry["file"]])
+        return entry
+
+    def _remove_files(self, filenames) -> None:
+        for filename in filenames:
+            try:
+                os.remove(self._path(filename))
+            except FileNotFoundError:
+                pass
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: {"entries": dict(self._entries)}, TTS_CACHE_SAVE_DELAY)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+async def async_get_tts_cache(hass: HomeAssistant) -> TTSPhraseCache:
+    """Return the TTS phrase cache shared by all entries, loading it on first use."""
+    cache = hass.data.get(DATA_TTS_CACHE)
+    if cache is not None:
+        return cache
+    # Callers racing on first use wait for one load instead of seeing a half-ready instance
+    async with hass.data.setdefault(DATA_TTS_CACHE_LOCK, asyncio.Lock()):
+        cache = hass.data.get(DATA_TTS_CACHE)
+        if cache is None:
+            cache = TTSPhraseCache(hass)
+            await cache.async_load()
+            hass.data[DATA_TTS_CACHE] = cache
+    return cache
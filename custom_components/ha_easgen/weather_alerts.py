@@ -8,22 +8,23 @@ import aiohttp
 import async_timeout
 from homeassistant.core import HomeAssistant
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from homeassistant.const import __version__
 
-from .const import WEATHER_API_URL, WEATHER_ID_CHECK_URL, ID_CHECK_ERRORS
+from .const import WEATHER_API_URL, WEATHER_ID_CHECK_URL, WEATHER_ID_CHECK_TIMEOUT, ID_CHECK_ERRORS, HOME_FILTER
+from .alert import Alert
+from .alerts_fetcher import HEADERS, get_alerts_fetcher
+from .geo_filter import HomeLocationFilter
+from .poll_scheduler import get_poll_scheduler
+from .zone_cache import async_get_zone_cache
 
 _LOGGER = logging.getLogger(__name__)
 
-HEADERS = {
-    "accept": "application/json",
-    "user-agent": f"HomeAssistant/{__version__}",
-}
-
 
 class EASGenWeatherAlertsSensor(SensorEntity):
     """Internal weather alerts sensor for EAS Generator."""
 
+    # Updated by the shared poll scheduler instead of Home Assistant's fixed interval
+    _attr_should_poll = False
+
     def __init__(self, hass: HomeAssistant, state: str, zone: str, county: str = "", config_entry=None):
         """Initialize the weather alerts sensor."""
         self.hass = hass
@@ -31,12 +32,20 @@ class EASGenWeatherAlertsSensor(SensorEntity):
         self.zone_config = zone
         self.county_config = county
         self.config_entry = config_entry
-        self.session = async_create_clientsession(hass)
+        self._fetcher = get_alerts_fetcher(hass)
+        self.session = self._fetcher.session
         self._attr_native_value = 0
         self.connected = True
         self.exception = None
         self._attr_extra_state_attributes = {}
+        self.alerts = []
         self._alert_callback = None
+        # Generation of the shared feed the current alerts were built from
+        self._generation = None
+        # Optional polygon filter against the Home Assistant home location
+        self._home_filter = None
+        if config_entry and config_entry.data.get(HOME_FILTER):
+            self._home_filter = HomeLocationFilter(hass.config.latitude, hass.config.longitude)
         
         # Process zone configuration
         zone_formatted = zone
@@ -76,185 +85,177 @@ class EASGenWeatherAlertsSensor(SensorEntity):
         self._attr_unique_id = f"ha_easgen_weather_alerts_{self.feedid}".replace(",", "")
 
     async def async_validate_ids(self):
-        """Validate zone and county IDs with weather.gov."""
-        try:
-            # Check zone ID
-            zone_check_url = WEATHER_ID_CHECK_URL.format(self.zoneid)
-            _LOGGER.debug("Validating zone ID '%s' with URL: %s", self.zoneid, zone_check_url)
-            async with async_timeout.timeout(20):
-                zone_check_response = await self.session.get(
-                    zone_check_url,
-                    headers=HEADERS
-                )
-                _LOGGER.debug("Zone validation response status: %s", zone_check_response.status)
-                zone_data = await zone_check_response.text()
-                _LOGGER.debug("Zone validation response length: %d chars", len(zone_data))
-                
-                if any(id_error in zone_data for id_error in ID_CHECK_ERRORS):
-                    _LOGGER.error("Zone ID validation failed - found error in response for '%s'", self.zoneid)
-                    raise ValueError(f"Invalid zone ID '{self.zoneid}'")
-                _LOGGER.debug("Zone ID '%s' validation successful", self.zoneid)
-
-            # Check county ID if provided
-            if self.countyid:
-                county_check_url = WEATHER_ID_CHECK_URL.format(self.countyid)
-                _LOGGER.debug("Validating county ID '%s' with URL: %s", self.countyid, county_check_url)
-                async with async_timeout.timeout(20):
-                    county_check_response = await self.session.get(
-                        county_check_url,
-                        headers=HEADERS
-                    )
-                    _LOGGER.debug("County validation response status: %s", county_check_response.status)
-                    county_data = await county_check_response.text()
-                    _LOGGER.debug("County validation response length: %d chars", len(county_data))
-                    
-                    if any(id_error in county_data for id_error in ID_CHECK_ERRORS):
-                        _LOGGER.error("County ID validation failed - found error in response for '%s'", self.countyid)
-                        raise ValueError(f"Invalid county ID '{self.countyid}'")
-                    _LOGGER.debug("County ID '%s' validation successful", self.countyid)
-
-            # Get the actual name from the API
-            alerts_url = WEATHER_API_URL.format(self.zoneid)
-            _LOGGER.debug("Getting zone name from alerts API with URL: %s", alerts_url)
-            async with async_timeout.timeout(20):
-                response = await self.session.get(
-                    alerts_url,
-                    headers=HEADERS
+        """Validate zone and county IDs, trusting earlier validations from the cache.
+
+        When every id has been validated before, setup continues right away
+        and expired entries are rechecked in the background. Otherwise the
+        checks run concurrently and an invalid id raises ValueError.
+        """
+        cache = await async_get_zone_cache(self.hass)
+        ids = [self.zoneid] + ([self.countyid] if self.countyid else [])
+        entries = [cache.get(zone_id) for zone_id in ids]
+
+        if all(entries):
+            if entries[0].get("name"):
+                self._name = entries[0]["name"]
+            _LOGGER.debug("Using cached validation for %s", ", ".join(ids))
+            if any(cache.is_stale(zone_id) for zone_id in ids):
+                self.hass.async_create_background_task(
+                    self._async_revalidate(cache), f"{self.feedid} zone validation"
                 )
-                _LOGGER.debug("Zone name lookup response status: %s", response.status)
-                data = await response.json()
-                _LOGGER.debug("Zone name lookup response keys: %s", list(data.keys()) if isinstance(data, dict) else "Not a dict")
-                
-                if "status" in data and data["status"] == 404:
-                    _LOGGER.error("Zone ID '%s' not found (404 status)", self.zoneid)
-                    raise ValueError(f"Zone ID '{self.zoneid}' not found")
-                
-                if "title" in data:
-                    original_name = data["title"]
-                    parsed_name = original_name.split("advisories for ")[1].split(" (")[0]
-                    _LOGGER.debug("Zone name parsed from '%s' to '%s'", original_name, parsed_name)
-                    self._name = parsed_name
-                else:
-                    _LOGGER.warning("No 'title' field found in zone name response")
+            return
 
+        try:
+            await self._async_check_ids(cache)
         except Exception as e:
             _LOGGER.error("Failed to validate zone/county IDs: %s", e)
             raise
 
-    async def async_update(self):
-        """Update weather alerts data."""
+    async def _async_revalidate(self, cache):
+        """Recheck expired cached ids without holding up setup."""
+        try:
+            await self._async_check_ids(cache)
+        except ValueError as e:
+            _LOGGER.error("Configured zone/county is no longer valid: %s", e)
+        except Exception as e:
+            _LOGGER.warning("Could not revalidate zone/county IDs, keeping cached result: %s", e)
+
+    async def _async_check_ids(self, cache):
+        """Run the zone, county and zone name checks concurrently and cache the results."""
+        checks = [self._async_check_id("Zone", self.zoneid), self._async_get_zone_name()]
+        if self.countyid:
+            checks.append(self._async_check_id("County", self.countyid))
+        results = await asyncio.gather(*checks, return_exceptions=True)
+
+        for zone_id, result in zip([self.zoneid, self.zoneid, self.countyid], results):
+            if isinstance(result, ValueError):
+                cache.async_remove(zone_id)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        name = results[1]
+        if name:
+            self._name = name
+        cache.async_set_valid(self.zoneid, name)
+        if self.countyid:
+            cache.async_set_valid(self.countyid)
+
+    async def _async_check_id(self, kind, zone_id):
+        """Check one zone or county id against the weather.gov lookup."""
+        check_url = WEATHER_ID_CHECK_URL.format(zone_id)
+        _LOGGER.debug("Validating %s ID '%s' with URL: %s", kind.lower(), zone_id, check_url)
+        async with async_timeout.timeout(WEATHER_ID_CHECK_TIMEOUT):
+            response = await self.session.get(
+                check_url,
+                headers=HEADERS
+            )
+            _LOGGER.debug("%s validation response status: %s", kind, response.status)
+            data = await response.text()
+            _LOGGER.debug("%s validation response length: %d chars", kind, len(data))
+
+        if any(id_error in data for id_error in ID_CHECK_ERRORS):
+            _LOGGER.error("%s ID validation failed - found error in response for '%s'", kind, zone_id)
+            raise ValueError(f"Invalid {kind.lower()} ID '{zone_id}'")
+        _LOGGER.debug("%s ID '%s' validation successful", kind, zone_id)
+
+    async def _async_get_zone_name(self):
+        """Read the zone name from the title of its alerts feed."""
+        alerts_url = WEATHER_API_URL.format(self.zoneid)
+        _LOGGER.debug("Getting zone name from alerts API with URL: %s", alerts_url)
+        async with async_timeout.timeout(WEATHER_ID_CHECK_TIMEOUT):
+            response = await self.session.get(
+                alerts_url,
+                headers=HEADERS
+            )
+            _LOGGER.debug("Zone name lookup response status: %s", response.status)
+            data = await response.json()
+            _LOGGER.debug("Zone name lookup response keys: %s", list(data.keys()) if isinstance(data, dict) else "Not a dict")
+
+        if "status" in data and data["status"] == 404:
+            _LOGGER.error("Zone ID '%s' not found (404 status)", self.zoneid)
+            raise ValueError(f"Zone ID '{self.zoneid}' not found")
+
+        if "title" not in data:
+            _LOGGER.warning("No 'title' field found in zone name response")
+            return None
+        original_name = data["title"]
+        parsed_name = original_name.split("advisories for ")[1].split(" (")[0]
+        _LOGGER.debug("Zone name parsed from '%s' to '%s'", original_name, parsed_name)
+        return parsed_name
+
+    async def async_update(self, refresh=True):
+        """Update weather alerts data.
+
+        With refresh=False the alerts are rebuilt from what the shared
+        fetcher already holds, e.g. after a push source delivered alerts.
+        """
         alerts = []
 
         try:
-            alerts_api_url = WEATHER_API_URL.format(self.feedid)
-            _LOGGER.debug("[%s] Fetching weather alerts from URL: %s", self.feedid, alerts_api_url)
-            async with async_timeout.timeout(10):
-                response = await self.session.get(
-                    alerts_api_url,
-                    headers=HEADERS
+            if refresh:
+                _LOGGER.debug("[%s] Fetching weather alerts", self.feedid)
+                status, generation, features = await self._fetcher.async_fetch(self.feedid)
+            else:
+                status, generation, features = self._fetcher.current(self.feedid)
+            _LOGGER.debug("[%s] Weather alerts API response status: %s", self.feedid, status)
+
+            if status != 200:
+                self._attr_native_value = "unavailable"
+                _LOGGER.warning(
+                    "[%s] API outage - unable to download from weather.gov - HTTP status %s",
+                    self.feedid,
+                    status
+                )
+                return
+
+            if generation == self._generation:
+                # Feed unchanged since the last poll; keep the current alerts
+                _LOGGER.debug("[%s] Weather alerts not modified", self.feedid)
+                self._attr_native_value = len(self.alerts)
+                self.connected = True
+                return
+
+            if self._home_filter:
+                features = self._home_filter.filter(features)
+
+            features_count = len(features)
+            _LOGGER.debug("[%s] Found %d alert features in response", self.feedid, features_count)
+
+            for i, alert in enumerate(features):
+                properties = alert["properties"]
+
+                # Log basic alert info
+                alert_event = properties.get("event", "Unknown")
+                alert_severity = properties.get("severity", "Unknown")
+                alert_id = properties.get("id", "Unknown")
+                _LOGGER.debug("[%s] Processing alert %d/%d: %s (Severity: %s, ID: %s)",
+                            self.feedid, i+1, features_count, alert_event, alert_severity, alert_id)
+
+                alerts.append(Alert.from_properties(properties, self.feedid))
+
+            # Sort alerts by ID
+            alerts.sort(key=lambda x: x.id or "", reverse=True)
+            _LOGGER.debug("[%s] Processed and sorted %d alerts", self.feedid, len(alerts))
+
+            for sorted_alert in alerts:
+                _LOGGER.debug(
+                    "[%s] Alert ID: %s",
+                    self.feedid,
+                    sorted_alert.id
                 )
-                _LOGGER.debug("[%s] Weather alerts API response status: %s", self.feedid, response.status)
-                
-                if response.status != 200:
-                    self._attr_native_value = "unavailable"
-                    _LOGGER.warning(
-                        "[%s] API outage - unable to download from weather.gov - HTTP status %s",
-                        self.feedid,
-                        response.status
-                    )
-                    return
-
-                data = await response.json()
-                _LOGGER.debug("[%s] Weather alerts API response keys: %s", self.feedid, list(data.keys()) if isinstance(data, dict) else "Not a dict")
-
-                if data.get("features") is not None:
-                    features_count = len(data["features"])
-                    _LOGGER.debug("[%s] Found %d alert features in response", self.feedid, features_count)
-                    
-                    for i, alert in enumerate(data["features"]):
-                        if alert.get("properties") is not None:
-                            properties = alert["properties"]
-                            
-                            # Log basic alert info
-                            alert_event = properties.get("event", "Unknown")
-                            alert_severity = properties.get("severity", "Unknown")
-                            alert_id = properties.get("id", "Unknown")
-                            _LOGGER.debug("[%s] Processing alert %d/%d: %s (Severity: %s, ID: %s)", 
-                                        self.feedid, i+1, features_count, alert_event, alert_severity, alert_id)
-                            
-                            # Set endsExpires field
-                            if properties["ends"] is None:
-                                properties["endsExpires"] = properties.get("expires", "null")
-                            else:
-                                properties["endsExpires"] = properties.get("ends", "null")
-                            
-                            # Format alert data
-                            alert_data = {
-                                "area": properties.get("areaDesc", "null"),
-                                "certainty": properties.get("certainty", "null"),
-                                "description": properties.get("description", "null"),
-                                "ends": properties.get("ends", "null"),
-                                "event": properties.get("event", "null"),
-                                "instruction": properties.get("instruction", "null"),
-                                "response": properties.get("response", "null"),
-                                "sent": properties.get("sent", "null"),
-                                "severity": properties.get("severity", "null"),
-                                "title": properties.get("headline", "null").split(" by ")[0],
-                                "urgency": properties.get("urgency", "null"),
-                                "NWSheadline": properties["parameters"].get("NWSheadline", "null"),
-                                "hailSize": properties["parameters"].get("hailSize", "null"),
-                                "windGust": properties["parameters"].get("windGust", "null"),
-                                "waterspoutDetection": properties["parameters"].get("waterspoutDetection", "null"),
-                                "effective": properties.get("effective", "null"),
-                                "expires": properties.get("expires", "null"),
-                                "endsExpires": properties.get("endsExpires", "null"),
-                                "onset": properties.get("onset", "null"),
-                                "status": properties.get("status", "null"),
-                                "messageType": properties.get("messageType", "null"),
-                                "category": properties.get("category", "null"),
-                                "sender": properties.get("sender", "null"),
-                                "senderName": properties.get("senderName", "null"),
-                                "id": properties.get("id", "null"),
-                                "zoneid": self.feedid,
-                            }
-                            
-                            # Add spoken_title for compatibility
-                            if "headline" in properties:
-                                alert_data["spoken_title"] = properties["headline"].split(" by ")[0]
-                            
-                            alerts.append(alert_data)
-                        else:
-                            _LOGGER.debug("[%s] Alert %d/%d has no properties, skipping", self.feedid, i+1, features_count)
-                else:
-                    _LOGGER.debug("[%s] No 'features' field found in API response", self.feedid)
-
-                # Sort alerts by ID
-                alerts.sort(key=lambda x: (x['id']), reverse=True)
-                _LOGGER.debug("[%s] Processed and sorted %d alerts", self.feedid, len(alerts))
-
-                for sorted_alert in alerts:
-                    _LOGGER.debug(
-                        "[%s] Alert ID: %s",
-                        self.feedid,
-                        sorted_alert.get("id", "null")
-                    )
-
-                self._attr_native_value = len(alerts)
-                self._attr_extra_state_attributes = {
-                    "alerts": alerts,
-                    "integration": "ha_easgen_internal",  # Mark as internal
-                    "state": self.zone_state,
-                    "zone": self.feedid,
-                }
-                _LOGGER.debug("[%s] Weather alerts update completed - %d alerts found", self.feedid, len(alerts))
-                
-                # Notify callback if registered and entity is properly initialized
-                if self._alert_callback and self.hass:
-                    try:
-                        await self._alert_callback(alerts)
-                    except Exception as callback_error:
-                        _LOGGER.error("Error in alert callback: %s", callback_error)
-                
+
+            self._set_alerts(alerts)
+            self._generation = generation
+            _LOGGER.debug("[%s] Weather alerts update completed - %d alerts found", self.feedid, len(alerts))
+            
+            # Notify callback if registered and entity is properly initialized
+            if self._alert_callback and self.hass:
+                try:
+                    await self._alert_callback(alerts)
+                except Exception as callback_error:
+                    _LOGGER.error("Error in alert callback: %s", callback_error)
+            
         except Exception as e:
             self.exception = sys.exc_info()[0].__name__
             self.connected = False
@@ -265,6 +266,35 @@ class EASGenWeatherAlertsSensor(SensorEntity):
         if not self.connected:
             self._attr_native_value = "unavailable"
             
+    async def async_added_to_hass(self):
+        """Include this feed in the shared alerts request and poll it soon."""
+        self._fetcher.register(self, self.feedid)
+        get_poll_scheduler(self.hass).async_request_poll()
+
+    async def async_will_remove_from_hass(self):
+        """Drop this feed from the shared alerts request."""
+        self._fetcher.unregister(self)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes, converting the alert records to dicts."""
+        if not self._attr_extra_state_attributes:
+            return self._attr_extra_state_attributes
+        return {"alerts": [alert.as_dict() for alert in self.alerts], **self._attr_extra_state_attributes}
+
+    def _set_alerts(self, alerts):
+        self.alerts = alerts
+        self._attr_native_value = len(alerts)
+        self._attr_extra_state_attributes = {
+            "integration": "ha_easgen_internal",  # Mark as internal
+            "state": self.zone_state,
+            "zone": self.feedid,
+        }
+
+    def restore_alerts(self, alerts):
+        """Show alerts from the last snapshot until the first poll completes."""
+        self._set_alerts(list(alerts))
+
     def set_alert_callback(self, callback):
         """Set callback function to be called when alerts are updated."""
         self._alert_callback = callback
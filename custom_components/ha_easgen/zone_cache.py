@@ -0,0 +1,72 @@
+"""Persistent cache of validated weather.gov zone and county ids."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ZONE_CACHE_TTL, ZONE_CACHE_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ZONE_CACHE = f"{DOMAIN}_zone_cache"
+DATA_ZONE_CACHE_LOCK = f"{DATA_ZONE_CACHE}_lock"
+
+
+class ZoneValidationCache:
+    """Remember which zone/county ids weather.gov accepted, and the zone names.
+
+    Only successful validations are stored. An entry older than
+    ``ZONE_CACHE_TTL`` is still trusted at startup but should be revalidated.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._zones: Dict[str, Dict[str, Any]] = {}
+        self._store = Store(hass, 1, f"{DOMAIN}_zone_validation")
+
+    async def async_load(self) -> None:
+        """Load the persisted validations."""
+        data = await self._store.async_load() or {}
+        self._zones = data.get("zones", {})
+
+    def get(self, zone_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached validation for an id, if any."""
+        return self._zones.get(zone_id)
+
+    def is_stale(self, zone_id: str) -> bool:
+        """Return True if an id was never validated or its validation has expired."""
+        entry = self._zones.get(zone_id)
+        if entry is None:
+            return True
+        checked = dt_util.parse_datetime(entry.get("checked", ""))
+        return checked is None or dt_util.utcnow() - checked > timedelta(days=ZONE_CACHE_TTL)
+
+    def async_set_valid(self, zone_id: str, name: Optional[str] = None) -> None:
+        """Record a successful validation."""
+        self._zones[zone_id] = {"name": name, "checked": dt_util.utcnow().isoformat()}
+        self._store.async_delay_save(lambda: {"zones": dict(self._zones)}, ZONE_CACHE_SAVE_DELAY)
+
+    def async_remove(self, zone_id: str) -> None:
+        """Forget an id that weather.gov no longer accepts."""
+        if self._zones.pop(zone_id, None) is not None:
+            self._store.async_delay_save(lambda: {"zones": dict(self._zones)}, ZONE_CACHE_SAVE_DELAY)
+
+
+async def async_get_zone_cache(hass: HomeAssistant) -> ZoneValidationCache:
+    """Return the validation cache shared by all entries, loading it on first use."""
+    cache = hass.data.get(DATA_ZONE_CACHE)
+    if cache is not None:
+        return cache
+    async with hass.data.setdefault(DATA_ZONE_CACHE_LOCK, asyncio.Lock()):
+        cache = hass.data.get(DATA_ZONE_CACHE)
+        if cache is None:
+            cache = ZoneValidationCache(hass)
+            await cache.async_load()
+            hass.data[DATA_ZONE_CACHE] = cache
+    return cache
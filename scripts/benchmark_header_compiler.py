@@ -0,0 +1,74 @@
+"""Micro-benchmark for compiling alerts into EAS headers.
+
+Usage: python scripts/benchmark_header_compiler.py [alert_count] [repeats]
+
+Compiles synthetic NWS alerts with the HeaderCompiler and reports the best
+time per batch. The integration's modules are loaded without running the
+package __init__, so Home Assistant does not need to be installed.
+"""
+import asyncio
+import importlib
+import os
+import random
+import sys
+import timeit
+import types
+from datetime import datetime, timedelta, timezone
+
+PACKAGE_DIR = os.path.join(os.path.dirname(__file__), "..", "custom_components", "ha_easgen")
+
+EVENTS = [
+    "Tornado Warning", "Severe Thunderstorm Warning", "Flash Flood Warning",
+    "Tornado Watch", "Winter Storm Warning", "Dense Fog Advisory", "Heat Advisory",
+]
+SEVERITIES = ["Minor", "Moderate", "Severe", "Extreme"]
+
+
+def load_package():
+    package = types.ModuleType("ha_easgen")
+    package.__path__ = [PACKAGE_DIR]
+    sys.modules["ha_easgen"] = package
+    return (
+        importlib.import_module("ha_easgen.header_compiler"),
+        importlib.import_module("ha_easgen.registry"),
+    )
+
+
+def synthetic_alerts(count):
+    rng = random.Random(0)
+    start = datetime(2025, 5, 1, tzinfo=timezone(timedelta(hours=-5)))
+    alerts = []
+    for i in range(count):
+        onset = start + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+        ends = onset + timedelta(minutes=rng.randrange(15, 60 * 48))
+        alerts.append({
+            "id": f"urn:oid:2.49.0.1.840.0.{i:040x}",
+            "event": rng.choice(EVENTS),
+            "severity": rng.choice(SEVERITIES),
+            "title": "Synthetic alert issued for benchmarking",
+            "description": "* WHAT...Synthetic conditions.\n\n* WHERE...Somewhere.\n\n* WHEN...Now.",
+            "onset": onset.isoformat(),
+            "endsExpires": ends.isoformat(),
+            "zoneid": f"TXZ{rng.randrange(1, 300):03d},TXC{rng.randrange(1, 500):03d}",
+        })
+    return alerts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    header_compiler, registry = load_package()
+
+    compiler = header_compiler.HeaderCompiler(
+        asyncio.run(registry.get_registry()), "EAS", "KF5NTR", include_description=True
+    )
+    alerts = synthetic_alerts(count)
+    records = compiler.compile(alerts)
+
+    best = min(timeit.repeat(lambda: compiler.compile(alerts), number=1, repeat=repeats))
+    print(f"Compiled {len(records)}/{count} alerts")
+    print(f"Best of {repeats}: {best * 1000:.1f} ms per batch, {best / count * 1e6:.1f} us per alert")
+
+
+if __name__ == "__main__":
+    main()
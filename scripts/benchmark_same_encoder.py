@@ -0,0 +1,87 @@
+"""Benchmark the NumPy SAME encoder against EASGen and check their framing.
+
+Usage: python scripts/benchmark_same_encoder.py [iterations]
+
+Both encoders render the same header. Each burst is demodulated bit by bit
+and the recovered bit streams are compared, so any framing difference
+(preamble, byte order, bit order) shows up before the timings are
+printed. EASGen (and pydub) must be installed for the comparison. The
+NumPy encoder is loaded from its source file, with the integration
+directory registered as a bare package so that its relative import of
+const.py resolves without running the Home Assistant setup in
+__init__.py.
+"""
+import importlib.util
+import os
+import sys
+import timeit
+import types
+
+import numpy as np
+
+PACKAGE_PATH = os.path.join(os.path.dirname(__file__), "..", "custom_components", "ha_easgen")
+ENCODER_PATH = os.path.join(PACKAGE_PATH, "same_encoder.py")
+HEADER = "ZCZC-EAS-TOR-048113+0045-2911530-KF5NTR-"
+SAMPLE_RATE = 24000
+
+
+def load_encoder_module():
+    package = types.ModuleType("ha_easgen")
+    package.__path__ = [PACKAGE_PATH]
+    sys.modules.setdefault("ha_easgen", package)
+    spec = importlib.util.spec_from_file_location("ha_easgen.same_encoder", ENCODER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def demodulate(samples, starts, lengths, module):
+    """Recover bits by comparing mark and space energy in each bit window."""
+    bits = np.empty(len(starts), dtype=np.uint8)
+    for i, (start, length) in enumerate(zip(starts, lengths)):
+        window = samples[start:start + length].astype(float)
+        n = np.arange(length)
+        mark = abs(np.dot(window, np.exp(-2j * np.pi * module.MARK_FREQUENCY * n / SAMPLE_RATE)))
+        space = abs(np.dot(window, np.exp(-2j * np.pi * module.SPACE_FREQUENCY * n / SAMPLE_RATE)))
+        bits[i] = mark > space
+    return bits
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    module = load_encoder_module()
+    encoder = module.get_encoder(SAMPLE_RATE)
+    bit_count = len(module.frame_bits(HEADER))
+
+    numpy_bits = demodulate(
+        encoder.burst(HEADER), encoder._bit_starts[:bit_count], encoder._bit_lengths[:bit_count], module
+    )
+    print(f"NumPy framing matches SAME spec: {np.array_equal(numpy_bits, module.frame_bits(HEADER))}")
+
+    numpy_time = timeit.timeit(lambda: encoder.encode(HEADER), number=iterations) / iterations
+    print(f"NumPy encoder: {numpy_time * 1000:.2f} ms per header")
+
+    try:
+        from EASGen import EASGen
+    except ImportError:
+        print("EASGen not installed, skipping comparison")
+        return
+
+    # EASGen truncates each bit to a whole number of samples
+    easgen_burst = np.frombuffer(EASGen.genHeader(HEADER, sampleRate=SAMPLE_RATE).raw_data, dtype=np.int16)
+    bit_length = int(1000 / 520.83 * (SAMPLE_RATE / 1000.0))
+    starts = np.arange(bit_count) * bit_length
+    easgen_bits = demodulate(easgen_burst, starts, np.full(bit_count, bit_length), module)
+    print(f"Framing identical to EASGen: {np.array_equal(numpy_bits, easgen_bits)}")
+
+    easgen_time = timeit.timeit(
+        lambda: EASGen.genEAS(header=HEADER, attentionTone=False, endOfMessage=False, sampleRate=SAMPLE_RATE),
+        number=iterations,
+    ) / iterations
+    print(f"EASGen:        {easgen_time * 1000:.2f} ms per header")
+    print(f"Speedup:       {easgen_time / numpy_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
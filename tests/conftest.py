@@ -0,0 +1,16 @@
+"""Shared test setup.
+
+The integration directory is registered as a bare ``ha_easgen`` package, the
+same way scripts/benchmark_same_encoder.py loads it. That way the pure modules
+can be imported without running the Home Assistant setup in ``__init__.py``.
+"""
+import os
+import sys
+import types
+
+PACKAGE_PATH = os.path.join(os.path.dirname(__file__), "..", "custom_components", "ha_easgen")
+
+if "ha_easgen" not in sys.modules:
+    package = types.ModuleType("ha_easgen")
+    package.__path__ = [os.path.abspath(PACKAGE_PATH)]
+    sys.modules["ha_easgen"] = package
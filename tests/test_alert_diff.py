@@ -0,0 +1,86 @@
+"""Tests for the alert differ and the removal circuit breaker."""
+from datetime import datetime, timedelta, timezone
+
+from ha_easgen.alert import Alert
+from ha_easgen.alert_diff import AlertDiffer, RemovalCircuitBreaker, alert_key
+
+NOW = datetime(2025, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_alert(alert_id, sent="2025-05-01T10:00:00+00:00", expires="2025-05-01T14:00:00+00:00"):
+    return Alert.from_properties(
+        {"id": alert_id, "event": "Tornado Warning", "sent": sent, "expires": expires},
+        "TXZ103",
+    )
+
+
+def test_alert_key_uses_id_and_sent():
+    alert = make_alert("a")
+    assert alert_key(alert) == ("a", alert.sent)
+    assert alert_key(None) is None
+
+
+def test_first_diff_reports_everything_added():
+    changes = AlertDiffer().diff([make_alert("a"), make_alert("b")])
+    assert [alert.id for alert in changes.added] == ["a", "b"]
+    assert changes.updated == () and changes.removed == ()
+
+
+def test_unchanged_poll_is_falsy():
+    differ = AlertDiffer()
+    differ.diff([make_alert("a")])
+    assert not differ.diff([make_alert("a")])
+
+
+def test_new_sent_time_is_an_update_and_missing_id_is_removed():
+    differ = AlertDiffer()
+    differ.diff([make_alert("a"), make_alert("b")])
+    changes = differ.diff([make_alert("a", sent="2025-05-01T11:00:00+00:00"), make_alert("c")])
+    assert [alert.id for alert in changes.added] == ["c"]
+    assert [alert.id for alert in changes.updated] == ["a"]
+    assert [alert.id for alert in changes.removed] == ["b"]
+
+
+def test_alerts_without_id_and_duplicates_are_ignored():
+    changes = AlertDiffer().diff([make_alert(None), make_alert("a"), make_alert("a")])
+    assert [alert.id for alert in changes.added] == ["a"]
+
+
+def test_breaker_holds_vanished_alert_within_grace(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("ha_easgen.alert_diff.time.monotonic", lambda: clock[0])
+    breaker = RemovalCircuitBreaker(grace=180)
+    previous = [make_alert("a")]
+
+    alerts, held = breaker.apply([], previous, NOW)
+    assert held and [alert.id for alert in alerts] == ["a"]
+
+    clock[0] += 179
+    alerts, held = breaker.apply([], previous, NOW)
+    assert held
+
+    clock[0] += 1
+    alerts, held = breaker.apply([], previous, NOW)
+    assert not held and alerts == []
+
+
+def test_breaker_drops_expired_alert_immediately():
+    breaker = RemovalCircuitBreaker(grace=180)
+    previous = [make_alert("a", expires=(NOW - timedelta(minutes=1)).isoformat())]
+    alerts, held = breaker.apply([], previous, NOW)
+    assert not held and alerts == []
+
+
+def test_breaker_forgets_alert_that_returns(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("ha_easgen.alert_diff.time.monotonic", lambda: clock[0])
+    breaker = RemovalCircuitBreaker(grace=180)
+    previous = [make_alert("a")]
+
+    breaker.apply([], previous, NOW)
+    clock[0] += 170
+    breaker.apply(previous, previous, NOW)
+    clock[0] += 170
+    # The grace period restarts once the alert came back
+    alerts, held = breaker.apply([], previous, NOW)
+    assert held and [alert.id for alert in alerts] == ["a"]
@@ -0,0 +1,47 @@
+"""Tests for one-pass audio assembly."""
+import io
+
+import pytest
+
+pydub = pytest.importorskip("pydub")
+
+from ha_easgen.assembler import AudioAssembler  # noqa: E402
+
+
+def tone(frequency, milliseconds, frame_rate, channels=1, sample_width=2):
+    from pydub.generators import Sine
+
+    segment = Sine(frequency, sample_rate=frame_rate, bit_depth=sample_width * 8).to_audio_segment(duration=milliseconds)
+    return segment.set_channels(channels)
+
+
+def test_matches_pydub_concatenation():
+    header = tone(853, 300, 24000)
+    speech = tone(440, 500, 22050, channels=2)
+    footer = tone(960, 200, 24000, sample_width=1)
+    expected = header + speech + footer
+
+    assembled = AudioAssembler([header, speech, footer]).to_segment()
+    assert assembled.raw_data == expected.raw_data
+    assert (assembled.frame_rate, assembled.channels, assembled.sample_width) == (
+        expected.frame_rate, expected.channels, expected.sample_width,
+    )
+
+
+def test_wav_output_and_duration():
+    header, speech, footer = tone(853, 300, 24000), tone(440, 500, 24000), tone(960, 200, 24000)
+    assembler = AudioAssembler().extend([header, speech, footer])
+
+    decoded = pydub.AudioSegment.from_wav(io.BytesIO(assembler.encode("wav")))
+    assert decoded.raw_data == (header + speech + footer).raw_data
+    assert assembler.duration == pytest.approx(1.0)
+    assert len(assembler) == 1000
+
+
+def test_empty_assembler():
+    assert AudioAssembler().duration == 0.0
+
+
+def test_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        AudioAssembler([tone(440, 10, 24000)]).encode("xyz")
@@ -0,0 +1,64 @@
+"""Tests for the header audio cache."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pydub = pytest.importorskip("pydub")
+
+from ha_easgen.audio_cache import HeaderAudioCache  # noqa: E402
+
+HEADER = "ZCZC-WXR-TOR-048113+0044-1211530-KF5NTR-"
+
+
+def audio(milliseconds=50):
+    return pydub.AudioSegment.silent(duration=milliseconds, frame_rate=24000)
+
+
+def test_hit_before_expiry_in_any_offset():
+    cache = HeaderAudioCache()
+    # An alert written in -05:00 that purges in an hour is still valid, whatever the local zone
+    expires = datetime.now(timezone(timedelta(hours=-5))) + timedelta(hours=1)
+    cache.put("easgen", HEADER, audio(), expires)
+    assert cache.get("easgen", HEADER) is not None
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_header_is_a_miss():
+    cache = HeaderAudioCache()
+    cache.put("easgen", HEADER, audio(), datetime.now(timezone.utc) - timedelta(seconds=1))
+    assert cache.get("easgen", HEADER) is None
+    assert cache.stats()["misses"] == 1 and len(cache) == 0
+
+
+def test_entries_are_keyed_by_engine():
+    cache = HeaderAudioCache()
+    cache.put("easgen", HEADER, audio())
+    assert cache.get("numpy", HEADER) is None
+    assert cache.get("easgen", HEADER) is not None
+
+
+def test_naive_expiry_is_treated_as_unknown():
+    cache = HeaderAudioCache()
+    cache.put("easgen", HEADER, audio(), datetime(2000, 1, 1))
+    assert cache.get("easgen", HEADER) is not None
+
+
+def test_lru_eviction_and_resize():
+    size = len(audio().raw_data)
+    cache = HeaderAudioCache(max_bytes=size * 2)
+    cache.put("easgen", "A", audio())
+    cache.put("easgen", "B", audio())
+    cache.get("easgen", "A")
+    cache.put("easgen", "C", audio())
+    assert cache.get("easgen", "B") is None
+    assert cache.get("easgen", "A") is not None
+
+    cache.resize(size)
+    assert len(cache) == 1 and cache.size == size
+    assert cache.stats()["evictions"] == 2
+
+
+def test_oversized_audio_is_not_cached():
+    cache = HeaderAudioCache(max_bytes=10)
+    cache.put("easgen", HEADER, audio())
+    assert len(cache) == 0
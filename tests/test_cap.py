@@ -0,0 +1,74 @@
+"""Tests for CAP XML parsing."""
+from ha_easgen.cap import parse_cap, split_cap_documents
+
+CAP_ALERT = """<?xml version="1.0" encoding="UTF-8"?>
+<alert xmlns="urn:oasis:names:tc:emergency:cap:1.2">
+  <identifier>urn:oid:2.49.0.1.840.0.abc</identifier>
+  <sender>w-nws.webmaster@noaa.gov</sender>
+  <sent>2025-05-01T15:30:00-05:00</sent>
+  <status>Actual</status>
+  <msgType>Update</msgType>
+  <references>w-nws.webmaster@noaa.gov,urn:oid:old,2025-05-01T15:00:00-05:00</references>
+  <info>
+    <language>es-US</language>
+    <event>Aviso de Tornado</event>
+  </info>
+  <info>
+    <language>en-US</language>
+    <category>Met</category>
+    <event>Tornado Warning</event>
+    <urgency>Immediate</urgency>
+    <severity>Extreme</severity>
+    <certainty>Observed</certainty>
+    <expires>2025-05-01T16:15:00-05:00</expires>
+    <headline>Tornado Warning issued May 1 by NWS Fort Worth TX</headline>
+    <description>* WHAT...Tornado.</description>
+    <parameter><valueName>NWSheadline</valueName><value>TORNADO WARNING</value></parameter>
+    <area>
+      <areaDesc>Dallas, TX</areaDesc>
+      <polygon>32.0,-97.0 32.5,-97.0 32.5,-96.5 32.0,-97.0</polygon>
+      <geocode><valueName>SAME</valueName><value>048113</value></geocode>
+      <geocode><valueName>UGC</valueName><value>TXC113</value></geocode>
+    </area>
+    <area>
+      <areaDesc>Tarrant, TX</areaDesc>
+      <geocode><valueName>SAME</valueName><value>048439</value></geocode>
+    </area>
+  </info>
+</alert>
+"""
+
+
+def test_maps_cap_onto_weather_gov_properties():
+    (feature,) = parse_cap(CAP_ALERT)
+    properties = feature["properties"]
+    assert properties["id"] == "urn:oid:2.49.0.1.840.0.abc"
+    assert properties["messageType"] == "Update"
+    assert properties["references"] == ["urn:oid:old"]
+    assert properties["event"] == "Tornado Warning"
+    assert properties["severity"] == "Extreme"
+    assert properties["areaDesc"] == "Dallas, TX; Tarrant, TX"
+    assert properties["geocode"] == {"SAME": ["048113", "048439"], "UGC": ["TXC113"]}
+    assert properties["parameters"] == {"NWSheadline": ["TORNADO WARNING"]}
+
+
+def test_polygon_becomes_geojson_lon_lat_ring():
+    (feature,) = parse_cap(CAP_ALERT)
+    assert feature["geometry"] == {
+        "type": "Polygon",
+        "coordinates": [[[-97.0, 32.0], [-97.0, 32.5], [-96.5, 32.5], [-97.0, 32.0]]],
+    }
+
+
+def test_unparseable_or_empty_documents_yield_nothing():
+    assert parse_cap("<alert><identifier>") == []
+    assert parse_cap("<alert><identifier>x</identifier></alert>") == []
+
+
+def test_split_keeps_incomplete_tail():
+    stream = "noise" + CAP_ALERT + CAP_ALERT[:120]
+    documents, rest = split_cap_documents(stream)
+    assert len(documents) == 1
+    assert parse_cap(documents[0])[0]["properties"]["event"] == "Tornado Warning"
+    documents, rest = split_cap_documents(rest + CAP_ALERT[120:])
+    assert len(documents) == 1 and rest.strip() == ""
@@ -0,0 +1,37 @@
+"""Tests for splitting alert descriptions into sections."""
+from ha_easgen.description import EMPTY_DESCRIPTION, parse_description
+
+
+def test_sections_on_their_own_lines():
+    description = "* WHAT...Heavy rain.\n\n* WHERE...Dallas\ncounty.\n\n* WHEN...Until noon.\n\n* IMPACTS...Flooding."
+    parsed = parse_description(description)
+    assert parsed.what == "Heavy rain."
+    assert parsed.where == "Dallas county."
+    assert parsed.when == "Until noon."
+    assert parsed.impacts == "Flooding."
+
+
+def test_marker_in_the_middle_of_a_line():
+    description = "FLOOD WATCH IN EFFECT * WHAT...Flooding caused by rain\nis possible.\n* WHERE...Texas."
+    parsed = parse_description(description)
+    assert parsed.what == "Flooding caused by rain is possible."
+    assert parsed.where == "Texas."
+
+
+def test_mid_line_marker_does_not_end_the_previous_section():
+    parsed = parse_description("* WHAT...A * WHERE...B\n* IMPACTS...C")
+    assert parsed.what == "A * WHERE...B"
+    assert parsed.where == "B"
+    assert parsed.impacts == "C"
+
+
+def test_plain_bullet_ends_the_previous_section():
+    parsed = parse_description("* WHAT...Snow.\n* Note that this is a bullet.\n* WHERE...x")
+    assert parsed.what == "Snow."
+    assert parsed.where == "x"
+
+
+def test_additional_details_and_empty_input():
+    assert parse_description("* ADDITIONAL DETAILS...Stay inside.").additional_details == "Stay inside."
+    assert parse_description("") is EMPTY_DESCRIPTION
+    assert parse_description("No bullets here.") is EMPTY_DESCRIPTION
@@ -0,0 +1,97 @@
+"""Tests for the lifecycle of generated audio files."""
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from ha_easgen import file_manager  # noqa: E402
+from ha_easgen.file_manager import AudioFileManager  # noqa: E402
+
+NOW = datetime(2025, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class Store:
+    """In-memory stand-in for Home Assistant's Store."""
+
+    def __init__(self, hass, version, key):
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.data = data_func()
+
+
+class Hass:
+    def async_add_executor_job(self, func, *args):
+        return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [NOW]
+    monkeypatch.setattr(file_manager, "Store", Store)
+    monkeypatch.setattr(file_manager.dt_util, "utcnow", lambda: now[0])
+    return now
+
+
+def write(directory, name, size):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as file:
+        file.write(b"\0" * size)
+    return path
+
+
+def test_quota_evicts_oldest_files_first(tmp_path, clock):
+    manager = AudioFileManager(Hass(), str(tmp_path), max_bytes=25)
+    names = [f"ZCZC-WXR-TOR-04811{n}+0044-1211530-Complete.mp3" for n in range(3)]
+
+    async def run():
+        for name in names:
+            await manager.async_track(write(str(tmp_path), name, 10), 10)
+            clock[0] += timedelta(seconds=1)
+
+    asyncio.run(run())
+    assert sorted(os.listdir(tmp_path)) == names[1:]
+    assert not manager.is_tracked(names[0]) and manager.is_tracked(names[2])
+    assert manager.size == 20
+
+
+def test_expired_files_are_purged(tmp_path, clock):
+    manager = AudioFileManager(Hass(), str(tmp_path))
+    name = "ZCZC-WXR-TOR-048113+0044-1211530-Complete.mp3"
+
+    async def run():
+        await manager.async_track(write(str(tmp_path), name, 10), 10, NOW + timedelta(minutes=44))
+        clock[0] += timedelta(minutes=43)
+        kept = await manager.async_purge_expired()
+        clock[0] += timedelta(minutes=1)
+        return kept, await manager.async_purge_expired()
+
+    assert asyncio.run(run()) == (0, 1)
+    assert os.listdir(tmp_path) == [] and manager.size == 0
+
+
+def test_orphans_are_removed_and_missing_files_forgotten(tmp_path, clock):
+    manager = AudioFileManager(Hass(), str(tmp_path))
+    tracked = "ZCZC-WXR-TOR-048113+0044-1211530-Complete.mp3"
+    missing = "ZCZC-WXR-FFA-048113+0600-1211530-Complete.mp3"
+    orphans = ["ZCZC-WXR-TOR-048113+0044-1211530-Header.wav", "ZCZC-WXR-TOR-048113+0044-1211530-EndofMessage.wav"]
+
+    async def run():
+        await manager.async_track(write(str(tmp_path), tracked, 10), 10)
+        await manager.async_track(write(str(tmp_path), missing, 10), 10)
+        os.remove(os.path.join(str(tmp_path), missing))
+        for name in orphans:
+            write(str(tmp_path), name, 5)
+        # Files this integration did not write are left alone
+        write(str(tmp_path), "doorbell.mp3", 5)
+        return await manager.async_cleanup_orphans()
+
+    assert asyncio.run(run()) == 2
+    assert sorted(os.listdir(tmp_path)) == sorted([tracked, "doorbell.mp3"])
+    assert not manager.is_tracked(missing) and manager.size == 10
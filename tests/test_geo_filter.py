@@ -0,0 +1,73 @@
+"""Tests for the home location polygon filter."""
+import pytest
+
+from ha_easgen.geo_filter import AlertArea, HomeLocationFilter
+
+SQUARE = [[-97.0, 32.0], [-96.0, 32.0], [-96.0, 33.0], [-97.0, 33.0], [-97.0, 32.0]]
+HOLE = [[-96.6, 32.4], [-96.4, 32.4], [-96.4, 32.6], [-96.6, 32.6], [-96.6, 32.4]]
+
+
+def feature(alert_id, geometry, sent="2025-05-01T15:30:00-05:00"):
+    return {"geometry": geometry, "properties": {"id": alert_id, "sent": sent}}
+
+
+def shifted(ring, lon):
+    return [[x + lon, y] for x, y in ring]
+
+
+@pytest.mark.parametrize("lon, lat, inside", [
+    (-96.8, 32.2, True),
+    (-96.5, 32.5, False),   # inside the hole
+    (-95.5, 32.5, False),   # outside the bounding box
+    (-96.9, 32.95, True),
+])
+def test_polygon_with_hole(lon, lat, inside):
+    area = AlertArea.from_geometry({"type": "Polygon", "coordinates": [SQUARE, HOLE]})
+    assert area.contains(lon, lat) is inside
+
+
+def test_point_in_bounding_box_but_outside_triangle():
+    triangle = [[-97.0, 32.0], [-96.0, 32.0], [-97.0, 33.0], [-97.0, 32.0]]
+    area = AlertArea.from_geometry({"type": "Polygon", "coordinates": [triangle]})
+    assert area.contains(-96.9, 32.1)
+    assert not area.contains(-96.1, 32.9)
+
+
+def test_multipolygon_matches_any_part():
+    area = AlertArea.from_geometry({"type": "MultiPolygon", "coordinates": [[shifted(SQUARE, 5)], [SQUARE]]})
+    assert area.contains(-96.5, 32.2)
+    assert area.contains(-91.5, 32.2)
+    assert not area.contains(-94.0, 32.2)
+
+
+def test_non_polygon_geometry_has_no_area():
+    assert AlertArea.from_geometry(None) is None
+    assert AlertArea.from_geometry({"type": "Point", "coordinates": [-96.5, 32.5]}) is None
+
+
+def test_filter_keeps_alerts_without_polygon_and_drops_misses():
+    home = HomeLocationFilter(latitude=32.2, longitude=-96.8)
+    kept = home.filter([
+        feature("hit", {"type": "Polygon", "coordinates": [SQUARE]}),
+        feature("miss", {"type": "Polygon", "coordinates": [shifted(SQUARE, 3)]}),
+        feature("zone", None),
+        feature("malformed", {"type": "Polygon", "coordinates": [[1, 2]]}),
+    ])
+    assert [item["properties"]["id"] for item in kept] == ["hit", "zone", "malformed"]
+
+
+def test_filter_caches_per_revision_and_prunes(monkeypatch):
+    home = HomeLocationFilter(latitude=32.2, longitude=-96.8)
+    calls = []
+    original = home._applies
+    monkeypatch.setattr(home, "_applies", lambda item: calls.append(item) or original(item))
+
+    alert = feature("a", {"type": "Polygon", "coordinates": [SQUARE]})
+    home.filter([alert])
+    home.filter([alert])
+    assert len(calls) == 1
+
+    # A new revision is tested again; alerts that left the feed are forgotten
+    home.filter([feature("a", {"type": "Polygon", "coordinates": [shifted(SQUARE, 3)]}, sent="later")])
+    assert len(calls) == 2
+    assert list(home._results) == [("a", "later")]
@@ -0,0 +1,121 @@
+"""Tests for SAME header compilation."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ha_easgen.alert import Alert
+from ha_easgen.header_compiler import (
+    MAX_FILE_STEM_LENGTH, MAX_LOCATION_CODES, NO_TITLE, HeaderCompiler, calculate_purge_time,
+)
+
+
+class Registry:
+    """Minimal stand-in for the SAME/FIPS registry the compiler is bound to."""
+
+    def get_event_code(self, event):
+        return {"Tornado Warning": "TOR", "Flood Watch": "FFA"}.get(event)
+
+    def get_state_code(self, state):
+        return {"TX": "48", "OK": "40"}[state]
+
+
+def make_alert(**properties):
+    defaults = {
+        "id": "urn:oid:1",
+        "event": "Tornado Warning",
+        "severity": "Extreme",
+        "headline": "Tornado Warning issued May 1 by NWS Fort Worth TX",
+        "onset": "2025-05-01T15:30:00-05:00",
+        "expires": "2025-05-01T16:15:00-05:00",
+    }
+    defaults.update(properties)
+    return Alert.from_properties(defaults, properties.pop("zoneid", "TXZ103,TXC113"))
+
+
+def compile_one(alert, **options):
+    records = HeaderCompiler(Registry(), "WXR", "KF5NTR", **options).compile([alert])
+    assert len(records) == 1
+    return records[0]
+
+
+# Under an hour the duration is floored to four minute steps, as the original engine did
+@pytest.mark.parametrize("minutes, expected", [
+    (10, "0008"),
+    (15, "0012"),
+    (44, "0044"),
+    (60, "0100"),
+    (95, "0130"),
+    (6000, "9930"),
+])
+def test_calculate_purge_time(minutes, expected):
+    assert calculate_purge_time(minutes) == expected
+
+
+def test_compiles_full_header():
+    record = compile_one(make_alert())
+    # The issue time is written in the alert's own offset
+    assert record.min_header == "ZCZC-WXR-TOR-048113+0044-1211530"
+    assert record.full_header == record.min_header + "-KF5NTR-"
+    assert record.spoken_title == "Tornado Warning issued May 1"
+    assert record.file_stem == record.min_header
+
+
+def test_skips_unknown_events_and_severities():
+    compiler = HeaderCompiler(Registry(), "WXR", "KF5NTR")
+    alerts = [make_alert(event="Unknown Event"), make_alert(severity="Unknown"), make_alert(onset=None, effective=None, sent=None)]
+    assert compiler.compile(alerts) == []
+
+
+def test_carries_every_same_code_and_adds_configured_county():
+    record = compile_one(make_alert(geocode={"SAME": ["048439", "048121", "048439"]}))
+    assert record.locations == ("048113", "048439", "048121")
+
+
+def test_zone_only_feed_does_not_add_placeholder_county():
+    record = compile_one(make_alert(zoneid="TXZ103", geocode={"SAME": ["048439"]}))
+    assert record.locations == ("048439",)
+
+
+def test_configured_county_is_moved_first():
+    record = compile_one(make_alert(geocode={"SAME": ["048439", "048113", "048121"]}))
+    assert record.locations == ("048113", "048439", "048121")
+
+
+def test_configured_county_survives_the_cap():
+    codes = [f"048{n:03d}" for n in range(200, 240)]
+    codes[38] = "048113"
+    record = compile_one(make_alert(geocode={"SAME": codes}))
+    assert len(record.locations) == MAX_LOCATION_CODES
+    assert record.locations[0] == "048113"
+    assert record.locations[1:] == tuple(codes[:MAX_LOCATION_CODES - 1])
+
+
+def test_location_codes_are_capped_and_long_stems_hashed():
+    codes = [f"048{n:03d}" for n in range(1, 60)]
+    record = compile_one(make_alert(zoneid="TXZ103", geocode={"SAME": codes}))
+    assert len(record.locations) == MAX_LOCATION_CODES
+    assert len(record.file_stem) <= MAX_FILE_STEM_LENGTH
+    assert record.file_stem.endswith("+0044-1211530")
+    assert "31LOC" in record.file_stem
+
+
+def test_missing_headline_uses_placeholder_title():
+    assert compile_one(make_alert(headline=None)).spoken_title == NO_TITLE
+
+
+def test_include_description_appends_what_section():
+    alert = make_alert(description="* WHAT...Tornado sighted.\n* WHERE...Dallas.")
+    record = compile_one(alert, include_description=True)
+    assert record.spoken_title.endswith(". Tornado sighted.")
+
+
+def test_expires_is_taken_from_the_alert_offset():
+    record = compile_one(make_alert())
+    # Header issued at 15:30 -05:00 with a 44 minute purge time, whatever Home Assistant's zone is
+    assert record.expires == datetime(2025, 5, 1, 21, 14, tzinfo=timezone.utc)
+    assert record.expires.utcoffset() == timedelta(hours=-5)
+
+
+def test_expires_is_unknown_for_naive_times():
+    record = compile_one(make_alert(onset="2025-05-01T15:30:00", expires="2025-05-01T16:15:00"))
+    assert record.expires is None
@@ -0,0 +1,115 @@
+"""Tests for the CAP push sources."""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiohttp")
+
+from ha_easgen import ingest  # noqa: E402
+
+CAP_ALERT = """<?xml version="1.0" encoding="UTF-8"?>
+<alert xmlns="urn:oasis:names:tc:emergency:cap:1.2">
+  <identifier>urn:oid:1</identifier>
+  <sent>2025-05-01T15:30:00-05:00</sent>
+  <msgType>Alert</msgType>
+  <info>
+    <event>Tornado Warning</event>
+    <severity>Extreme</severity>
+    <expires>2025-05-01T16:15:00-05:00</expires>
+    <description>* WHAT...Tornado.</description>
+    <area><areaDesc>Dallas, TX</areaDesc></area>
+  </info>
+</alert>
+"""
+
+
+class Response:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.content = self
+
+    def raise_for_status(self):
+        pass
+
+    async def iter_any(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class Fetcher:
+    """Stand-in for the shared fetcher that serves one connection per call to get."""
+
+    def __init__(self, *connections):
+        self.connections = list(connections)
+        self.pushed = []
+        self.session = self
+
+    def get(self, url, timeout=None):
+        return Response(self.connections.pop(0))
+
+    async def async_push(self, name, features):
+        self.pushed.append([feature["properties"] for feature in features])
+
+    def remove_source(self, name):
+        pass
+
+
+class Config:
+    def __init__(self, config_dir):
+        self.config_dir = config_dir
+
+
+class Hass:
+    def __init__(self, config_dir="/config"):
+        self.config = Config(config_dir)
+
+
+def run_stream(monkeypatch, *connections):
+    """Run the stream source over the given connections, stopping once they are used up."""
+    fetcher = Fetcher(*connections)
+    monkeypatch.setattr(ingest, "get_alerts_fetcher", lambda hass: fetcher)
+    monkeypatch.setattr(ingest.dt_util, "utcnow", lambda: ingest.parse_datetime("2025-05-01T15:45:00-05:00"))
+
+    async def sleep(delay):
+        if not fetcher.connections:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(ingest.asyncio, "sleep", sleep)
+    source = ingest.StreamAlertSource(Hass(), "http://localhost/cap")
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(source._async_run())
+    return fetcher
+
+
+def test_multibyte_characters_split_across_chunks(monkeypatch):
+    data = CAP_ALERT.replace("Tornado.", "Tornado in Cañon.").encode("utf-8")
+    split = data.index("ñ".encode("utf-8")) + 1
+    fetcher = run_stream(monkeypatch, [data[:split], data[split:]])
+    [[properties]] = fetcher.pushed
+    assert properties["description"] == "* WHAT...Tornado in Cañon."
+
+
+def test_runaway_buffer_reconnects(monkeypatch, caplog):
+    monkeypatch.setattr(ingest, "CAP_STREAM_MAX_BUFFER", 100)
+    fetcher = run_stream(monkeypatch, [b"<alert>" + b"x" * 200, CAP_ALERT.encode("utf-8")], [CAP_ALERT.encode("utf-8")])
+    # The first connection is dropped before its second chunk; the next one delivers the alert
+    assert [[properties["id"] for properties in push] for push in fetcher.pushed] == [["urn:oid:1"]]
+    assert "without a complete alert" in caplog.text
+
+
+@pytest.mark.parametrize("path, inside", [
+    ("/config/cap", True),
+    ("/config", True),
+    ("/config-other/cap", False),
+    ("/media/cap", False),
+])
+def test_in_config_dir(path, inside):
+    assert ingest._in_config_dir(Hass(), os.path.abspath(path)) is inside
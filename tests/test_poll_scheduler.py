@@ -0,0 +1,69 @@
+"""Tests for the adaptive poll interval."""
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from ha_easgen import poll_scheduler  # noqa: E402
+from ha_easgen.const import (  # noqa: E402
+    POLL_BACKOFF_MAX, POLL_INTERVAL_ACTIVE, POLL_INTERVAL_IDLE, POLL_INTERVAL_URGENT,
+)
+
+
+class Sensor:
+    def __init__(self, alerts):
+        self.alerts = alerts
+
+
+class Fetcher:
+    def __init__(self, alerts=(), status=200, error=None, retry_after=None):
+        self.owners = [Sensor(list(alerts))]
+        self.status = status
+        self.error = error
+        self.retry_after = retry_after
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(poll_scheduler.random, "uniform", lambda low, high: 1.0)
+
+
+def interval(fetcher, failures=0):
+    scheduler = poll_scheduler.AlertPollScheduler(None, fetcher)
+    scheduler.failures = failures
+    return scheduler.next_interval(), scheduler.failures
+
+
+@pytest.mark.parametrize("alerts, expected", [
+    ([], POLL_INTERVAL_IDLE),
+    ([{"severity": "Minor", "urgency": "Expected"}], POLL_INTERVAL_ACTIVE),
+    ([{"severity": "Extreme", "urgency": "Expected"}], POLL_INTERVAL_URGENT),
+    ([{"severity": "Minor", "urgency": "Immediate"}], POLL_INTERVAL_URGENT),
+])
+def test_interval_follows_alert_severity(alerts, expected):
+    assert interval(Fetcher(alerts)) == (expected, 0)
+
+
+@pytest.mark.parametrize("fetcher", [
+    Fetcher(status=429),
+    Fetcher(status=503),
+    Fetcher(status=None, error=TimeoutError()),
+])
+def test_failures_back_off_exponentially(fetcher):
+    assert interval(fetcher) == (POLL_INTERVAL_ACTIVE * 2, 1)
+    assert interval(fetcher, failures=1) == (POLL_INTERVAL_ACTIVE * 4, 2)
+    assert interval(fetcher, failures=10) == (POLL_BACKOFF_MAX, 11)
+
+
+def test_retry_after_is_honoured_up_to_the_ceiling():
+    assert interval(Fetcher(status=429, retry_after=300)) == (300, 1)
+    assert interval(Fetcher(status=429, retry_after=10_000)) == (POLL_BACKOFF_MAX, 1)
+
+
+def test_success_resets_failures():
+    assert interval(Fetcher(), failures=5) == (POLL_INTERVAL_IDLE, 0)
+
+
+def test_jitter_stays_within_bounds(monkeypatch):
+    monkeypatch.setattr(poll_scheduler.random, "uniform", lambda low, high: high)
+    value, _ = interval(Fetcher())
+    assert value == pytest.approx(POLL_INTERVAL_IDLE * (1 + poll_scheduler.POLL_JITTER))
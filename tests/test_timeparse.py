@@ -0,0 +1,42 @@
+"""Tests for alert timestamp parsing."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ha_easgen.timeparse import AlertTimeCache, parse_datetime
+
+
+@pytest.mark.parametrize("value", [None, "", "null", "None", "not a time"])
+def test_missing_or_invalid_values_are_none(value):
+    assert parse_datetime(value) is None
+
+
+def test_iso_timestamps_keep_their_offset():
+    parsed = parse_datetime("2025-05-01T15:30:00-05:00")
+    assert parsed == datetime(2025, 5, 1, 20, 30, tzinfo=timezone.utc)
+    assert parsed.utcoffset() == timedelta(hours=-5)
+
+
+def test_dateutil_fallback_and_datetime_passthrough():
+    assert parse_datetime("May 1 2025 3:30 PM") == datetime(2025, 5, 1, 15, 30)
+    now = datetime.now(timezone.utc)
+    assert parse_datetime(now) is now
+
+
+def test_begin_and_end_fall_back_in_order():
+    cache = AlertTimeCache()
+    begin, end = cache.get({"id": "a", "onset": "null", "effective": "2025-05-01T15:00:00+00:00",
+                            "expires": "2025-05-01T16:00:00+00:00"})
+    assert begin == datetime(2025, 5, 1, 15, 0, tzinfo=timezone.utc)
+    assert end == datetime(2025, 5, 1, 16, 0, tzinfo=timezone.utc)
+
+
+def test_cache_reparses_when_times_change_and_stays_bounded():
+    cache = AlertTimeCache(max_entries=2)
+    first = cache.get({"id": "a", "onset": "2025-05-01T15:00:00+00:00"})
+    assert cache.get({"id": "a", "onset": "2025-05-01T15:00:00+00:00"})[0] is first[0]
+    assert cache.get({"id": "a", "onset": "2025-05-01T16:00:00+00:00"})[0].hour == 16
+
+    for alert_id in ("b", "c"):
+        cache.get({"id": alert_id, "onset": "2025-05-01T15:00:00+00:00"})
+    assert "a" not in cache._entries
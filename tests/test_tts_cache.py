@@ -0,0 +1,105 @@
+"""Tests for the persistent TTS phrase cache."""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from ha_easgen import tts_cache  # noqa: E402
+from ha_easgen.tts_cache import TTSPhraseCache, make_key  # noqa: E402
+
+
+class Store:
+    """In-memory stand-in for Home Assistant's Store."""
+
+    def __init__(self, hass, version, key):
+        self.saved = None
+
+    async def async_load(self):
+        return None
+
+    def async_delay_save(self, data_func, delay):
+        self.saved = data_func()
+
+
+class Config:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, *parts):
+        return os.path.join(self.directory, *parts)
+
+
+class Hass:
+    def __init__(self, directory):
+        self.config = Config(directory)
+        self.data = {}
+
+    def async_add_executor_job(self, func, *args):
+        return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+@pytest.fixture
+def make_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(tts_cache, "Store", Store)
+
+    async def make(max_bytes=1024):
+        cache = TTSPhraseCache(Hass(str(tmp_path)), max_bytes=max_bytes)
+        await cache.async_load()
+        return cache
+
+    return make
+
+
+def test_hit_after_put_ignores_whitespace(make_cache):
+    async def run():
+        cache = await make_cache()
+        await cache.async_put("tts.test", "en-US", "voice", "Tornado  warning", b"audio")
+        return cache, await cache.async_get("tts.test", "en-US", "voice", "Tornado warning")
+
+    cache, data = asyncio.run(run())
+    assert data == b"audio"
+    assert cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_phrase_is_evicted(make_cache):
+    async def run():
+        cache = await make_cache(max_bytes=10)
+        await cache.async_put("tts.test", "en-US", "voice", "a", b"aaaa")
+        await cache.async_put("tts.test", "en-US", "voice", "b", b"bbbb")
+        await cache.async_get("tts.test", "en-US", "voice", "a")
+        await cache.async_put("tts.test", "en-US", "voice", "c", b"cccc")
+        return cache, [await cache.async_get("tts.test", "en-US", "voice", text) for text in "abc"]
+
+    cache, data = asyncio.run(run())
+    assert data == [b"aaaa", None, b"cccc"]
+    assert cache.size == 8 and cache.stats()["evictions"] == 1
+    assert not os.path.exists(os.path.join(cache.directory, make_key("tts.test", "en-US", "voice", "b") + ".mp3"))
+
+
+def test_unreadable_entry_is_dropped(make_cache):
+    async def run():
+        cache = await make_cache()
+        await cache.async_put("tts.test", "en-US", "voice", "a", b"aaaa")
+        os.remove(os.path.join(cache.directory, make_key("tts.test", "en-US", "voice", "a") + ".mp3"))
+        return cache, await cache.async_get("tts.test", "en-US", "voice", "a")
+
+    cache, data = asyncio.run(run())
+    assert data is None
+    assert cache.stats()["entries"] == 0 and cache.size == 0
+
+
+def test_corrupt_entry_is_removed_with_its_file(make_cache):
+    async def run():
+        cache = await make_cache()
+        await cache.async_put("tts.test", "en-US", "voice", "a", b"not audio")
+        # The engine calls async_remove when cached bytes fail to decode
+        await cache.async_remove("tts.test", "en-US", "voice", "a")
+        await asyncio.sleep(0.05)
+        return cache
+
+    cache = asyncio.run(run())
+    assert cache.stats()["entries"] == 0
+    assert os.listdir(cache.directory) == []
+    assert cache._store.saved == {"entries": {}}
@@ -0,0 +1,76 @@
+"""Tests for rendering alerts once in the EAS Gen TTS engine."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pydub")
+
+from ha_easgen import eas_gen_tts_engine  # noqa: E402
+from ha_easgen.eas_gen_tts_engine import EASGenTTSEngine, RenderResult  # noqa: E402
+
+
+class FileManager:
+    """Stand-in for the audio file manager that tracks every rendered file."""
+
+    def __init__(self):
+        self.tracked = set()
+
+    def is_tracked(self, filename):
+        return filename in self.tracked
+
+
+@pytest.fixture
+def files(monkeypatch):
+    manager = FileManager()
+
+    async def get_file_manager(hass):
+        return manager
+
+    monkeypatch.setattr(eas_gen_tts_engine, "async_get_file_manager", get_file_manager)
+    return manager
+
+
+def make_engine(files, calls, delay=0):
+    engine = EASGenTTSEngine(None, None, "tts.test", "WXR", "KF5NTR", "voice", "en-US")
+
+    async def render(alert):
+        calls.append(alert["id"])
+        await asyncio.sleep(delay)
+        filename = f"{alert['id']}-Complete.mp3"
+        files.tracked.add(filename)
+        return RenderResult(alert["id"], f"/local/{filename}", f"/config/www/{filename}", 1, 1.0, "hash")
+
+    engine._render = render
+    return engine
+
+
+def test_concurrent_callers_share_one_render(files):
+    calls = []
+    engine = make_engine(files, calls, delay=0.01)
+
+    async def run():
+        return await asyncio.gather(*(engine.render({"id": "a"}) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert calls == ["a"]
+    assert all(result is results[0] for result in results)
+    assert engine._pending_renders == {}
+
+
+def test_cached_render_is_reused_while_its_file_exists(files):
+    calls = []
+    engine = make_engine(files, calls)
+
+    async def run():
+        first = await engine.render({"id": "a"})
+        second = await engine.render({"id": "a"})
+        files.tracked.clear()
+        third = await engine.render({"id": "a"})
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert second is first
+    # Once the file manager deleted the audio file the alert is rendered again
+    assert third is not first
+    assert calls == ["a", "a"]